@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+"""Auteurs: noms normalisés et graphe des co-auteurs
+
+Un nom est ramené à une clé (minuscules, sans accents ni ponctuation:
+"José García" et "jose GARCIA" ont la même clé), indexée dans
+`authors` avec le nom de famille (dernier mot de la clé). Les pages
+d'auteur sont des lectures d'index sur la clé, et "Li" ne désigne plus
+que les auteurs dont c'est le nom, pas "Lisa" ni "Liu".
+
+Le graphe des co-auteurs est tenu en mémoire sous forme compacte (CSR):
+pour chaque article la suite de ses auteurs, pour chaque auteur la suite
+de ses articles, dans des tableaux `array` d'entiers et leurs décalages,
+construits en une lecture de article_authors.
+Les voisins d'un auteur et ses collaborateurs à deux pas se calculent en
+parcourant ces tableaux, sans requête. find_author résout un nom saisi
+pour les commandes `author` et `coauthors` du collecteur et de la vue
+tableau.
+"""
+
+from array import array
+from collections import Counter
+
+from arxiv_search import index_terms
+
+
+def author_key(name):
+    """Clé normalisée d'un nom d'auteur ('' s'il n'a ni lettre ni chiffre)"""
+    return ' '.join(index_terms(name or ''))
+
+
+def surname_key(key):
+    """Nom de famille d'une clé d'auteur (son dernier mot)"""
+    return key.rsplit(' ', 1)[-1]
+
+
+class CoauthorGraph:
+    """Graphe des co-auteurs (CSR), un nœud par auteur (id de `authors`)
+    
+    `paper_offsets`/`paper_authors`: auteurs de chaque article, rangés bout
+    à bout; `author_offsets`/`author_papers`: articles (numéros) de chaque
+    auteur. Les articles ne sont pas nommés: seuls comptent les auteurs
+    partagés.
+    """
+    
+    def __init__(self, paper_offsets, paper_authors, papers):
+        self.paper_offsets = paper_offsets
+        self.paper_authors = paper_authors
+        
+        # Transposition: liens triés par auteur (tri stable, les articles
+        # de chaque auteur restent dans l'ordre), décalages par comptage
+        order = sorted(range(len(paper_authors)), key=paper_authors.__getitem__)
+        self.author_papers = array('i', [papers[link] for link in order])
+        size = max(paper_authors, default=-1) + 2
+        offsets = array('q', bytes(8 * size))
+        for node in paper_authors:
+            offsets[node + 1] += 1
+        for node in range(1, size):
+            offsets[node] += offsets[node - 1]
+        self.author_offsets = offsets
+    
+    def papers_of(self, node):
+        """Numéros des articles d'un auteur"""
+        if node + 1 >= len(self.author_offsets):
+            return array('i')
+        return self.author_papers[self.author_offsets[node]:self.author_offsets[node + 1]]
+    
+    def neighbours(self, node):
+        """Co-auteurs d'un auteur: Counter {nœud: articles en commun}"""
+        paper_offsets, paper_authors = self.paper_offsets, self.paper_authors
+        weights = Counter()
+        for paper in self.papers_of(node):
+            weights.update(set(paper_authors[paper_offsets[paper]:paper_offsets[paper + 1]]))
+        del weights[node]
+        return weights
+    
+    def two_hop(self, node):
+        """Collaborateurs à deux pas (co-auteurs de co-auteurs, hors co-auteurs
+        directs): Counter {nœud: co-auteurs en commun}"""
+        direct = self.neighbours(node)
+        reached = Counter()
+        for neighbour in direct:
+            reached.update(self.neighbours(neighbour).keys())
+        for excluded in direct:
+            del reached[excluded]
+        del reached[node]
+        return reached
+
+
+def build_coauthor_graph(db):
+    """Graphe des co-auteurs de la base, en un parcours de article_authors
+    
+    Les variantes d'un nom (casse, accents, ponctuation) forment un seul
+    nœud, celui de la plus ancienne (plus petit id). Les liens sont lus au
+    fil du curseur, directement dans les tableaux du graphe.
+    """
+    aliases = dict(db.iter_author_aliases())
+    
+    # Liens dans l'ordre de la clé primaire (arxiv_id, position): les
+    # auteurs d'un article se suivent, la position 0 en ouvre un nouveau
+    paper_authors = array('i')
+    paper_offsets = array('q')
+    papers = array('i')
+    paper = -1
+    for author_id, position in db.iter_author_links():
+        if position == 0:
+            paper += 1
+            paper_offsets.append(len(paper_authors))
+        paper_authors.append(aliases.get(author_id, author_id))
+        papers.append(paper)
+    paper_offsets.append(len(paper_authors))
+    return CoauthorGraph(paper_offsets, paper_authors, papers)
+
+
+def find_author(db, name):
+    """Auteur désigné par `name` (AuthorMatch), ou None après avoir listé les candidats"""
+    matches = db.find_authors(name)
+    if len(matches) == 1:
+        return matches[0]
+    if not matches:
+        print(f"❌ Auteur {name} non trouvé")
+    else:
+        print(f"👥 Plusieurs auteurs correspondent à {name}, préciser le nom:")
+        for match in matches:
+            print(f"   {match.name} ({match.articles} articles)")
+    return None
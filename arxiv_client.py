@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+
+
+import random
+import threading
+import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+
+import requests
+import urllib3
+from requests.adapters import HTTPAdapter
+
+ARXIV_API_URL = "http://export.arxiv.org/api/query"
+
+# Réponses qui méritent un nouvel essai (surcharge ou indisponibilité passagère)
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+
+# Erreurs de lecture d'un corps en flux (`stream=True`), après les en-têtes:
+# connexion coupée, délai de lecture dépassé, corps tronqué. get() ne peut
+# pas les réessayer, l'appelant redemande la réponse
+STREAM_ERRORS = (urllib3.exceptions.HTTPError, requests.RequestException, OSError)
+
+
+class ArxivClientError(Exception):
+    """Échec définitif d'une requête arXiv (après tous les essais)"""
+
+class RateLimiter:
+    """Token bucket partagé par tous les workers qui interrogent arXiv"""
+    
+    def __init__(self, interval=3.0, burst=1):
+        # Un jeton toutes les `interval` secondes, au plus `burst` en réserve
+        self.interval = interval
+        self.capacity = burst
+        self.tokens = float(burst)
+        self.last_refill = time.monotonic()
+        self.lock = threading.Lock()
+    
+    def acquire(self):
+        """Bloque jusqu'à ce qu'un créneau de requête soit disponible"""
+        while True:
+            with self.lock:
+                now = time.monotonic()
+                if self.interval > 0:
+                    self.tokens = min(self.capacity, self.tokens + (now - self.last_refill) / self.interval)
+                else:
+                    self.tokens = self.capacity
+                self.last_refill = now
+                
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                
+                wait = (1 - self.tokens) * self.interval
+            
+            time.sleep(wait)
+
+
+def parse_retry_after(value):
+    """Convertit un en-tête Retry-After (secondes ou date HTTP) en secondes"""
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=timezone.utc)
+    return max(0.0, (when - datetime.now(timezone.utc)).total_seconds())
+
+
+class ArxivClient:
+    """Client HTTP de l'API arXiv: connexions persistantes, gzip et nouveaux essais"""
+    
+    def __init__(self, base_url=ARXIV_API_URL, rate_limiter=None, timeout=(10, 60),
+                 max_retries=5, backoff=3.0, max_backoff=300.0, pool_size=8):
+        self.base_url = base_url
+        self.rate_limiter = rate_limiter or RateLimiter()
+        self.timeout = timeout
+        self.max_retries = max_retries
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        
+        # Une seule session: keep-alive et pool partagé par tous les workers
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=2, pool_maxsize=pool_size)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+        self.session.headers.update({
+            'Accept-Encoding': 'gzip, deflate',
+            'User-Agent': 'arxiv-collector (+https://github.com/yassineaitmohamed/arxiv-collector)'
+        })
+    
+    def backoff_delay(self, attempt, retry_after=None):
+        """Délai avant le prochain essai: exponentiel avec jitter, au moins Retry-After"""
+        delay = min(self.max_backoff, self.backoff * (2 ** attempt))
+        delay = random.uniform(delay / 2, delay)
+        if retry_after is not None:
+            delay = max(delay, min(retry_after, self.max_backoff))
+        return delay
+    
+    def query(self, params, stream=False):
+        """Interroge l'API de recherche arXiv"""
+        return self.get(self.base_url, params, stream)
+    
+    def get(self, url, params=None, stream=False, accept=(200,)):
+        """GET avec limiteur de débit et nouveaux essais sur les erreurs passagères
+        
+        Avec `stream=True`, le corps n'est pas lu: l'appelant consomme
+        `response.raw` puis ferme la réponse. Les réponses dont le statut est
+        dans `accept` sont rendues à l'appelant, qui en lit le corps.
+        """
+        for attempt in range(self.max_retries + 1):
+            self.rate_limiter.acquire()
+            retry_after = None
+            
+            try:
+                response = self.session.get(url, params=params, timeout=self.timeout, stream=stream)
+            except (requests.ConnectionError, requests.Timeout) as e:
+                error = e
+            else:
+                if response.status_code in accept:
+                    return response
+                
+                error = f"HTTP {response.status_code}"
+                response.close()
+                if response.status_code not in RETRY_STATUSES:
+                    raise ArxivClientError(error)
+                retry_after = parse_retry_after(response.headers.get('Retry-After'))
+            
+            if attempt == self.max_retries:
+                raise ArxivClientError(f"{error} (après {self.max_retries + 1} essais)")
+            
+            delay = self.backoff_delay(attempt, retry_after)
+            print(f"   ⏳ {error}, nouvel essai dans {delay:.0f}s ({attempt + 1}/{self.max_retries})")
+            time.sleep(delay)
+    
+    def close(self):
+        """Ferme les connexions du pool"""
+        self.session.close()
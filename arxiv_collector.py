@@ -1,221 +1,535 @@
 #!/usr/bin/env python3
 
 
-import sqlite3
-import requests
 import xml.etree.ElementTree as ET
-from datetime import datetime, timedelta
-import time
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+import io
+import queue
+import threading
 import os
 import sys
 
+from arxiv_authors import build_coauthor_graph, find_author
+from arxiv_client import ARXIV_API_URL, STREAM_ERRORS, ArxivClient, ArxivClientError, RateLimiter
+from arxiv_columnar import DEFAULT_COLUMNAR_PATH, export_columnar
+from arxiv_db import ARTICLE_COLUMNS, ArxivDatabase, split_arxiv_id
+from arxiv_dedup import DUPLICATE_SIMILARITY
+from arxiv_oai import OAI_URL, OaiError, OaiHarvester, oai_set
+from arxiv_search import fts_query
+
+# Catégories suivies par défaut
+DEFAULT_CATEGORIES = ('math.DG', 'math.SG', 'math-ph', 'math.AG', 'math.QA', 'math.RT')
+
+# Fenêtre de la première mise à jour incrémentale (aucun watermark connu)
+DEFAULT_DAYS_BACK = 2
+
+# Alertes affichées par `alerts`: celles des X derniers jours; articles
+# listés par abonnement à la fin d'une mise à jour
+DEFAULT_ALERT_DAYS = 7
+ALERT_DIGEST_LINES = 10
+
+# Une page de résultats: articles reçus, position, position de la page
+# suivante (None pour un lot intermédiaire de la page) et taille du résultat
+Page = namedtuple('Page', ['articles', 'start', 'next_start', 'total'])
+
+# Balises du flux Atom, qualifiées par leur namespace une fois pour toutes
+ATOM_NS = '{http://www.w3.org/2005/Atom}'
+ARXIV_NS = '{http://arxiv.org/schemas/atom}'
+ENTRY_TAG = ATOM_NS + 'entry'
+ID_TAG = ATOM_NS + 'id'
+TITLE_TAG = ATOM_NS + 'title'
+SUMMARY_TAG = ATOM_NS + 'summary'
+AUTHOR_TAG = ATOM_NS + 'author'
+NAME_TAG = ATOM_NS + 'name'
+PUBLISHED_TAG = ATOM_NS + 'published'
+UPDATED_TAG = ATOM_NS + 'updated'
+CATEGORY_TAG = ATOM_NS + 'category'
+PRIMARY_CATEGORY_TAG = ARXIV_NS + 'primary_category'
+TOTAL_RESULTS_TAG = '{http://a9.com/-/spec/opensearch/1.1/}totalResults'
+
+# Point de reprise d'une fenêtre de collecte, écrit avec la page sauvegardée
+Checkpoint = namedtuple('Checkpoint', ['task', 'window_start', 'window_end', 'next_start',
+                                       'total', 'done', 'resumption_token'],
+                        defaults=[None])
+
+# Nombre d'articles transmis par lot pendant le parse d'une page
+PARSE_CHUNK_SIZE = 100
+
+# Nouvelles demandes d'une page reçue vide alors que le total annoncé va
+# au-delà (réponse tronquée d'arXiv) avant d'abandonner la tâche
+EMPTY_PAGE_RETRIES = 3
+
+# Nouvelles demandes d'une page dont la lecture a échoué (connexion coupée,
+# délai dépassé, XML tronqué) avant d'abandonner la tâche
+PAGE_READ_RETRIES = 3
+PAGE_READ_ERRORS = STREAM_ERRORS + (ET.ParseError,)
+
+def parse_atom_date(text):
+    """Date Atom ('2024-01-31T18:59:59Z') en datetime UTC"""
+    if text[-1:] == 'Z':
+        text = text[:-1] + '+00:00'
+    return datetime.fromisoformat(text)
+
+
 class ArxivCollector:
-    def __init__(self, db_path="arxiv_collection.db"):
+    def __init__(self, db_path="arxiv_collection.db", workers=4, request_interval=3.0,
+                 base_url=ARXIV_API_URL, oai_url=OAI_URL):
         self.db_path = db_path
-        self.base_url = "http://export.arxiv.org/api/query"
+        self.db = ArxivDatabase(db_path)
+        self.workers = workers
+        # Un seul client et un seul limiteur pour tous les workers (3 secondes entre requêtes)
+        self.client = ArxivClient(base_url, rate_limiter=RateLimiter(interval=request_interval))
+        self.oai = OaiHarvester(self.client, oai_url)
         self.init_database()
     
     def init_database(self):
         """Initialise la base de données SQLite"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
-        cursor.execute('''
-            CREATE TABLE IF NOT EXISTS articles (
-                arxiv_id TEXT PRIMARY KEY,
-                title TEXT,
-                authors TEXT,
-                abstract TEXT,
-                category TEXT,
-                published DATE,
-                updated DATE,
-                link TEXT,
-                pdf_link TEXT,
-                last_fetched TIMESTAMP
-            )
-        ''')
-        
-        cursor.execute('''
-            CREATE TABLE IF NOT EXISTS fetch_log (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                category TEXT,
-                fetch_date TIMESTAMP,
-                articles_count INTEGER
-            )
-        ''')
-        
-        conn.commit()
-        conn.close()
-    
-    def fetch_arxiv_articles(self, categories, start_date, end_date, max_results=1000):
-        """Récupère les articles depuis arXiv API"""
-        all_articles = []
+        self.db.init_schema()
+    
+    def build_search_query(self, category, start_date=None, end_date=None):
+        """Construit la requête arXiv bornée par la fenêtre de dates (GMT)
         
-        for category in categories:
-            print(f"📥 Fetching {category}...", end=" ", flush=True)
-            
-            # Construction de la requête
-            search_query = f"cat:{category}"
+        `category` est une catégorie ou un tuple de catégories, interrogées
+        alors en une seule requête `cat:A OR cat:B ...`. Sans fenêtre, la
+        requête porte sur toute la catégorie.
+        """
+        if isinstance(category, str):
+            cat_query = f"cat:{category}"
+        else:
+            cat_query = "(" + " OR ".join(f"cat:{cat}" for cat in category) + ")"
+        if start_date is None or end_date is None:
+            return cat_query
+        date_from = self.to_utc(start_date).strftime('%Y%m%d%H%M')
+        date_to = self.to_utc(end_date).strftime('%Y%m%d%H%M')
+        return f"{cat_query} AND submittedDate:[{date_from} TO {date_to}]"
+    
+    def category_label(self, category):
+        """Libellé d'affichage d'une tâche (catégorie ou requête combinée)"""
+        return category if isinstance(category, str) else "+".join(category)
+    
+    def make_tasks(self, categories, start_date, end_date, combined=True):
+        """Tâches de collecte pour une fenêtre: une requête combinée ou une par catégorie"""
+        if combined and len(categories) > 1:
+            return [(tuple(categories), start_date, end_date)]
+        return [(category, start_date, end_date) for category in categories]
+    
+    def merge_cross_lists(self, articles, seen):
+        """Dédoublonne par arXiv id sur toute la collecte, en cumulant les catégories
+        
+        `seen` associe chaque id déjà reçu à ses catégories. Un doublon qui
+        n'apporte aucune catégorie nouvelle est ignoré; sinon il est renvoyé
+        avec l'union des catégories pour être réécrit. Générateur: les
+        articles passent un par un jusqu'à save_articles.
+        """
+        for article in articles:
+            known = seen.get(article['arxiv_id'])
+            if known is None:
+                seen[article['arxiv_id']] = list(article['categories'])
+            else:
+                new = [cat for cat in article['categories'] if cat not in known]
+                if not new:
+                    continue
+                known.extend(new)
+                article['categories'] = list(known)
+                article['category'] = self.main_category(article['primary_category'], known)
+            yield article
+    
+    def task_categories(self, category):
+        """Catégories couvertes par une tâche (catégorie seule ou requête combinée)"""
+        return (category,) if isinstance(category, str) else category
+    
+    def main_category(self, primary, categories):
+        """Catégorie principale: la catégorie primaire arXiv si elle est suivie"""
+        return primary if primary in categories else categories[0]
+    
+    def to_utc(self, date):
+        """Convertit une date naïve (supposée UTC) en date timezone-aware"""
+        if date.tzinfo is None:
+            return date.replace(tzinfo=timezone.utc)
+        return date.astimezone(timezone.utc)
+    
+    def fetch_category_pages(self, category, start_date, end_date, page_size=500, offset=0):
+        """Générateur: une Page par réponse reçue pour une catégorie, depuis `offset`
+        
+        Avec `end_date=None`, mode incrémental: les pages sont lues de la plus
+        récente mise à jour à la plus ancienne, et la lecture s'arrête dès
+        qu'on atteint des entrées antérieures au watermark `start_date`.
+        
+        Une page vide avant la fin annoncée (`start` < total) est redemandée
+        jusqu'à EMPTY_PAGE_RETRIES fois, puis ArxivClientError: la tâche
+        échoue sans qu'aucune page ne soit sautée (watermark et point de
+        reprise restent avant elle). Une page courte (moins de `page_size`
+        entrées) est suivie de la page qui commence juste après ses entrées:
+        la position avance du nombre d'entrées reçues, pas de `page_size`.
+        
+        Une page dont la lecture échoue après les en-têtes (PAGE_READ_ERRORS:
+        connexion coupée, délai dépassé, XML tronqué) est redemandée depuis
+        son début, jusqu'à PAGE_READ_RETRIES fois; ses lots déjà transmis le
+        sont à nouveau, sans effet (l'upsert saute les articles inchangés).
+        """
+        # La fenêtre de dates fait partie de la requête: arXiv ne renvoie
+        # que les articles à stocker, on parcourt les pages via `start`
+        incremental = end_date is None
+        search_query = self.build_search_query(category, None if incremental else start_date, end_date)
+        watermark = self.to_utc(start_date) if incremental else None
+        start = offset
+        total = None
+        empty_pages = 0
+        read_failures = 0
+        
+        while total is None or start < total:
             params = {
                 'search_query': search_query,
-                'start': 0,
-                'max_results': max_results,
-                'sortBy': 'submittedDate',
-                'sortOrder': 'descending'
+                'start': start,
+                'max_results': page_size,
+                'sortBy': 'lastUpdatedDate' if incremental else 'submittedDate',
+                'sortOrder': 'descending' if incremental else 'ascending'
             }
             
+            # Le client attend son créneau (espacement global) et réessaie
+            # les erreurs passagères avant d'abandonner la catégorie
+            response = self.client.query(params, stream=True)
+            
+            # Parse en flux: la page est transmise par petits lots, le dernier
+            # lot (éventuellement vide) porte la position de la page suivante
+            feed = {}
+            chunk = []
+            stale = False
             try:
-                response = requests.get(self.base_url, params=params)
-                if response.status_code == 200:
-                    articles = self.parse_arxiv_response(response.text, category, start_date, end_date)
-                    all_articles.extend(articles)
-                    print(f"✓ {len(articles)} articles")
+                response.raw.decode_content = True
+                if incremental:
+                    entries = self.iter_arxiv_entries(response.raw, category, feed=feed)
                 else:
-                    print(f"✗ Error {response.status_code}")
-                
-                # Respecter les limites de l'API arXiv (3 secondes entre requêtes)
-                time.sleep(3)
+                    entries = self.iter_arxiv_entries(response.raw, category, start_date, end_date, feed)
+                for article in entries:
+                    if incremental and article['updated'] < watermark:
+                        stale = True
+                        continue
+                    chunk.append(article)
+                    if len(chunk) >= PARSE_CHUNK_SIZE:
+                        yield Page(chunk, start, None, feed.get('total', 0))
+                        chunk = []
+            except PAGE_READ_ERRORS as e:
+                read_failures += 1
+                if read_failures > PAGE_READ_RETRIES:
+                    raise ArxivClientError(f"page {start}: lecture interrompue ({e}, après {read_failures} essais)")
+                print(f"   ⏳ page {start}: lecture interrompue ({e}), nouvel essai "
+                      f"({read_failures}/{PAGE_READ_RETRIES})")
+                continue
+            finally:
+                response.close()
+            
+            total = feed.get('total', 0)
+            if not feed.get('entries') and start < total:
+                empty_pages += 1
+                if empty_pages > EMPTY_PAGE_RETRIES:
+                    raise ArxivClientError(f"page {start}/{total} vide (après {empty_pages} essais)")
+                print(f"   ⏳ page {start}/{total} vide, nouvel essai ({empty_pages}/{EMPTY_PAGE_RETRIES})")
+                continue
+            empty_pages = read_failures = 0
+            next_start = start + feed.get('entries', 0)
+            yield Page(chunk, start, next_start, total)
             
+            if incremental and stale:
+                break  # Le reste est déjà connu
+            start = next_start
+    
+    def iter_fetch(self, tasks, page_size=500, failed=None, offsets=None):
+        """Exécute les tâches (catégorie, début, fin) en parallèle.
+        
+        Génère des tuples (tâche, Page) au fil des pages reçues, pour que
+        l'appelant parse et sauvegarde pendant que les workers attendent
+        leur prochain créneau de requête. Les tâches interrompues par une
+        erreur sont ajoutées à la liste `failed` si elle est fournie;
+        `offsets` donne la première page à demander pour chaque tâche.
+        """
+        results = queue.Queue(maxsize=self.workers * 2)
+        stop = threading.Event()
+        done = object()
+        
+        def put(item):
+            while not stop.is_set():
+                try:
+                    results.put(item, timeout=0.5)
+                    return
+                except queue.Full:
+                    pass
+        
+        def worker(task):
+            category, start_date, end_date = task
+            try:
+                offset = offsets.get(task, 0) if offsets else 0
+                for page in self.fetch_category_pages(category, start_date, end_date, page_size, offset):
+                    if stop.is_set():
+                        break
+                    put((task, page))
             except Exception as e:
-                print(f"✗ Error: {e}")
+                print(f"✗ {self.category_label(category)}: Error: {e}")
+                if failed is not None:
+                    failed.append(task)
+            finally:
+                put(done)
+        
+        executor = ThreadPoolExecutor(max_workers=max(1, min(self.workers, len(tasks))))
+        try:
+            for task in tasks:
+                executor.submit(worker, task)
+            
+            remaining = len(tasks)
+            while remaining:
+                item = results.get()
+                if item is done:
+                    remaining -= 1
+                else:
+                    yield item
+        finally:
+            stop.set()
+            executor.shutdown(wait=False, cancel_futures=True)
+    
+    def fetch_arxiv_articles(self, categories, start_date, end_date, page_size=500, combined=True):
+        """Récupère les articles depuis arXiv API, page par page dans la fenêtre de dates"""
+        all_articles = []
+        seen = {}
+        tasks = self.make_tasks(categories, start_date, end_date, combined)
+        
+        page_counts = {}
+        for task, page in self.iter_fetch(tasks, page_size):
+            articles = list(self.merge_cross_lists(page.articles, seen))
+            all_articles.extend(articles)
+            page_counts[task] = page_counts.get(task, 0) + len(articles)
+            if page.next_start is not None:
+                print(f"📥 {self.category_label(task[0])}: ✓ {page_counts.pop(task)} articles")
         
-        return all_articles
+        # Ne garder que la dernière version (catégories cumulées) de chaque article
+        latest = {}
+        for article in all_articles:
+            known = latest.get(article['arxiv_id'])
+            if known is None or article['version'] >= known['version']:
+                latest[article['arxiv_id']] = article
+        return list(latest.values())
     
-    def parse_arxiv_response(self, xml_content, category, start_date, end_date):
+    def parse_arxiv_response(self, xml_content, category, start_date=None, end_date=None):
         """Parse la réponse XML de l'API arXiv"""
-        articles = []
-        root = ET.fromstring(xml_content)
+        if isinstance(xml_content, str):
+            xml_content = xml_content.encode('utf-8')
+        return list(self.iter_arxiv_entries(io.BytesIO(xml_content), category, start_date, end_date))
+    
+    def iter_arxiv_entries(self, source, category, start_date=None, end_date=None, feed=None):
+        """Parse en flux une réponse Atom (fichier ou flux d'octets), article par article
         
-        # Namespace pour arXiv
-        ns = {
-            'atom': 'http://www.w3.org/2005/Atom',
-            'arxiv': 'http://arxiv.org/schemas/atom'
-        }
+        Chaque entrée est libérée dès qu'elle est traitée: la mémoire reste
+        constante quelle que soit la taille de la page. Si `feed` (dict) est
+        fourni, il reçoit le total annoncé ('total') et le nombre d'entrées
+        lues ('entries').
+        """
+        requested = {category} if isinstance(category, str) else set(category)
+        # Bornes normalisées une fois pour toute la page
+        window = None
+        if start_date is not None and end_date is not None:
+            window = (self.to_utc(start_date), self.to_utc(end_date))
         
-        for entry in root.findall('atom:entry', ns):
-            # ID arXiv
-            id_elem = entry.find('atom:id', ns)
-            arxiv_id = id_elem.text.split('/abs/')[-1] if id_elem is not None else None
-            
-            # Date de publication
-            published_elem = entry.find('atom:published', ns)
-            if published_elem is not None:
-                published_date = datetime.fromisoformat(published_elem.text.replace('Z', '+00:00'))
-                
-                # Convertir start_date et end_date en timezone-aware si nécessaire
-                if start_date.tzinfo is None:
-                    from datetime import timezone
-                    start_date = start_date.replace(tzinfo=timezone.utc)
-                if end_date.tzinfo is None:
-                    from datetime import timezone
-                    end_date = end_date.replace(tzinfo=timezone.utc)
-                
-                # Filtrer par date
-                if published_date < start_date or published_date > end_date:
-                    continue
-            else:
-                continue
-            
-            # Titre
-            title_elem = entry.find('atom:title', ns)
-            title = title_elem.text.strip().replace('\n', ' ') if title_elem is not None else "No title"
-            
-            # Auteurs
-            authors = []
-            for author in entry.findall('atom:author', ns):
-                name_elem = author.find('atom:name', ns)
-                if name_elem is not None:
-                    authors.append(name_elem.text)
-            authors_str = "; ".join(authors)
-            
-            # Abstract
-            summary_elem = entry.find('atom:summary', ns)
-            abstract = summary_elem.text.strip().replace('\n', ' ') if summary_elem is not None else ""
-            
-            # Date de mise à jour
-            updated_elem = entry.find('atom:updated', ns)
-            updated_date = datetime.fromisoformat(updated_elem.text.replace('Z', '+00:00')) if updated_elem is not None else published_date
-            
-            # Liens
-            link = f"https://arxiv.org/abs/{arxiv_id}"
-            pdf_link = f"https://arxiv.org/pdf/{arxiv_id}.pdf"
-            
-            articles.append({
-                'arxiv_id': arxiv_id,
-                'title': title,
-                'authors': authors_str,
-                'abstract': abstract,
-                'category': category,
-                'published': published_date,
-                'updated': updated_date,
-                'link': link,
-                'pdf_link': pdf_link
-            })
-        
-        return articles
-    
-    def save_articles(self, articles):
-        """Sauvegarde les articles dans la base de données"""
-        if not articles:
-            return 0
+        # Seuls les événements 'end' sont demandés (deux fois moins d'appels);
+        # une entrée vidée ne laisse qu'une coquille de quelques octets
+        entries = 0
+        for _, elem in ET.iterparse(source):
+            tag = elem.tag
+            if tag == ENTRY_TAG:
+                entries += 1
+                article = self.parse_entry(elem, category, requested, window)
+                # Libérer l'entrée dès qu'elle est traitée
+                elem.clear()
+                if feed is not None:
+                    feed['entries'] = entries
+                if article is not None:
+                    yield article
+            elif tag == TOTAL_RESULTS_TAG and feed is not None:
+                feed['total'] = int(elem.text)
         
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
+        if feed is not None:
+            feed['entries'] = entries
+    
+    def parse_entry(self, entry, category, requested, window=None):
+        """Convertit une entrée Atom en article (None si hors fenêtre `window`)"""
+        arxiv_id = None
+        version = None
+        title = "No title"
+        abstract = ""
+        published_text = updated_text = None
+        primary = None
+        authors = []
+        terms = []
         
-        count = 0
-        for article in articles:
-            try:
-                cursor.execute('''
-                    INSERT OR REPLACE INTO articles 
-                    (arxiv_id, title, authors, abstract, category, published, updated, link, pdf_link, last_fetched)
-                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                ''', (
-                    article['arxiv_id'],
-                    article['title'],
-                    article['authors'],
-                    article['abstract'],
-                    article['category'],
-                    article['published'],
-                    article['updated'],
-                    article['link'],
-                    article['pdf_link'],
-                    datetime.now()
-                ))
-                count += 1
-            except sqlite3.IntegrityError:
-                pass  # Article déjà existant
-        
-        conn.commit()
-        conn.close()
-        return count
-    
-    def update_collection(self, categories, days_back=2):
-        """Met à jour la collection avec les nouveaux articles"""
-        end_date = datetime.now()
-        start_date = end_date - timedelta(days=days_back)
+        # Un seul passage sur les enfants, balises comparées à des constantes
+        for child in entry:
+            tag = child.tag
+            if tag == AUTHOR_TAG:
+                for name_elem in child:
+                    if name_elem.tag == NAME_TAG:
+                        authors.append(name_elem.text)
+                        break
+            elif tag == CATEGORY_TAG:
+                terms.append(child.get('term'))
+            elif tag == ID_TAG:
+                arxiv_id, version = split_arxiv_id(child.text.split('/abs/')[-1])
+            elif tag == PUBLISHED_TAG:
+                published_text = child.text
+            elif tag == UPDATED_TAG:
+                updated_text = child.text
+            elif tag == TITLE_TAG:
+                title = child.text.strip().replace('\n', ' ')
+            elif tag == SUMMARY_TAG:
+                abstract = child.text.strip().replace('\n', ' ')
+            elif tag == PRIMARY_CATEGORY_TAG:
+                primary = child.get('term')
+        
+        # Date de publication
+        if published_text is None:
+            return None
+        published_date = parse_atom_date(published_text)
+        
+        # Filtrer par date (garde-fou: la requête est déjà bornée)
+        if window is not None and (published_date < window[0] or published_date > window[1]):
+            return None
+        
+        # Date de mise à jour (identique à la publication pour une v1)
+        if updated_text is None or updated_text == published_text:
+            updated_date = published_date
+        else:
+            updated_date = parse_atom_date(updated_text)
+        
+        # Catégories suivies de l'article (primaire + cross-lists)
+        matching = [term for term in dict.fromkeys(terms) if term in requested]
+        if not matching:
+            matching = [category] if isinstance(category, str) else sorted(requested)[:1]
+        
+        # Identifiant de base (clé en base) et version courante; les liens
+        # sans version pointent toujours vers la dernière version
+        return {
+            'arxiv_id': arxiv_id,
+            'version': version or 1,
+            'title': title,
+            'authors': "; ".join(authors),
+            'abstract': abstract,
+            'category': primary if primary in matching else matching[0],
+            'categories': matching,
+            'primary_category': primary,
+            'published': published_date,
+            'updated': updated_date,
+            'link': f"https://arxiv.org/abs/{arxiv_id}",
+            'pdf_link': f"https://arxiv.org/pdf/{arxiv_id}.pdf"
+        }
+    
+    def save_articles(self, articles, checkpoint=None, percolate=False):
+        """Sauvegarde une page d'articles (et son point de reprise, et ses alertes
+        avec `percolate`), renvoie un SaveResult"""
+        return self.db.save_articles(articles, checkpoint, percolate)
+    
+    def get_watermarks(self, categories):
+        """Watermark (dernier `updated` vu) de chaque catégorie, ou None"""
+        return self.db.get_watermarks(categories)
+    
+    def save_watermarks(self, latest):
+        """Avance les watermarks {catégorie: (published, updated)} sans jamais reculer"""
+        self.db.save_watermarks(latest)
+    
+    def update_collection(self, categories, days_back=None, combined=True):
+        """Met à jour la collection avec les nouveaux articles
+        
+        Par défaut, mise à jour incrémentale: chaque catégorie reprend depuis
+        son watermark, quel que soit le temps écoulé depuis le dernier passage.
+        Avec `days_back`, on relit simplement la fenêtre des X derniers jours.
+        """
+        end_date = datetime.now(timezone.utc)
         
         print(f"\n🔄 Mise à jour de la collection")
-        print(f"📅 Période: {start_date.strftime('%Y-%m-%d')} → {end_date.strftime('%Y-%m-%d')}")
+        if days_back is not None:
+            start_date = end_date - timedelta(days=days_back)
+            print(f"📅 Période: {start_date.strftime('%Y-%m-%d')} → {end_date.strftime('%Y-%m-%d')}")
+            tasks = self.make_tasks(categories, start_date, end_date, combined)
+        else:
+            fallback = end_date - timedelta(days=DEFAULT_DAYS_BACK)
+            watermarks = self.get_watermarks(categories)
+            for category in categories:
+                since = watermarks[category] or fallback
+                print(f"📅 {category}: depuis {since.strftime('%Y-%m-%d %H:%M')}")
+                watermarks[category] = since
+            # Requête combinée: on remonte jusqu'au plus ancien watermark
+            tasks = self.make_tasks(categories, None, None, combined)
+            tasks = [(category, min(watermarks[cat] for cat in self.task_categories(category)), None)
+                     for category, _, _ in tasks]
         print(f"📚 Catégories: {', '.join(categories)}\n")
         
-        articles = self.fetch_arxiv_articles(categories, start_date, end_date)
-        saved = self.save_articles(articles)
+        # Sauvegarder chaque page dès qu'elle arrive; les abonnements ne sont
+        # évalués que sur ses articles nouveaux ou réécrits, et leurs alertes
+        # enregistrées dans la transaction de la page
+        added = rewritten = unchanged = 0
+        alerts = {}
+        saved_by_category = dict.fromkeys(categories, 0)
+        latest = {}
+        seen = {}
+        failed = []
+        page_counts = {}
+        for task, page in self.iter_fetch(tasks, failed=failed):
+            articles = list(self.merge_cross_lists(page.articles, seen))
+            result = self.save_articles(articles, percolate=True)
+            added += result.inserted
+            rewritten += result.updated
+            unchanged += result.unchanged
+            for name, matched in result.alerts.items():
+                alerts.setdefault(name, []).extend(matched)
+            for article in articles:
+                for cat in article['categories']:
+                    if cat in saved_by_category:
+                        saved_by_category[cat] += 1
+                        published, updated = latest.get(cat, (article['published'], article['updated']))
+                        latest[cat] = (max(published, article['published']), max(updated, article['updated']))
+            page_counts[task] = page_counts.get(task, 0) + len(articles)
+            if page.next_start is not None:
+                print(f"📥 {self.category_label(task[0])}: ✓ {page_counts.pop(task)} articles")
+        
+        # Les watermarks n'avancent que si la tâche est allée jusqu'au bout:
+        # une mise à jour interrompue sera reprise au même point. Celui d'une
+        # catégorie en échec est enregistré tel qu'au départ: sans watermark
+        # en base, il serait sinon recalculé depuis les pages déjà sauvegardées
+        if days_back is None:
+            failed_categories = {cat for category, _, _ in failed for cat in self.task_categories(category)}
+            reached = {cat: dates for cat, dates in latest.items() if cat not in failed_categories}
+            reached.update({cat: (watermarks[cat], watermarks[cat]) for cat in failed_categories})
+            self.save_watermarks(reached)
         
         # Log de la mise à jour
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        for category in categories:
-            cursor.execute('''
-                INSERT INTO fetch_log (category, fetch_date, articles_count)
-                VALUES (?, ?, ?)
-            ''', (category, datetime.now(), saved))
-        conn.commit()
-        conn.close()
-        
-        print(f"\n✅ {saved} articles ajoutés/mis à jour\n")
-    
-    def initial_collection(self, categories, start_year=2000):
-        """Collection initiale depuis une année donnée"""
+        self.db.log_fetch(saved_by_category)
+        
+        print(f"\n✅ {added} articles ajoutés, {rewritten} mis à jour, {unchanged} inchangés\n")
+        
+        # Résumé des alertes (dans update.log avec auto_update.sh)
+        for name, matched in sorted(alerts.items()):
+            print(f"🔔 {name}: {len(matched)} nouveaux articles")
+            for arxiv_id, title in matched[:ALERT_DIGEST_LINES]:
+                print(f"   {arxiv_id}  {' '.join((title or '').split())[:70]}")
+            if len(matched) > ALERT_DIGEST_LINES:
+                print(f"   ... et {len(matched) - ALERT_DIGEST_LINES} autres (python3 arxiv_collector.py alerts 1 {name})")
+        if alerts:
+            print()
+    
+    def get_checkpoints(self):
+        """Points de reprise: {(tâche, début de fenêtre): (page suivante, terminé, fin de fenêtre, jeton OAI)}"""
+        return self.db.get_checkpoints()
+    
+    def initial_collection(self, categories, start_year=2000, combined=True, backend='api', bulk=False):
+        """Collection initiale depuis une année donnée
+        
+        `backend` choisit la source: 'api' (API de recherche, fenêtres
+        annuelles paginées) ou 'oai' (moissonnage OAI-PMH en flux continu,
+        adapté aux collectes de catégories complètes). `bulk` active le
+        mode chargement massif de la base (voir ArxivDatabase.bulk_load).
+        """
+        if bulk:
+            with self.db.bulk_load():
+                return self.initial_collection(categories, start_year, combined, backend)
+        
         end_date = datetime.now()
         start_date = datetime(start_year, 1, 1)
         
@@ -224,56 +538,206 @@ class ArxivCollector:
         print(f"📚 Catégories: {', '.join(categories)}")
         print(f"⚠️  Cela peut prendre du temps...\n")
         
-        # Collecter par année pour éviter de surcharger l'API
-        current_year = start_year
-        total_saved = 0
+        if backend == 'oai':
+            total_saved = self.harvest_collection(categories, start_date, end_date)
+            print(f"\n✅ Collection initiale terminée: {total_saved} articles au total\n")
+            return
         
-        while current_year <= end_date.year:
+        # Une tâche par année (et par catégorie hors mode combiné): le limiteur
+        # global espace les requêtes, les pages sont sauvegardées au fil de l'eau
+        tasks = []
+        for current_year in range(start_year, end_date.year + 1):
             year_start = datetime(current_year, 1, 1)
-            year_end = datetime(current_year, 12, 31, 23, 59, 59)
-            
-            if year_end > end_date:
-                year_end = end_date
-            
-            print(f"📆 Année {current_year}...")
-            articles = self.fetch_arxiv_articles(categories, year_start, year_end, max_results=2000)
-            saved = self.save_articles(articles)
+            year_end = min(datetime(current_year, 12, 31, 23, 59, 59), end_date)
+            tasks.extend(self.make_tasks(categories, year_start, year_end, combined))
+        
+        # Reprise: sauter les fenêtres terminées, repartir de la dernière page
+        # sauvegardée (tri ascendant: les offsets restent valables)
+        checkpoints = self.get_checkpoints()
+        offsets = {}
+        pending = []
+        for task in tasks:
+            category, window_start, window_end = task
+            checkpoint = checkpoints.get((self.category_label(category), str(window_start)))
+            if checkpoint:
+                next_start, done, saved_end, _ = checkpoint
+                if done and saved_end >= str(window_end):
+                    continue
+                offsets[task] = next_start
+            pending.append(task)
+        
+        if len(pending) < len(tasks) or offsets:
+            print(f"⏩ Reprise: {len(tasks) - len(pending)} fenêtres terminées, "
+                  f"{len(offsets)} fenêtres reprises en cours de route\n")
+        
+        total_saved = 0
+        seen = {}
+        page_counts = {}
+        for task, page in self.iter_fetch(pending, offsets=offsets):
+            category, year_start, year_end = task
+            articles = self.merge_cross_lists(page.articles, seen)
+            if page.next_start is None:
+                # Lot intermédiaire: le point de reprise reste au début de la page
+                result = self.save_articles(articles)
+            else:
+                # Fin de page: fetch_category_pages ne la transmet jamais pour
+                # une page vide avant la fin annoncée (redemandée, ou tâche en
+                # échec) et la fait suivre de ses entrées reçues (page courte):
+                # le point de reprise n'avance que sur des entrées reçues
+                next_start = min(page.next_start, page.total)
+                checkpoint = Checkpoint(self.category_label(category), year_start, year_end,
+                                        next_start, page.total, next_start >= page.total)
+                result = self.save_articles(articles, checkpoint=checkpoint)
+            saved = result.inserted + result.updated
             total_saved += saved
-            print(f"   💾 {saved} articles sauvegardés\n")
-            
-            current_year += 1
-            time.sleep(5)  # Pause entre années
+            page_counts[task] = page_counts.get(task, 0) + saved
+            if page.next_start is not None:
+                print(f"📆 {year_start.year} {self.category_label(category)}: 💾 {page_counts.pop(task)} articles sauvegardés "
+                      f"({next_start}/{page.total})")
         
         print(f"\n✅ Collection initiale terminée: {total_saved} articles au total\n")
     
-    def search_articles(self, keyword=None, category=None, year=None, limit=100):
-        """Recherche d'articles dans la collection"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
+    def harvest_collection(self, categories, start_date, end_date):
+        """Collection initiale par OAI-PMH: un flux par set, repris via son jeton"""
+        window_start = self.to_utc(start_date)
+        checkpoints = self.get_checkpoints()
+        total_saved = 0
+        seen = {}
+        
+        for set_spec in dict.fromkeys(oai_set(category) for category in categories):
+            task = f"oai:{set_spec}:{self.category_label(tuple(categories))}"
+            next_start, done, _, token = checkpoints.get((task, str(start_date)), (0, 0, None, None))
+            if done:
+                print(f"⏩ {set_spec}: déjà moissonné")
+                continue
+            if token:
+                print(f"⏩ {set_spec}: reprise après {next_start} enregistrements")
+            
+            # `from` porte sur la date de modification OAI, toujours postérieure
+            # à la soumission: c'est une borne inférieure sûre, affinée ensuite
+            batches = self.oai.iter_batches(set_spec, categories, from_date=start_date,
+                                            resumption_token=token)
+            try:
+                for articles, token, size in batches:
+                    next_start += len(articles)
+                    fresh = (article for article in articles if article['published'] >= window_start)
+                    checkpoint = Checkpoint(task, start_date, end_date, next_start, size,
+                                            token is None, token)
+                    result = self.save_articles(self.merge_cross_lists(fresh, seen), checkpoint=checkpoint)
+                    saved = result.inserted + result.updated
+                    total_saved += saved
+                    print(f"🌾 {set_spec}: 💾 {saved} articles sauvegardés"
+                          + (f" (liste complète: {size} enregistrements)" if size else ""))
+            except OaiError as e:
+                # Jeton expiré: le prochain `init` repartira du début du set
+                if 'badResumptionToken' in str(e):
+                    self.save_articles([], checkpoint=Checkpoint(task, start_date, end_date, 0, None, False))
+                print(f"✗ {set_spec}: Error: {e}")
+            except Exception as e:
+                print(f"✗ {set_spec}: Error: {e}")
         
-        query = "SELECT * FROM articles WHERE 1=1"
-        params = []
+        return total_saved
+    
+    def search_articles(self, keyword=None, category=None, year=None, limit=100, author=None):
+        """Recherche d'articles dans la collection
         
-        if keyword:
-            query += " AND (title LIKE ? OR abstract LIKE ? OR authors LIKE ?)"
-            params.extend([f"%{keyword}%", f"%{keyword}%", f"%{keyword}%"])
+        `keyword` accepte les phrases ("..."), les préfixes (mot*) et OR; les
+        résultats sont alors classés par pertinence. `author` filtre sur un
+        nom d'auteur complet (casse, accents et ponctuation ignorés), via
+        l'index des auteurs.
+        """
+        return self.db.search(ARTICLE_COLUMNS, keyword=keyword, category=category, year=year, author=author,
+                              limit=limit)
+    
+    def search_pages(self, keyword=None, category=None, year=None, author=None, page_size=100):
+        """Mêmes filtres que search_articles, par pages lues à la demande (pagination par clé)"""
+        return self.db.iter_search_pages(ARTICLE_COLUMNS, page_size=page_size, keyword=keyword,
+                                         category=category, year=year, author=author)
+    
+    def similar_articles(self, arxiv_id, limit=10):
+        """Articles les plus proches d'un article (termes caractéristiques du titre et de l'abstract)
         
-        if category:
-            query += " AND category = ?"
-            params.append(category)
+        None si l'article n'est pas dans la collection.
+        """
+        return self.db.similar(ARTICLE_COLUMNS, arxiv_id, limit=limit)
+    
+    def author_articles(self, name, page_size=100):
+        """Parcourt les articles d'un auteur, des plus récents aux plus anciens"""
+        author = find_author(self.db, name)
+        if author:
+            print(f"\n✍️  {author.name}: {author.articles} articles")
+            pages = self.search_pages(author=author.key, page_size=page_size)
+            self.interactive_browser(next(pages, []), pages)
+    
+    def coauthors(self, name, limit=20):
+        """Affiche les co-auteurs d'un auteur et ses collaborateurs à deux pas
         
-        if year:
-            query += " AND strftime('%Y', published) = ?"
-            params.append(str(year))
+        Le graphe des co-auteurs est construit en mémoire (voir arxiv_authors).
+        """
+        author = find_author(self.db, name)
+        if not author:
+            return
+        graph = build_coauthor_graph(self.db)
+        direct = graph.neighbours(author.id)
+        second = graph.two_hop(author.id)
+        names = self.db.author_names([node for node, _ in direct.most_common(limit) + second.most_common(limit)])
         
-        query += " ORDER BY published DESC LIMIT ?"
-        params.append(limit)
+        print(f"\n{'='*80}")
+        print(f"👥 CO-AUTEURS DE {author.name} ({author.articles} articles)")
+        print(f"{'='*80}\n")
+        print(f"🤝 {len(direct)} co-auteurs:")
+        for node, papers in direct.most_common(limit):
+            print(f"   {names[node]} ({papers} articles en commun)")
+        print(f"\n🔗 {len(second)} collaborateurs à deux pas:")
+        for node, shared in second.most_common(limit):
+            print(f"   {names[node]} ({shared} co-auteurs en commun)")
+        print()
+    
+    def subscribe(self, name, keywords=None, category=None, author=None):
+        """Enregistre un abonnement, évalué sur chaque lot des mises à jour suivantes"""
+        if keywords and not fts_query(keywords):
+            print("❌ Mots-clés vides")
+            return
+        if not (keywords or category or author):
+            print("❌ Au moins un critère: mots-clés, cat:<catégorie> ou author:<nom>")
+            return
+        self.db.subscribe(name, keywords, category, author)
+        print(f"✅ Abonnement {name} enregistré")
+    
+    def list_subscriptions(self):
+        """Affiche les abonnements et leurs critères"""
+        subscriptions = self.db.get_subscriptions()
+        if not subscriptions:
+            print("❌ Aucun abonnement")
+            return
+        print(f"\n🔔 {len(subscriptions)} abonnements\n")
+        for subscription in subscriptions:
+            criteria = [value for value in (subscription.keywords,
+                                            subscription.category and f"cat:{subscription.category}",
+                                            subscription.author and f"author:{subscription.author}") if value]
+            print(f"   {subscription.name}: {' '.join(criteria)}")
+        print()
+    
+    def alerts(self, days=DEFAULT_ALERT_DAYS, name=None):
+        """Affiche les alertes des `days` derniers jours, groupées par abonnement"""
+        alerts = self.db.get_alerts(since=datetime.now() - timedelta(days=days), name=name)
         
-        cursor.execute(query, params)
-        results = cursor.fetchall()
-        conn.close()
+        print(f"\n{'='*80}")
+        print(f"🔔 ALERTES ({days} derniers jours)")
+        print(f"{'='*80}\n")
+        if not alerts:
+            print("✅ Aucune alerte\n")
+            return
         
-        return results
+        by_subscription = {}
+        for alert in alerts:
+            by_subscription.setdefault(alert.subscription, []).append(alert)
+        for subscription, matched in sorted(by_subscription.items()):
+            print(f"[{subscription}] {len(matched)} articles")
+            for alert in matched:
+                print(f"   {alert.arxiv_id:<12} {(alert.published or '')[:10]}  "
+                      f"{' '.join((alert.title or '').split())[:55]}")
+            print()
     
     def display_article(self, article, index=None):
         """Affiche un article de manière formatée"""
@@ -287,70 +751,94 @@ class ArxivCollector:
         print(f"\n📄 Titre: {article[1]}")
         print(f"\n✍️  Auteurs: {article[2]}")
         print(f"\n📅 Date: {article[5][:10]}")
-        print(f"\n🏷️  Catégorie: {article[4]}")
-        print(f"\n📌 Citation arXiv: {article[0]}")
+        print(f"\n🏷️  Catégories: {article[10] or article[4]}")
+        print(f"\n📌 Citation arXiv: {article[0]}v{article[14] or 1}")
         print(f"\n🔗 Lien: {article[7]}")
         print(f"\n📥 PDF: {article[8]}")
-        print(f"\n📝 Abstract:\n{article[3][:500]}{'...' if len(article[3]) > 500 else ''}")
+        # Abstract décompressé seulement pour l'article affiché
+        abstract = article[3] if article[3] is not None else (self.db.get_abstract(article[0]) or "")
+        print(f"\n📝 Abstract:\n{abstract[:500]}{'...' if len(abstract) > 500 else ''}")
         print(f"\n{'='*80}\n")
     
-    def interactive_browser(self, articles):
-        """Navigateur interactif pour parcourir les articles"""
+    def interactive_browser(self, articles, more_pages=None):
+        """Navigateur interactif pour parcourir les articles
+        
+        `more_pages` (itérateur de listes d'articles, voir search_pages) donne
+        la suite: chaque page n'est lue qu'au moment où on l'atteint.
+        """
+        articles = list(articles)
         if not articles:
             print("❌ Aucun article trouvé.")
             return
         
+        def load_more():
+            """Ajoute la page suivante; False s'il n'y en a plus"""
+            nonlocal more_pages
+            page = next(more_pages, None) if more_pages is not None else None
+            if not page:
+                more_pages = None
+                return False
+            articles.extend(page)
+            return True
+        
         index = 0
-        total = len(articles)
         
-        print(f"\n📚 {total} articles trouvés")
+        print(f"\n📚 {len(articles)}{'+' if more_pages is not None else ''} articles trouvés")
         print("\nCommandes: [Enter]=suivant | [p]=précédent | [q]=quitter | [s]=recherche | [numero]=aller à\n")
         
         while True:
             self.display_article(articles[index], index + 1)
-            print(f"[{index + 1}/{total}] ", end="")
+            print(f"[{index + 1}/{len(articles)}{'+' if more_pages is not None else ''}] ", end="")
             
             try:
                 cmd = input("Commande: ").strip().lower()
                 
                 if cmd == '' or cmd == 'n':
-                    index = (index + 1) % total
+                    if index + 1 == len(articles):
+                        load_more()
+                    index = (index + 1) % len(articles)
                 elif cmd == 'p':
-                    index = (index - 1) % total
+                    index = (index - 1) % len(articles)
                 elif cmd == 'q':
                     break
                 elif cmd.isdigit():
                     new_index = int(cmd) - 1
-                    if 0 <= new_index < total:
+                    while new_index >= len(articles) and load_more():
+                        pass
+                    if 0 <= new_index < len(articles):
                         index = new_index
                     else:
-                        print(f"❌ Numéro invalide (1-{total})")
+                        print(f"❌ Numéro invalide (1-{len(articles)})")
             except KeyboardInterrupt:
                 print("\n\n👋 Au revoir habibi!")
                 break
     
-    def stats(self):
-        """Affiche les statistiques de la collection"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
-        # Total d'articles
-        cursor.execute("SELECT COUNT(*) FROM articles")
-        total = cursor.fetchone()[0]
-        
-        # Par catégorie
-        cursor.execute("SELECT category, COUNT(*) FROM articles GROUP BY category ORDER BY COUNT(*) DESC")
-        by_category = cursor.fetchall()
-        
-        # Par année
-        cursor.execute("SELECT strftime('%Y', published) as year, COUNT(*) FROM articles GROUP BY year ORDER BY year DESC LIMIT 10")
-        by_year = cursor.fetchall()
+    def duplicates(self, min_similarity=DUPLICATE_SIMILARITY):
+        """Affiche les groupes de quasi-doublons détectés à l'écriture des articles"""
+        if not DUPLICATE_SIMILARITY <= min_similarity <= 1:
+            # Seules les paires d'au moins DUPLICATE_SIMILARITY sont enregistrées
+            print(f"❌ Seuil entre {DUPLICATE_SIMILARITY} (paires enregistrées) et 1")
+            return
+        clusters = self.db.duplicate_clusters(min_similarity)
         
-        # Article le plus récent
-        cursor.execute("SELECT title, published FROM articles ORDER BY published DESC LIMIT 1")
-        latest = cursor.fetchone()
+        print(f"\n{'='*80}")
+        print(f"🔁 QUASI-DOUBLONS (similarité ≥ {min_similarity:.0%})")
+        print(f"{'='*80}\n")
+        if not clusters:
+            print("✅ Aucun quasi-doublon trouvé\n")
+            return
         
-        conn.close()
+        print(f"📚 {len(clusters)} groupes, {sum(len(cluster) for cluster in clusters)} articles\n")
+        for number, cluster in enumerate(clusters, 1):
+            print(f"[{number}] {len(cluster)} articles")
+            for arxiv_id, version, published, title in self.db.get_articles(
+                    "a.arxiv_id, a.version, a.published, a.title", cluster):
+                print(f"   {arxiv_id}v{version or 1:<3} {(published or '')[:10]}  {(title or '')[:60]}")
+            print()
+    
+    def stats(self):
+        """Affiche les statistiques de la collection"""
+        total, by_category, by_year, by_month, latest = self.db.stats(years=10, months=12)
         
         print(f"\n{'='*80}")
         print(f"📊 STATISTIQUES DE LA COLLECTION")
@@ -365,6 +853,10 @@ class ArxivCollector:
         for year, count in by_year:
             print(f"   {year}: {count}")
         
+        print(f"\n🗓️  Par mois (12 derniers):")
+        for month, count in by_month:
+            print(f"   {month}: {count}")
+        
         if latest:
             print(f"\n🆕 Article le plus récent:")
             print(f"   {latest[0][:80]}...")
@@ -378,36 +870,126 @@ def main():
     collector = ArxivCollector()
     
     # Catégories par défaut
-    categories = ['math.DG', 'math.SG', 'math-ph', 'math.AG', 'math.QA', 'math.RT']
+    categories = list(DEFAULT_CATEGORIES)
     
     if len(sys.argv) > 1:
         cmd = sys.argv[1]
         
         if cmd == 'init':
-            # Collection initiale
-            year = int(sys.argv[2]) if len(sys.argv) > 2 else 2000
-            collector.initial_collection(categories, start_year=year)
+            # Collection initiale (backend 'api' par défaut, ou 'oai'),
+            # 'bulk' en option pour le mode chargement massif
+            args = [arg for arg in sys.argv[2:] if arg != 'bulk']
+            year = int(args[0]) if args else 2000
+            backend = args[1] if len(args) > 1 else 'api'
+            if backend not in ('api', 'oai'):
+                print("❌ Backend inconnu (api ou oai)")
+                return
+            collector.initial_collection(categories, start_year=year, backend=backend,
+                                         bulk='bulk' in sys.argv[2:])
         
         elif cmd == 'update':
-            # Mise à jour
-            days = int(sys.argv[2]) if len(sys.argv) > 2 else 2
+            # Mise à jour (incrémentale sauf si un nombre de jours est donné)
+            days = int(sys.argv[2]) if len(sys.argv) > 2 else None
             collector.update_collection(categories, days_back=days)
         
         elif cmd == 'stats':
             # Statistiques
             collector.stats()
         
+        elif cmd == 'rebuild-stats':
+            # Recalcul des compteurs de statistiques
+            collector.db.rebuild_stats()
+            collector.db.rebuild_term_stats()
+            print("✅ Compteurs de statistiques recalculés")
+            collector.stats()
+        
+        elif cmd == 'export-columnar':
+            # Instantané colonnaire (complété depuis le dernier export, sauf 'full')
+            args = [arg for arg in sys.argv[2:] if arg != 'full']
+            path = args[0] if args else DEFAULT_COLUMNAR_PATH
+            result = export_columnar(collector.db, path, full='full' in sys.argv[2:])
+            print(f"✅ Instantané colonnaire {path}: {result.appended} articles écrits "
+                  f"({result.replaced} remplacés), {result.rows} lignes")
+        
         elif cmd == 'search':
             # Recherche
             keyword = sys.argv[2] if len(sys.argv) > 2 else None
-            articles = collector.search_articles(keyword=keyword)
-            collector.interactive_browser(articles)
+            pages = collector.search_pages(keyword=keyword)
+            collector.interactive_browser(next(pages, []), pages)
+        
+        elif cmd == 'duplicates':
+            # Groupes de quasi-doublons (seuil de similarité en option, ex. 0.9)
+            min_similarity = float(sys.argv[2]) if len(sys.argv) > 2 else DUPLICATE_SIMILARITY
+            collector.duplicates(min_similarity)
+        
+        elif cmd == 'similar':
+            # Articles proches d'un article
+            if len(sys.argv) < 3:
+                print("Usage: python3 arxiv_collector.py similar <arxiv_id> [nombre]")
+                return
+            limit = int(sys.argv[3]) if len(sys.argv) > 3 else 10
+            articles = collector.similar_articles(sys.argv[2], limit=limit)
+            if articles is None:
+                print(f"❌ Article {sys.argv[2]} non trouvé")
+            else:
+                collector.interactive_browser(articles)
+        
+        elif cmd == 'author':
+            # Articles d'un auteur
+            if len(sys.argv) < 3:
+                print("Usage: python3 arxiv_collector.py author <nom>")
+                return
+            collector.author_articles(sys.argv[2])
+        
+        elif cmd == 'coauthors':
+            # Co-auteurs d'un auteur (graphe des co-auteurs)
+            if len(sys.argv) < 3:
+                print("Usage: python3 arxiv_collector.py coauthors <nom> [nombre]")
+                return
+            limit = int(sys.argv[3]) if len(sys.argv) > 3 else 20
+            collector.coauthors(sys.argv[2], limit=limit)
+        
+        elif cmd == 'subscribe':
+            # Abonnement: mots-clés, cat:<catégorie> et author:<nom> combinés
+            if len(sys.argv) < 4:
+                print("Usage: python3 arxiv_collector.py subscribe <nom> [mots-clés] [cat:<catégorie>] [author:<nom>]")
+                return
+            keywords = []
+            category = author = None
+            for arg in sys.argv[3:]:
+                if arg.startswith('cat:'):
+                    category = arg[4:]
+                elif arg.startswith('author:'):
+                    author = arg[7:]
+                else:
+                    keywords.append(arg)
+            collector.subscribe(sys.argv[2], ' '.join(keywords) or None, category=category, author=author)
+        
+        elif cmd == 'unsubscribe':
+            # Suppression d'un abonnement et de ses alertes
+            if len(sys.argv) < 3:
+                print("Usage: python3 arxiv_collector.py unsubscribe <nom>")
+                return
+            if collector.db.unsubscribe(sys.argv[2]):
+                print(f"✅ Abonnement {sys.argv[2]} supprimé")
+            else:
+                print(f"❌ Abonnement {sys.argv[2]} non trouvé")
+        
+        elif cmd == 'subscriptions':
+            # Liste des abonnements
+            collector.list_subscriptions()
+        
+        elif cmd == 'alerts':
+            # Alertes récentes (nombre de jours et abonnement en option)
+            args = sys.argv[2:]
+            days = int(args.pop(0)) if args and args[0].isdigit() else DEFAULT_ALERT_DAYS
+            collector.alerts(days, name=args[0] if args else None)
         
         elif cmd == 'browse':
             # Navigation libre
-            limit = int(sys.argv[2]) if len(sys.argv) > 2 else 100
-            articles = collector.search_articles(limit=limit)
-            collector.interactive_browser(articles)
+            page_size = int(sys.argv[2]) if len(sys.argv) > 2 else 100
+            pages = collector.search_pages(page_size=page_size)
+            collector.interactive_browser(next(pages, []), pages)
         
         else:
             print("❌ Commande inconnue")
@@ -431,19 +1013,66 @@ UTILISATION:
 
 COMMANDES:
 
-    init [année]        Collection initiale depuis année (défaut: 2000)
+    init [année] [api|oai] [bulk]
+                        Collection initiale depuis année (défaut: 2000)
+                        'oai' moissonne en flux OAI-PMH (catégories complètes)
+                        'bulk': chargement massif (index reconstruits à la fin)
                         Ex: python3 arxiv_collector.py init 2020
+                            python3 arxiv_collector.py init 1992 oai bulk
     
-    update [jours]      Mise à jour avec articles des X derniers jours (défaut: 2)
+    update [jours]      Mise à jour incrémentale depuis le dernier article connu
+                        de chaque catégorie, ou des X derniers jours si précisé
                         Ex: python3 arxiv_collector.py update 7
     
-    browse [limite]     Parcourir les articles (défaut: 100 derniers)
+    browse [page]       Parcourir les articles, des plus récents aux plus anciens,
+                        chargés par pages (défaut: 100 par page)
                         Ex: python3 arxiv_collector.py browse 50
     
     search <mot-clé>    Rechercher par mot-clé
                         Ex: python3 arxiv_collector.py search "Poisson"
     
+    similar <arxiv_id> [nombre]
+                        Articles proches d'un article (défaut: 10)
+                        Ex: python3 arxiv_collector.py similar 2511.16644
+    
+    author <nom>        Articles d'un auteur (nom complet, nom de famille ou
+                        début du nom; casse et accents ignorés)
+                        Ex: python3 arxiv_collector.py author "Maxim Kontsevich"
+    
+    coauthors <nom> [nombre]
+                        Co-auteurs d'un auteur et collaborateurs à deux pas
+                        (défaut: 20 de chaque)
+                        Ex: python3 arxiv_collector.py coauthors Kontsevich
+    
+    subscribe <nom> [mots-clés] [cat:<catégorie>] [author:<nom>]
+                        Abonnement: les critères donnés sont combinés (ET) et
+                        évalués sur chaque lot des mises à jour suivantes
+                        Ex: python3 arxiv_collector.py subscribe miroir "mirror symmetry" cat:math.AG
+                            python3 arxiv_collector.py subscribe mk "author:Maxim Kontsevich"
+    
+    subscriptions       Lister les abonnements
+    
+    unsubscribe <nom>   Supprimer un abonnement et ses alertes
+    
+    alerts [jours] [nom]
+                        Alertes trouvées par les mises à jour des X derniers
+                        jours (défaut: 7), d'un abonnement ou de tous
+                        Ex: python3 arxiv_collector.py alerts 30 miroir
+    
+    duplicates [seuil]  Groupes de quasi-doublons (titre + abstract), détectés à
+                        l'écriture des articles (seuil de similarité entre 0.7,
+                        le minimum enregistré et le défaut, et 1)
+                        Ex: python3 arxiv_collector.py duplicates 0.9
+    
     stats               Afficher les statistiques de la collection
+    
+    rebuild-stats       Recalculer les compteurs des statistiques depuis les
+                        articles (après une modification manuelle de la base)
+    
+    export-columnar [dossier] [full]
+                        Instantané colonnaire pour l'analyse (défaut: arxiv_columnar),
+                        complété depuis le dernier export ('full': réécrit)
+                        Ex: python3 arxiv_collector.py export-columnar
 
 CATÉGORIES:
     math.DG, math.SG, math-ph, math.AG, math.QA, math.RT
@@ -456,7 +1085,7 @@ EXEMPLES:
     # Mise à jour tous les 2 jours
     python3 arxiv_collector.py update
     
-    # Parcourir les 50 derniers articles
+    # Parcourir les articles par pages de 50
     python3 arxiv_collector.py browse 50
     
     # Rechercher "symplectic"
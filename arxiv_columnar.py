@@ -0,0 +1,355 @@
+#!/usr/bin/env python3
+"""Instantané colonnaire de la collection, pour l'analyse vectorisée
+
+`export-columnar` écrit un dossier de fichiers binaires bruts (une colonne
+par fichier, petit-boutiste) décrit par `manifest.json`:
+
+- `published`, `updated`: int32, jours depuis le 1970-01-01
+- `category`: int16, code dans la liste `categories` du manifeste
+- `version`, `author_count`: int32
+- `live`: uint8, 0 pour une ligne remplacée par une ligne plus récente
+- textes (`arxiv_id`, `title`, `abstract`): offsets int64 (n+1) + octets UTF-8
+- listes par article, offsets int64 (n+1) + valeurs: `categories` (codes
+  int16), `authors` (ids int32, noms dans `author_names`, indexé par id)
+
+L'instantané est complété à partir du numéro d'écriture (`write_seq`,
+augmenté à chaque lot dans sa transaction, donc dans l'ordre des commits):
+les articles écrits depuis le dernier export sont ajoutés en fin de
+colonnes et leur ancienne ligne est marquée morte. load_columnar le relit par mmap, sans copie ni
+SQLite (tableaux numpy si numpy est installé, memoryview sinon).
+"""
+
+import json
+import mmap
+import os
+import sys
+from array import array
+from collections import namedtuple
+from datetime import date
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+DEFAULT_COLUMNAR_PATH = "arxiv_columnar"
+MANIFEST_NAME = "manifest.json"
+FORMAT_VERSION = 2
+
+# Colonnes à largeur fixe: code de type du module array
+FIXED_COLUMNS = {
+    'published': 'i',
+    'updated': 'i',
+    'version': 'i',
+    'author_count': 'i',
+    'category': 'h',
+    'live': 'B',
+}
+
+# Colonnes de texte (offsets + octets UTF-8)
+TEXT_COLUMNS = ('arxiv_id', 'title', 'abstract')
+
+# Colonnes de listes (offsets + valeurs): code de type des valeurs
+LIST_COLUMNS = {
+    'categories': 'h',
+    'authors': 'i',
+}
+
+OFFSET_TYPE = 'q'
+NUMPY_TYPES = {'i': '<i4', 'h': '<i2', 'B': 'u1', 'q': '<i8'}
+
+# Jour 0 des colonnes de dates
+EPOCH_ORDINAL = date(1970, 1, 1).toordinal()
+
+# Instantané ouvert par load_columnar: nombre de lignes, colonnes
+# ({nom: tableau} ou {nom: (offsets, valeurs)}), manifeste
+Columnar = namedtuple('Columnar', ['rows', 'columns', 'manifest'])
+
+# Bilan d'un export: lignes ajoutées, anciennes lignes marquées mortes, total
+ExportResult = namedtuple('ExportResult', ['appended', 'replaced', 'rows'])
+
+
+def day_number(text):
+    """Jours depuis le 1970-01-01 d'une date stockée ('2024-01-02 ...')"""
+    return date.fromisoformat(text[:10]).toordinal() - EPOCH_ORDINAL if text else -1
+
+
+def text_value(column, index):
+    """Chaîne `index` d'une colonne de texte (offsets, octets)"""
+    offsets, data = column
+    return bytes(data[offsets[index]:offsets[index + 1]]).decode('utf-8')
+
+
+def list_value(column, index):
+    """Valeurs de la ligne `index` d'une colonne de listes (offsets, valeurs)"""
+    offsets, values = column
+    return list(values[offsets[index]:offsets[index + 1]])
+
+
+class ColumnarWriter:
+    """Ajoute des lignes aux fichiers d'un instantané (création ou complément)"""
+    
+    def __init__(self, path, manifest):
+        self.path = path
+        self.manifest = manifest
+        self.rows = manifest['rows']
+        self.category_codes = {category: code for code, category in enumerate(manifest['categories'])}
+        self.positions = None
+    
+    def file(self, name):
+        return os.path.join(self.path, name)
+    
+    def files(self):
+        """(fichier, taille d'un élément) de chaque colonne, offsets compris"""
+        files = [(f"{name}.bin", array(code).itemsize) for name, code in FIXED_COLUMNS.items()]
+        for name in TEXT_COLUMNS + ('author_names',):
+            files.extend([(f"{name}.offsets", 8), (f"{name}.data", 1)])
+        for name, code in LIST_COLUMNS.items():
+            files.extend([(f"{name}.offsets", 8), (f"{name}.values", array(code).itemsize)])
+        return files
+    
+    def reset(self):
+        """Fichiers vides (offsets réduits à leur 0 initial)"""
+        os.makedirs(self.path, exist_ok=True)
+        for name, _ in self.files():
+            with open(self.file(name), 'wb') as f:
+                if name.endswith('.offsets'):
+                    f.write(self.pack(array(OFFSET_TYPE, [0])))
+        # Pas d'auteur d'id 0: nom vide, pour que author_names soit indexé par id
+        self.append_text('author_names', [""])
+    
+    def truncate(self):
+        """Ramène chaque fichier à la taille décrite par le manifeste
+        
+        Un export interrompu a pu écrire au-delà: le manifeste, remplacé en
+        dernier, fait foi.
+        """
+        lengths = {'author_names': self.manifest['authors'] + 1}
+        for name, size in self.files():
+            base, kind = name.rsplit('.', 1)
+            rows = lengths.get(base, self.rows)
+            if kind == 'offsets':
+                length = (rows + 1) * 8
+            elif kind in ('data', 'values'):
+                length = self.last_offset(base, rows) * size
+            else:
+                length = rows * size
+            with open(self.file(name), 'r+b') as f:
+                f.truncate(length)
+    
+    def last_offset(self, name, rows):
+        """Offset de fin de la ligne `rows` - 1 d'une colonne de texte ou de listes"""
+        offsets = array(OFFSET_TYPE)
+        with open(self.file(f"{name}.offsets"), 'rb') as f:
+            f.seek(rows * 8)
+            offsets.frombytes(f.read(8))
+        return self.unpack(offsets)[0]
+    
+    def pack(self, values):
+        """Octets petit-boutistes d'un array"""
+        if sys.byteorder != 'little':
+            values = array(values.typecode, values)
+            values.byteswap()
+        return values.tobytes()
+    
+    def unpack(self, values):
+        if sys.byteorder != 'little':
+            values.byteswap()
+        return values
+    
+    def load_positions(self):
+        """{arxiv_id: ligne vivante}, lu une fois dans la colonne arxiv_id"""
+        if self.positions is None:
+            self.positions = {}
+            if self.rows:
+                column = (self.read_array("arxiv_id.offsets", OFFSET_TYPE),
+                          open(self.file("arxiv_id.data"), 'rb').read())
+                live = self.read_array("live.bin", 'B')
+                for row in range(self.rows):
+                    if live[row]:
+                        self.positions[text_value(column, row)] = row
+        return self.positions
+    
+    def read_array(self, name, code):
+        values = array(code)
+        with open(self.file(name), 'rb') as f:
+            values.frombytes(f.read())
+        return self.unpack(values)
+    
+    def append_text(self, name, texts):
+        """Ajoute des chaînes à une colonne de texte (offsets + octets)"""
+        data = [text.encode('utf-8') for text in texts]
+        end = os.path.getsize(self.file(f"{name}.data"))
+        offsets = array(OFFSET_TYPE)
+        for encoded in data:
+            end += len(encoded)
+            offsets.append(end)
+        with open(self.file(f"{name}.data"), 'ab') as f:
+            f.write(b''.join(data))
+        with open(self.file(f"{name}.offsets"), 'ab') as f:
+            f.write(self.pack(offsets))
+    
+    def append_lists(self, name, lists):
+        """Ajoute une liste de valeurs par ligne à une colonne de listes"""
+        code = LIST_COLUMNS[name]
+        end = os.path.getsize(self.file(f"{name}.values")) // array(code).itemsize
+        offsets = array(OFFSET_TYPE)
+        values = array(code)
+        for items in lists:
+            values.extend(items)
+            end += len(items)
+            offsets.append(end)
+        with open(self.file(f"{name}.values"), 'ab') as f:
+            f.write(self.pack(values))
+        with open(self.file(f"{name}.offsets"), 'ab') as f:
+            f.write(self.pack(offsets))
+    
+    def category_code(self, category):
+        """Code d'une catégorie, ajoutée au dictionnaire si nouvelle"""
+        code = self.category_codes.get(category)
+        if code is None:
+            code = len(self.manifest['categories'])
+            self.manifest['categories'].append(category)
+            self.category_codes[category] = code
+        return code
+    
+    def append_rows(self, rows):
+        """Ajoute un lot de iter_export_rows, renvoie le nombre de lignes remplacées"""
+        positions = self.load_positions()
+        fixed = {name: array(code) for name, code in FIXED_COLUMNS.items()}
+        dead = []
+        for (arxiv_id, _, _, category, categories, published, updated, version, author_count,
+             _, _) in rows:
+            old = positions.get(arxiv_id)
+            if old is not None:
+                dead.append(old)
+            positions[arxiv_id] = self.rows
+            self.rows += 1
+            fixed['published'].append(day_number(published))
+            fixed['updated'].append(day_number(updated))
+            fixed['version'].append(version or 1)
+            fixed['author_count'].append(author_count or 0)
+            fixed['category'].append(self.category_code(category))
+            fixed['live'].append(1)
+        
+        for name, values in fixed.items():
+            with open(self.file(f"{name}.bin"), 'ab') as f:
+                f.write(self.pack(values))
+        self.append_text('arxiv_id', [row[0] for row in rows])
+        self.append_text('title', [row[1] or "" for row in rows])
+        self.append_text('abstract', [row[2] for row in rows])
+        self.append_lists('categories', [[self.category_code(category) for category in row[4]] for row in rows])
+        self.append_lists('authors', [row[10] for row in rows])
+        
+        # Ancienne ligne d'un article réécrit: marquée morte sur place
+        if dead:
+            with open(self.file("live.bin"), 'r+b') as f:
+                for row in dead:
+                    f.seek(row)
+                    f.write(b'\x00')
+        return len(dead)
+    
+    def append_authors(self, authors):
+        """Complète author_names (indexé par id d'auteur, vide pour un id absent)"""
+        names = []
+        last_id = self.manifest['authors']
+        for author_id, name in authors:
+            names.extend([""] * (author_id - last_id - 1))
+            names.append(name)
+            last_id = author_id
+        self.append_text('author_names', names)
+        self.manifest['authors'] = last_id
+    
+    def write_manifest(self):
+        """Remplace le manifeste en une opération (il fait foi après une interruption)"""
+        self.manifest['rows'] = self.rows
+        temporary = self.file(MANIFEST_NAME + ".tmp")
+        with open(temporary, 'w', encoding='utf-8') as f:
+            json.dump(self.manifest, f, indent=2)
+        os.replace(temporary, self.file(MANIFEST_NAME))
+
+
+def read_manifest(path):
+    """Manifeste d'un instantané, ou None s'il n'existe pas (ou d'un autre format)"""
+    try:
+        with open(os.path.join(path, MANIFEST_NAME), encoding='utf-8') as f:
+            manifest = json.load(f)
+    except (FileNotFoundError, ValueError):
+        return None
+    return manifest if manifest.get('format') == FORMAT_VERSION else None
+
+
+def export_columnar(db, path=DEFAULT_COLUMNAR_PATH, full=False):
+    """Crée ou complète l'instantané colonnaire de `db` (ArxivDatabase), renvoie un ExportResult
+
+    Sans `full`, seuls les articles écrits après le numéro d'écriture du
+    dernier export sont lus (un lot validé après la lecture porte un numéro
+    supérieur: il sera lu par l'export suivant). Toute la lecture se fait sur un même état de
+    la base (transaction de lecture), l'écriture en cours d'un `update`
+    n'y apparaît pas à moitié.
+    """
+    manifest = None if full else read_manifest(path)
+    writer = ColumnarWriter(path, manifest or {
+        'format': FORMAT_VERSION,
+        'rows': 0,
+        'authors': 0,
+        'write_seq': None,
+        'categories': [],
+        'byteorder': 'little',
+        'fixed': FIXED_COLUMNS,
+        'text': list(TEXT_COLUMNS),
+        'lists': LIST_COLUMNS,
+    })
+    if manifest is None:
+        writer.reset()
+    else:
+        writer.truncate()
+
+    appended = replaced = 0
+    with db.snapshot():
+        for rows in db.iter_export_rows(since=writer.manifest['write_seq']):
+            replaced += writer.append_rows(rows)
+            appended += len(rows)
+            writer.manifest['write_seq'] = rows[-1][9]
+        writer.append_authors(db.iter_authors(after_id=writer.manifest['authors']))
+    writer.write_manifest()
+    return ExportResult(appended, replaced, writer.rows)
+
+
+def load_columnar(path=DEFAULT_COLUMNAR_PATH, use_numpy=None):
+    """Ouvre un instantané sans copie (Columnar)
+
+    Colonnes fixes: tableau (numpy.memmap si numpy est disponible et
+    `use_numpy` n'est pas False, sinon memoryview typée sur un mmap);
+    textes: (offsets, octets); listes: (offsets, valeurs). Les lignes
+    `live == 0` sont des versions remplacées, à ignorer.
+    """
+    manifest = read_manifest(path)
+    if manifest is None:
+        raise FileNotFoundError(f"Aucun instantané colonnaire dans {path}")
+    if use_numpy is None:
+        use_numpy = numpy is not None
+
+    def column(name, code, length):
+        filename = os.path.join(path, name)
+        if use_numpy:
+            if length == 0:
+                return numpy.zeros(0, dtype=NUMPY_TYPES[code])
+            return numpy.memmap(filename, dtype=NUMPY_TYPES[code], mode='r', shape=(length,))
+        size = length * array(code).itemsize
+        if size == 0:
+            return memoryview(b'').cast(code)
+        with open(filename, 'rb') as f:
+            mapped = mmap.mmap(f.fileno(), size, access=mmap.ACCESS_READ)
+        return memoryview(mapped).cast(code)
+
+    rows = manifest['rows']
+    columns = {name: column(f"{name}.bin", code, rows) for name, code in FIXED_COLUMNS.items()}
+    for name in TEXT_COLUMNS + ('author_names',):
+        length = rows if name != 'author_names' else manifest['authors'] + 1
+        offsets = column(f"{name}.offsets", OFFSET_TYPE, length + 1)
+        columns[name] = (offsets, column(f"{name}.data", 'B', int(offsets[length])))
+    for name, code in LIST_COLUMNS.items():
+        offsets = column(f"{name}.offsets", OFFSET_TYPE, rows + 1)
+        columns[name] = (offsets, column(f"{name}.values", code, int(offsets[rows])))
+    return Columnar(rows, columns, manifest)
@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+"""Compression des abstracts: zlib avec dictionnaire entraîné sur la collection
+
+Les abstracts sont rangés hors de `articles` (table article_abstracts) et
+compressés un par un, pour être décompressés seulement à l'affichage des
+détails. Un abstract seul (~1 Ko) se compresse mal: zlib n'y trouve que
+ses propres répétitions. Avec un dictionnaire préchargé (mots et tournures
+fréquents de la collection), il référence dès le premier mot le vocabulaire
+commun à tous les abstracts. Si le paquet optionnel `zstandard` est
+installé, le dictionnaire est entraîné et utilisé par zstd.
+"""
+
+import zlib
+from collections import Counter
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+ZLIB = 'zlib'
+ZSTD = 'zstd'
+
+# Abstract compressé sans dictionnaire (aucun entraîné au moment de l'écriture)
+NO_DICTIONARY = 0
+
+# Taille des dictionnaires: la fenêtre de zlib (32 Ko) ne voit pas au-delà
+DICTIONARY_SIZE = 32768
+
+# Abstracts nécessaires pour entraîner un dictionnaire, et échantillon utilisé
+TRAINING_MIN = 1000
+TRAINING_SAMPLES = 2000
+
+# Tournures candidates: de 1 à 4 mots consécutifs
+MAX_PHRASE_WORDS = 4
+
+ZLIB_LEVEL = 6
+ZSTD_LEVEL = 12
+
+
+def default_codec():
+    """Codec des nouveaux dictionnaires: zstd s'il est installé, sinon zlib"""
+    return ZSTD if zstandard is not None else ZLIB
+
+
+def train_dictionary(samples, codec=ZLIB, size=DICTIONARY_SIZE):
+    """Dictionnaire de compression (bytes) entraîné sur une liste d'abstracts
+
+    zlib n'a pas d'entraînement: on garde les tournures qui font gagner le
+    plus d'octets (occurrences × longueur), les plus rentables en fin de
+    dictionnaire, là où zlib les atteint avec les distances les plus courtes.
+    """
+    if codec == ZSTD:
+        return zstandard.train_dictionary(size, [sample.encode('utf-8') for sample in samples]).as_bytes()
+
+    phrases = Counter()
+    for sample in samples:
+        words = sample.split()
+        for n in range(1, MAX_PHRASE_WORDS + 1):
+            for i in range(len(words) - n + 1):
+                phrases[' '.join(words[i:i + n]) + ' '] += 1
+
+    ranked = sorted(((count * len(phrase.encode('utf-8')), phrase)
+                     for phrase, count in phrases.items() if count > 2), reverse=True)
+    chosen = []
+    total = 0
+    for _, phrase in ranked:
+        encoded = phrase.encode('utf-8')
+        if total + len(encoded) > size:
+            continue
+        chosen.append(encoded)
+        total += len(encoded)
+    return b''.join(reversed(chosen))
+
+
+class AbstractCodec:
+    """Compresse et décompresse les abstracts avec les dictionnaires de la base
+    
+    Chaque abstract compressé porte l'id du dictionnaire utilisé
+    (NO_DICTIONARY: zlib seul), qui reste lisible quand un dictionnaire plus
+    récent sert aux nouvelles écritures.
+    """
+    
+    def __init__(self):
+        self.dictionaries = {}
+        self.current = None
+        self.compressors = {}
+    
+    def add(self, dict_id, codec, data):
+        """Enregistre un dictionnaire; le plus récent utilisable sert à compresser"""
+        self.dictionaries[dict_id] = (codec, data)
+        if codec == ZLIB or zstandard is not None:
+            if self.current is None or dict_id > self.current:
+                self.current = dict_id
+    
+    def compress(self, text):
+        """(id du dictionnaire, blob) d'un abstract"""
+        data = (text or '').encode('utf-8')
+        if self.current is None:
+            return NO_DICTIONARY, self.deflate(data)
+        codec, dictionary = self.dictionaries[self.current]
+        compressor = self.compressors.get(self.current)
+        if codec == ZSTD:
+            if compressor is None:
+                compressor = zstandard.ZstdCompressor(
+                    level=ZSTD_LEVEL, dict_data=zstandard.ZstdCompressionDict(dictionary))
+                self.compressors[self.current] = compressor
+            return self.current, compressor.compress(data)
+        # Compresseur amorcé une fois avec le dictionnaire, copié à chaque
+        # abstract (moins cher que de recharger les 32 Ko à chaque fois)
+        if compressor is None:
+            compressor = zlib.compressobj(ZLIB_LEVEL, zlib.DEFLATED, -15, zdict=dictionary)
+            self.compressors[self.current] = compressor
+        compressor = compressor.copy()
+        return self.current, compressor.compress(data) + compressor.flush()
+    
+    def decompress(self, dict_id, blob):
+        """Texte d'un abstract compressé par compress (KeyError si dictionnaire inconnu)"""
+        if blob is None:
+            return None
+        if dict_id == NO_DICTIONARY:
+            return self.inflate(blob).decode('utf-8')
+        codec, dictionary = self.dictionaries[dict_id]
+        if codec == ZSTD:
+            if zstandard is None:
+                raise RuntimeError("Abstract compressé avec zstd: installez le paquet `zstandard`")
+            decompressor = zstandard.ZstdDecompressor(dict_data=zstandard.ZstdCompressionDict(dictionary))
+            return decompressor.decompress(blob).decode('utf-8')
+        return self.inflate(blob, dictionary).decode('utf-8')
+    
+    def deflate(self, data):
+        """Flux deflate brut, sans dictionnaire (ni en-tête ni somme de contrôle zlib)"""
+        compressor = zlib.compressobj(ZLIB_LEVEL, zlib.DEFLATED, -15)
+        return compressor.compress(data) + compressor.flush()
+    
+    def inflate(self, blob, dictionary=None):
+        """Décompresse un flux deflate brut (avec le dictionnaire qui l'a compressé)"""
+        if dictionary:
+            decompressor = zlib.decompressobj(-15, zdict=dictionary)
+        else:
+            decompressor = zlib.decompressobj(-15)
+        return decompressor.decompress(blob) + decompressor.flush()
@@ -0,0 +1,1579 @@
+#!/usr/bin/env python3
+"""Accès à la base SQLite, partagé par le collecteur, la vue tableau et la GUI
+
+Une connexion longue durée par thread (journal WAL, pragmas réglés, cache
+de requêtes préparées) au lieu d'un `sqlite3.connect` par appel. En WAL,
+les lecteurs (GUI, vue tableau) lisent un instantané cohérent et ne sont
+jamais bloqués par une mise à jour en cours. Les transactions d'écriture
+sont explicites (BEGIN IMMEDIATE, voir transaction()).
+"""
+
+import base64
+import json
+import re
+import sqlite3
+import threading
+from collections import Counter, namedtuple
+from contextlib import contextmanager
+from datetime import datetime
+
+from arxiv_authors import author_key, surname_key
+from arxiv_compress import (NO_DICTIONARY, TRAINING_MIN, TRAINING_SAMPLES, AbstractCodec, default_codec,
+                             train_dictionary)
+from arxiv_dedup import DUPLICATE_SIMILARITY, band_keys, signature, similarity
+from arxiv_search import FTS_RANK, document_terms, fts_query, index_terms, similar_query, term_frequencies
+
+DEFAULT_DB_PATH = "arxiv_collection.db"
+
+# Version du schéma, notée dans `PRAGMA user_version` par init_schema: les
+# interfaces qui ouvrent une base plus ancienne la migrent d'abord
+# (à augmenter avec chaque nouvelle migration)
+SCHEMA_VERSION = 2
+
+# Réglages de chaque connexion: WAL (lecteurs et écrivain concurrents),
+# synchronous NORMAL (sûr en WAL: fsync aux checkpoints et non à chaque
+# commit), 64 Mo de cache de pages, 256 Mo de fichier mappé en mémoire
+CONNECTION_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA cache_size=-65536",
+    "PRAGMA mmap_size=268435456",
+    "PRAGMA temp_store=MEMORY",
+)
+
+# Attente maximale (s) du verrou d'écriture tenu par un autre processus
+BUSY_TIMEOUT = 30.0
+
+# Requêtes préparées gardées par connexion (le SQL des filtres ne varie
+# qu'avec la combinaison de filtres, les valeurs passent en paramètres)
+STATEMENT_CACHE_SIZE = 256
+
+# Colonnes d'un article, dans l'ordre historique de `SELECT *` (l'abstract,
+# rangé compressé dans article_abstracts, y est à NULL: voir get_abstract)
+ARTICLE_COLUMNS = ("a.arxiv_id, a.title, a.authors, NULL AS abstract, a.category, a.published, a.updated, "
+                   "a.link, a.pdf_link, a.last_fetched, a.categories, a.first_author, a.author_count, "
+                   "a.year, a.version")
+
+# Auteurs proposés au plus quand un nom en désigne plusieurs
+AUTHOR_CANDIDATES = 20
+
+# Lignes lues par lot pendant la compression des abstracts existants
+MIGRATION_CHUNK_SIZE = 5000
+
+# Index secondaires (filtres et tris des trois interfaces, articles d'un
+# auteur, auteurs par nom normalisé et par nom de famille, articles écrits
+# depuis un export): supprimés pendant un chargement massif, recréés à la fin
+SECONDARY_INDEXES = (
+    ("idx_article_authors_author", "article_authors (author_id, arxiv_id)"),
+    ("idx_authors_key", "authors (key)"),
+    ("idx_authors_surname", "authors (surname, key)"),
+    ("idx_article_categories_keyset", "article_categories (category, published DESC, arxiv_id DESC)"),
+    ("idx_articles_keyset", "articles (published DESC, arxiv_id DESC)"),
+    ("idx_articles_year_keyset", "articles (year, published DESC, arxiv_id DESC)"),
+    ("idx_articles_write_seq", "articles (write_seq)"),
+)
+
+# Chargement massif: pas de fsync (les points de reprise permettent de
+# relancer), 256 Mo de cache, plusieurs pages par transaction
+BULK_PRAGMAS = (
+    "PRAGMA synchronous=OFF",
+    "PRAGMA cache_size=-262144",
+)
+BULK_COMMIT_ROWS = 20000
+
+# Fusions automatiques de l'index plein texte (valeur par défaut de FTS5)
+FTS_AUTOMERGE = 4
+
+# Une page de résultats et le jeton de la suivante (None en fin de liste)
+ResultPage = namedtuple('ResultPage', ['rows', 'token'])
+
+# Statistiques de la collection, lues dans les compteurs
+Stats = namedtuple('Stats', ['total', 'by_category', 'by_year', 'by_month', 'latest'])
+
+# Bilan d'une sauvegarde: nouveaux articles, articles réécrits, articles
+# identiques, identifiants des articles écrits (nouveaux ou réécrits) et,
+# avec `percolate`, nouvelles alertes (voir match_subscriptions; None sinon)
+SaveResult = namedtuple('SaveResult', ['inserted', 'updated', 'unchanged', 'written', 'alerts'],
+                        defaults=(None,))
+
+# Version précédente d'un article: seuls les champs qui diffèrent de la
+# version suivante sont renseignés (None sinon)
+Revision = namedtuple('Revision', ['version', 'updated', 'title', 'abstract', 'authors'])
+
+# Abonnement (recherche enregistrée): critères combinés en ET, None si absents
+Subscription = namedtuple('Subscription', ['id', 'name', 'keywords', 'category', 'author', 'created_at'])
+
+# Alerte: article satisfaisant un abonnement, trouvé à une mise à jour
+Alert = namedtuple('Alert', ['subscription', 'arxiv_id', 'created_at', 'published', 'title'])
+
+# Auteur trouvé par find_authors: id de référence, clé normalisée, nom, articles
+AuthorMatch = namedtuple('AuthorMatch', ['id', 'key', 'name', 'articles'])
+
+# Identifiant versionné: '2511.16644v2', 'math/0601001v1'
+VERSIONED_ID_RE = re.compile(r'^(.+?)v(\d+)$')
+
+
+def encode_token(key):
+    """Jeton de continuation opaque pour une clé de tri (valeurs JSON)"""
+    return base64.urlsafe_b64encode(json.dumps(list(key)).encode()).decode()
+
+
+def decode_token(token):
+    """Clé de tri d'un jeton produit par encode_token"""
+    return json.loads(base64.urlsafe_b64decode(token.encode()))
+
+
+def split_arxiv_id(arxiv_id):
+    """(identifiant de base, version) d'un identifiant arXiv; version None si absente"""
+    match = VERSIONED_ID_RE.match(arxiv_id)
+    if match is None:
+        return arxiv_id, None
+    return match.group(1), int(match.group(2))
+
+
+def split_author_names(authors):
+    """Noms d'auteurs d'une colonne `authors` ("A; B; C"), dans l'ordre"""
+    if not authors:
+        return []
+    return [name.strip() for name in authors.split(';') if name.strip()]
+
+
+def diff_texts(old, new):
+    """Champs (titre, abstract, auteurs) de `old` qui diffèrent de `new`, None sinon"""
+    return tuple(old_value if old_value != new_value else None for old_value, new_value in zip(old, new))
+
+
+class ArxivDatabase:
+    def __init__(self, db_path=DEFAULT_DB_PATH, keep_revisions=True):
+        self.db_path = db_path
+        # Historique compact des versions remplacées (article_revisions)
+        self.keep_revisions = keep_revisions
+        self.local = threading.local()
+        self.codec = None
+        # Chargement massif en cours (bulk_load) et lignes non validées
+        self.bulk = False
+        self.bulk_rows = 0
+    
+    @property
+    def conn(self):
+        """Connexion du thread courant, ouverte au premier usage puis réutilisée"""
+        conn = getattr(self.local, 'conn', None)
+        if conn is None:
+            # isolation_level=None: pas de BEGIN implicite du module sqlite3,
+            # les transactions sont ouvertes par transaction() et snapshot()
+            conn = sqlite3.connect(self.db_path, timeout=BUSY_TIMEOUT, isolation_level=None,
+                                   cached_statements=STATEMENT_CACHE_SIZE)
+            for pragma in CONNECTION_PRAGMAS:
+                conn.execute(pragma)
+            self.local.conn = conn
+        return conn
+    
+    @contextmanager
+    def transaction(self):
+        """Curseur dans une transaction: commit en sortie, rollback sur exception
+        
+        BEGIN IMMEDIATE prend le verrou d'écriture avant la première
+        lecture: ce que la transaction lit (versions en base, textes à
+        retirer de l'index) ne peut pas changer avant son commit. Dans une
+        transaction déjà ouverte (chargement massif), le bloc en fait partie.
+        """
+        conn = self.conn
+        if conn.in_transaction:
+            yield conn.cursor()
+            return
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            yield conn.cursor()
+        except BaseException:
+            conn.rollback()
+            raise
+        conn.commit()
+    
+    @contextmanager
+    def snapshot(self):
+        """Lecture cohérente: les requêtes du bloc voient toutes le même état de la base"""
+        conn = self.conn
+        conn.execute("BEGIN")
+        try:
+            yield conn
+        finally:
+            conn.rollback()
+    
+    def close(self):
+        """Ferme la connexion du thread courant"""
+        conn = getattr(self.local, 'conn', None)
+        if conn is not None:
+            conn.close()
+            self.local.conn = None
+    
+    def init_schema(self):
+        """Crée les tables et index manquants et migre les bases existantes (une transaction)"""
+        with self.transaction() as cursor:
+            self.create_schema(cursor)
+            cursor.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+        self.conn.execute("PRAGMA optimize")
+    
+    def create_schema(self, cursor):
+        """Tables, index et migrations de init_schema"""
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS articles (
+                arxiv_id TEXT PRIMARY KEY,
+                title TEXT,
+                authors TEXT,
+                category TEXT,
+                published DATE,
+                updated DATE,
+                link TEXT,
+                pdf_link TEXT,
+                last_fetched TIMESTAMP,
+                categories TEXT,
+                first_author TEXT,
+                author_count INTEGER,
+                year INTEGER GENERATED ALWAYS AS (CAST(substr(published, 1, 4) AS INTEGER)) VIRTUAL,
+                version INTEGER,
+                write_seq INTEGER NOT NULL DEFAULT 0
+            )
+        ''')
+        
+        # Numéro d'écriture: augmenté par chaque lot écrit, dans sa
+        # transaction (BEGIN IMMEDIATE: un lot à la fois), et recopié dans
+        # les articles écrits (write_seq). Contrairement à last_fetched,
+        # l'ordre des numéros est celui des commits: un export qui a lu
+        # jusqu'au numéro N a vu tout ce qui porte un numéro inférieur
+        cursor.execute("CREATE TABLE IF NOT EXISTS write_sequence (value INTEGER NOT NULL)")
+        if cursor.execute("SELECT 1 FROM write_sequence").fetchone() is None:
+            cursor.execute("INSERT INTO write_sequence (value) VALUES (0)")
+        
+        # Versions remplacées: une ligne par (article, version), avec la date
+        # de la version et, parmi titre/abstract/auteurs, seulement ce qui
+        # diffère de la version suivante (NULL sinon)
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS article_revisions (
+                arxiv_id TEXT,
+                version INTEGER,
+                updated DATE,
+                title TEXT,
+                abstract TEXT,
+                authors TEXT,
+                PRIMARY KEY (arxiv_id, version)
+            ) WITHOUT ROWID
+        ''')
+        
+        # Abstracts compressés, hors de `articles`: les listes ne lisent
+        # que des lignes courtes, l'abstract n'est décompressé qu'à
+        # l'affichage des détails
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS article_abstracts (
+                arxiv_id TEXT PRIMARY KEY,
+                dict_id INTEGER,
+                data BLOB
+            )
+        ''')
+        
+        # Dictionnaires de compression entraînés sur la collection
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS compression_dicts (
+                id INTEGER PRIMARY KEY,
+                codec TEXT,
+                data BLOB,
+                created_at TIMESTAMP
+            )
+        ''')
+        
+        # Catégories de chaque article (primaire + cross-lists), avec la date
+        # de publication recopiée pour lister une catégorie par date
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS article_categories (
+                arxiv_id TEXT,
+                category TEXT,
+                published DATE,
+                PRIMARY KEY (arxiv_id, category)
+            ) WITHOUT ROWID
+        ''')
+        
+        # Auteurs (un nom = une ligne, avec sa clé normalisée et son nom de
+        # famille: voir arxiv_authors) et liens ordonnés article → auteurs
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS authors (
+                id INTEGER PRIMARY KEY,
+                name TEXT NOT NULL UNIQUE COLLATE NOCASE,
+                key TEXT,
+                surname TEXT
+            )
+        ''')
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS article_authors (
+                arxiv_id TEXT,
+                position INTEGER,
+                author_id INTEGER,
+                PRIMARY KEY (arxiv_id, position)
+            ) WITHOUT ROWID
+        ''')
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS fetch_log (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                category TEXT,
+                fetch_date TIMESTAMP,
+                articles_count INTEGER
+            )
+        ''')
+        
+        # Watermark par catégorie: dernières dates published/updated vues
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS sync_state (
+                category TEXT PRIMARY KEY,
+                last_published TIMESTAMP,
+                last_updated TIMESTAMP
+            )
+        ''')
+        
+        # Points de reprise de la collection initiale: une ligne par
+        # (tâche, fenêtre), avec la prochaine page à demander
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS load_checkpoints (
+                task TEXT,
+                window_start TIMESTAMP,
+                window_end TIMESTAMP,
+                next_start INTEGER,
+                total INTEGER,
+                done INTEGER DEFAULT 0,
+                updated_at TIMESTAMP,
+                resumption_token TEXT,
+                PRIMARY KEY (task, window_start)
+            )
+        ''')
+        
+        # Migration: jeton de reprise OAI-PMH des points de reprise
+        columns = [row[1] for row in cursor.execute("PRAGMA table_info(load_checkpoints)")]
+        if 'resumption_token' not in columns:
+            cursor.execute("ALTER TABLE load_checkpoints ADD COLUMN resumption_token TEXT")
+        
+        # Migration: colonne des catégories croisées (cross-lists)
+        columns = [row[1] for row in cursor.execute("PRAGMA table_info(articles)")]
+        if 'categories' not in columns:
+            cursor.execute("ALTER TABLE articles ADD COLUMN categories TEXT")
+            cursor.execute("UPDATE articles SET categories = category")
+        
+        # Migration: noms d'auteurs normalisés (clé et nom de famille)
+        author_columns = [row[1] for row in cursor.execute("PRAGMA table_info(authors)")]
+        if 'key' not in author_columns:
+            cursor.execute("ALTER TABLE authors ADD COLUMN key TEXT")
+            cursor.execute("ALTER TABLE authors ADD COLUMN surname TEXT")
+            self.migrate_author_keys(cursor)
+        
+        # Migration: schéma normalisé (premier auteur précalculé, tables de
+        # liens remplies depuis les colonnes `authors` et `categories`)
+        if 'first_author' not in columns:
+            cursor.execute("ALTER TABLE articles ADD COLUMN first_author TEXT")
+            cursor.execute("ALTER TABLE articles ADD COLUMN author_count INTEGER")
+            self.migrate_links(cursor)
+        
+        # Migration: date de publication dans article_categories
+        link_columns = [row[1] for row in cursor.execute("PRAGMA table_info(article_categories)")]
+        if 'published' not in link_columns:
+            cursor.execute("DROP INDEX IF EXISTS idx_article_categories_category")
+            cursor.execute("ALTER TABLE article_categories ADD COLUMN published DATE")
+            cursor.execute('''
+                UPDATE article_categories SET published =
+                    (SELECT published FROM articles WHERE articles.arxiv_id = article_categories.arxiv_id)
+            ''')
+        
+        # Migration: année de publication (colonne générée, ajoutable en VIRTUAL seulement)
+        columns = [row[1] for row in cursor.execute("PRAGMA table_xinfo(articles)")]
+        if 'year' not in columns:
+            cursor.execute("ALTER TABLE articles ADD COLUMN year INTEGER "
+                           "GENERATED ALWAYS AS (CAST(substr(published, 1, 4) AS INTEGER)) VIRTUAL")
+        
+        # Migration: numéro d'écriture (0 pour les articles déjà en base),
+        # qui remplace last_fetched pour les exports incrémentaux
+        if 'write_seq' not in columns:
+            cursor.execute("ALTER TABLE articles ADD COLUMN write_seq INTEGER NOT NULL DEFAULT 0")
+            cursor.execute("DROP INDEX IF EXISTS idx_articles_last_fetched")
+        
+        # Index des filtres et tris des trois interfaces: catégorie par date,
+        # liste par date, année par date. L'arxiv_id final rend l'ordre total,
+        # pour la pagination par clé (published, arxiv_id). Index des auteurs
+        # pour lister les articles d'un auteur
+        for index in ('idx_article_categories_recent', 'idx_articles_published', 'idx_articles_year'):
+            cursor.execute(f"DROP INDEX IF EXISTS {index}")
+        self.create_indexes(cursor)
+        
+        # Compteurs des statistiques, tenus à jour par save_articles:
+        # articles par catégorie (cross-lists comprises) et par mois de
+        # publication ('YYYY-MM'); recalculés s'ils viennent d'être créés
+        stats_exist = cursor.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'stats_months'"
+        ).fetchone()
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS stats_categories (
+                category TEXT PRIMARY KEY,
+                articles INTEGER NOT NULL DEFAULT 0
+            )
+        ''')
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS stats_months (
+                month TEXT PRIMARY KEY,
+                articles INTEGER NOT NULL DEFAULT 0
+            )
+        ''')
+        if not stats_exist:
+            self.rebuild_stats(cursor)
+        
+        # Migration: identifiant de base comme clé, version dans sa colonne
+        # (une ligne par article au lieu d'une par version)
+        columns = [row[1] for row in cursor.execute("PRAGMA table_xinfo(articles)")]
+        if 'version' not in columns:
+            cursor.execute("ALTER TABLE articles ADD COLUMN version INTEGER")
+            self.migrate_versions(cursor)
+        
+        # Migration: abstracts compressés dans article_abstracts (l'ancien
+        # index plein texte, adossé à la colonne, est remplacé)
+        if 'abstract' in columns:
+            self.migrate_abstracts(cursor)
+        
+        # Index plein texte (titre, abstract, auteurs) sans contenu stocké:
+        # tenu à jour par write_batch (l'abstract n'est plus dans `articles`),
+        # reconstruit s'il vient d'être créé
+        fts_exists = cursor.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'articles_fts'"
+        ).fetchone()
+        cursor.execute('''
+            CREATE VIRTUAL TABLE IF NOT EXISTS articles_fts USING fts5(
+                title, abstract, authors,
+                content='',
+                tokenize='unicode61 remove_diacritics 2', prefix='2 3'
+            )
+        ''')
+        
+        if not fts_exists:
+            self.rebuild_fts(cursor)
+        
+        # Nombre d'articles contenant chaque terme de l'index (recherche
+        # d'articles proches), tenu à jour comme les autres compteurs;
+        # relu dans l'index s'il vient d'être créé
+        terms_exist = cursor.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'stats_terms'"
+        ).fetchone()
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS stats_terms (
+                term TEXT PRIMARY KEY,
+                articles INTEGER NOT NULL DEFAULT 0
+            ) WITHOUT ROWID
+        ''')
+        if not terms_exist:
+            self.rebuild_term_stats(cursor)
+        
+        # Quasi-doublons: signature MinHash de chaque article, seaux de ses
+        # bandes (index LSH) et paires détectées à l'écriture (dans les deux
+        # sens); calculés pour toute la collection s'ils viennent d'être créés
+        signatures_exist = cursor.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'article_signatures'"
+        ).fetchone()
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS article_signatures (
+                arxiv_id TEXT PRIMARY KEY,
+                signature BLOB NOT NULL
+            ) WITHOUT ROWID
+        ''')
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS signature_bands (
+                bucket INTEGER,
+                arxiv_id TEXT,
+                PRIMARY KEY (bucket, arxiv_id)
+            ) WITHOUT ROWID
+        ''')
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS article_duplicates (
+                arxiv_id TEXT,
+                duplicate_id TEXT,
+                similarity REAL,
+                PRIMARY KEY (arxiv_id, duplicate_id)
+            ) WITHOUT ROWID
+        ''')
+        if not signatures_exist:
+            self.migrate_signatures(cursor)
+        
+        # Abonnements (mots-clés, catégorie, auteur) évalués sur chaque lot
+        # d'une mise à jour, et alertes trouvées (une par article et abonnement)
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS subscriptions (
+                id INTEGER PRIMARY KEY,
+                name TEXT NOT NULL UNIQUE,
+                keywords TEXT,
+                category TEXT,
+                author TEXT,
+                created_at TIMESTAMP
+            )
+        ''')
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS alerts (
+                subscription_id INTEGER,
+                arxiv_id TEXT,
+                created_at TIMESTAMP,
+                PRIMARY KEY (subscription_id, arxiv_id)
+            ) WITHOUT ROWID
+        ''')
+        
+        # Chargements massifs commencés: une ligne tant que leur fin
+        # (index, fusion de l'index plein texte) n'a pas eu lieu; un
+        # chargement interrompu par un arrêt brutal est terminé ici
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS bulk_loads (
+                id INTEGER PRIMARY KEY,
+                started_at TIMESTAMP
+            )
+        ''')
+        if cursor.execute("SELECT 1 FROM bulk_loads").fetchone():
+            self.create_indexes(cursor)
+            self.merge_fts(cursor)
+            cursor.execute("DELETE FROM bulk_loads")
+    
+    def ensure_schema(self):
+        """Migre la base si son schéma est antérieur à SCHEMA_VERSION
+        
+        Pour les interfaces de consultation: une lecture de user_version
+        quand la base est à jour, init_schema sinon (base créée par une
+        version antérieure du collecteur).
+        """
+        version = self.conn.execute("PRAGMA user_version").fetchone()[0]
+        if version < SCHEMA_VERSION:
+            print("🔧 Mise à niveau du schéma de la base...")
+            self.init_schema()
+    
+    def create_indexes(self, cursor):
+        """Crée les index secondaires manquants (SECONDARY_INDEXES)"""
+        for name, definition in SECONDARY_INDEXES:
+            cursor.execute(f"CREATE INDEX IF NOT EXISTS {name} ON {definition}")
+    
+    @contextmanager
+    def bulk_load(self):
+        """Mode chargement massif, pour la collection initiale et les imports
+        
+        Pendant le bloc: index secondaires supprimés, fusions de l'index
+        plein texte différées (automerge=0), synchronous=OFF et une
+        transaction toutes les BULK_COMMIT_ROWS lignes (pages et points de
+        reprise validés ensemble). En sortie: index recréés, index plein
+        texte fusionné en une passe, ANALYZE. Sur exception, la transaction
+        en cours est annulée avant la reconstruction; après un arrêt brutal,
+        init_schema termine le chargement et les points de reprise
+        indiquent où reprendre.
+        """
+        conn = self.conn
+        with self.transaction() as cursor:
+            cursor.execute("INSERT INTO bulk_loads (started_at) VALUES (?)", (datetime.now(),))
+            cursor.execute("INSERT INTO articles_fts (articles_fts, rank) VALUES ('automerge', 0)")
+            for name, _ in SECONDARY_INDEXES:
+                cursor.execute(f"DROP INDEX IF EXISTS {name}")
+        for pragma in BULK_PRAGMAS:
+            conn.execute(pragma)
+        self.bulk = True
+        self.bulk_rows = 0
+        try:
+            yield self
+            conn.commit()
+        except BaseException:
+            conn.rollback()
+            raise
+        finally:
+            self.bulk = False
+            self.finish_bulk_load()
+    
+    def finish_bulk_load(self):
+        """Fin d'un chargement massif: index, plein texte, statistiques du planificateur"""
+        print("🔧 Reconstruction des index...")
+        conn = self.conn
+        with self.transaction() as cursor:
+            self.create_indexes(cursor)
+            self.merge_fts(cursor)
+            cursor.execute("DELETE FROM bulk_loads")
+        for pragma in CONNECTION_PRAGMAS:
+            conn.execute(pragma)
+        conn.execute("ANALYZE")
+    
+    def migrate_links(self, cursor):
+        """Remplit first_author, author_count et les tables de liens des articles existants"""
+        rows = cursor.execute("SELECT arxiv_id, authors, COALESCE(categories, category), published "
+                              "FROM articles").fetchall()
+        links = []
+        for arxiv_id, authors, categories, published in rows:
+            names = split_author_names(authors)
+            links.append((arxiv_id, names, (categories or "").split(), published))
+            cursor.execute("UPDATE articles SET first_author = ?, author_count = ? WHERE arxiv_id = ?",
+                           (names[0] if names else None, len(names), arxiv_id))
+        self.write_links(cursor, links)
+        if rows:
+            print(f"🔧 Migration: {len(rows)} articles indexés par catégorie et par auteur")
+    
+    def migrate_author_keys(self, cursor):
+        """Calcule la clé normalisée et le nom de famille des auteurs existants"""
+        keys = []
+        for author_id, name in cursor.execute("SELECT id, name FROM authors").fetchall():
+            key = author_key(name)
+            keys.append((key, surname_key(key), author_id))
+        cursor.executemany("UPDATE authors SET key = ?, surname = ? WHERE id = ?", keys)
+        if keys:
+            print(f"🔧 Migration: {len(keys)} noms d'auteurs normalisés")
+    
+    def migrate_versions(self, cursor):
+        """Regroupe les lignes 'idvN' d'un même article sous son identifiant de base
+        
+        La version la plus récente est gardée (renommée, version renseignée,
+        liens sans version); les autres deviennent des révisions compactes
+        puis sont supprimées. Liens et compteurs sont ensuite refaits.
+        """
+        groups = {}
+        for rowid, arxiv_id, updated in cursor.execute("SELECT rowid, arxiv_id, updated FROM articles").fetchall():
+            base_id, version = split_arxiv_id(arxiv_id)
+            groups.setdefault(base_id, []).append((version or 1, updated or '', rowid))
+        if not groups:
+            return
+        
+        renamed = []
+        removed = []
+        revisions = []
+        for base_id, rows in groups.items():
+            rows.sort()
+            version, _, rowid = rows[-1]
+            renamed.append((base_id, version, f"https://arxiv.org/abs/{base_id}",
+                            f"https://arxiv.org/pdf/{base_id}.pdf", rowid))
+            if len(rows) == 1:
+                continue
+            # Chaque version remplacée est comparée à la suivante
+            texts = {rowid: (title, abstract, authors) for rowid, title, abstract, authors in cursor.execute(
+                "SELECT rowid, title, abstract, authors FROM articles WHERE rowid IN (SELECT value FROM json_each(?))",
+                (json.dumps([row[2] for row in rows]),))}
+            newer = rows[-1]
+            for old in reversed(rows[:-1]):
+                removed.append((old[2],))
+                if self.keep_revisions and old[0] < newer[0]:
+                    revisions.append((base_id, old[0], old[1] or None)
+                                     + diff_texts(texts[old[2]], texts[newer[2]]))
+                    newer = old
+        
+        cursor.executemany("DELETE FROM articles WHERE rowid = ?", removed)
+        cursor.executemany("INSERT OR IGNORE INTO article_revisions "
+                           "(arxiv_id, version, updated, title, abstract, authors) VALUES (?, ?, ?, ?, ?, ?)",
+                           revisions)
+        cursor.executemany("UPDATE articles SET arxiv_id = ?, version = ?, link = ?, pdf_link = ? WHERE rowid = ?",
+                           renamed)
+        cursor.execute("DELETE FROM article_categories")
+        cursor.execute("DELETE FROM article_authors")
+        self.migrate_links(cursor)
+        self.rebuild_stats(cursor)
+        if removed:
+            print(f"🔧 Migration: {len(removed)} versions en double regroupées, {len(renamed)} articles uniques")
+    
+    def migrate_abstracts(self, cursor):
+        """Déplace les abstracts de la colonne `articles.abstract` vers article_abstracts
+        
+        Un dictionnaire est d'abord entraîné sur un échantillon, puis les
+        abstracts sont compressés par lots. L'ancien index plein texte
+        (adossé à la colonne) et ses triggers sont supprimés avec elle;
+        init_schema reconstruit l'index ensuite.
+        """
+        samples = [abstract for abstract, in cursor.execute(
+            "SELECT abstract FROM articles WHERE abstract <> '' ORDER BY random() LIMIT ?", (TRAINING_SAMPLES,)
+        ).fetchall()]
+        self.train_abstract_dictionary(cursor, samples)
+        codec = self.load_codec()
+        
+        reader = self.conn.execute("SELECT arxiv_id, abstract FROM articles")
+        moved = 0
+        while True:
+            rows = reader.fetchmany(MIGRATION_CHUNK_SIZE)
+            if not rows:
+                break
+            cursor.executemany("INSERT OR REPLACE INTO article_abstracts (arxiv_id, dict_id, data) VALUES (?, ?, ?)",
+                               [(arxiv_id,) + codec.compress(abstract) for arxiv_id, abstract in rows])
+            moved += len(rows)
+        
+        for trigger in ('articles_fts_insert', 'articles_fts_delete', 'articles_fts_update'):
+            cursor.execute(f"DROP TRIGGER IF EXISTS {trigger}")
+        cursor.execute("DROP TABLE IF EXISTS articles_fts")
+        cursor.execute("ALTER TABLE articles DROP COLUMN abstract")
+        if moved:
+            print(f"🔧 Migration: {moved} abstracts compressés dans article_abstracts")
+    
+    def migrate_signatures(self, cursor):
+        """Signatures MinHash et quasi-doublons des articles déjà en base, par lots"""
+        reader = self.conn.execute('''
+            SELECT a.arxiv_id, a.title, x.dict_id, x.data
+            FROM articles a LEFT JOIN article_abstracts x ON x.arxiv_id = a.arxiv_id
+        ''')
+        signed = 0
+        while True:
+            rows = reader.fetchmany(MIGRATION_CHUNK_SIZE)
+            if not rows:
+                break
+            terms = {arxiv_id: index_terms(f"{title or ''} {self.unpack_abstract(dict_id, data) or ''}")
+                     for arxiv_id, title, dict_id, data in rows}
+            self.write_signatures(cursor, terms)
+            signed += len(rows)
+        if signed:
+            duplicates = cursor.execute("SELECT COUNT(*) FROM article_duplicates").fetchone()[0] // 2
+            print(f"🔧 Migration: {signed} signatures MinHash, {duplicates} paires de quasi-doublons")
+    
+    def rebuild_fts(self, cursor):
+        """Réindexe tous les articles dans articles_fts (abstracts décompressés)"""
+        cursor.execute("INSERT INTO articles_fts (articles_fts) VALUES ('delete-all')")
+        reader = self.conn.execute('''
+            SELECT a.rowid, a.title, x.dict_id, x.data, a.authors
+            FROM articles a LEFT JOIN article_abstracts x ON x.arxiv_id = a.arxiv_id
+        ''')
+        while True:
+            rows = reader.fetchmany(MIGRATION_CHUNK_SIZE)
+            if not rows:
+                break
+            cursor.executemany("INSERT INTO articles_fts (rowid, title, abstract, authors) VALUES (?, ?, ?, ?)",
+                               [(rowid, title, self.unpack_abstract(dict_id, data), authors)
+                                for rowid, title, dict_id, data, authors in rows])
+    
+    def merge_fts(self, cursor):
+        """Fusionne les segments de l'index plein texte et rétablit les fusions automatiques"""
+        cursor.execute("INSERT INTO articles_fts (articles_fts) VALUES ('optimize')")
+        cursor.execute("INSERT INTO articles_fts (articles_fts, rank) VALUES ('automerge', ?)", (FTS_AUTOMERGE,))
+    
+    def load_codec(self, reload=False):
+        """Codec des abstracts (AbstractCodec), dictionnaires lus une fois"""
+        if self.codec is None or reload:
+            codec = AbstractCodec()
+            for dict_id, name, data in self.conn.execute(
+                    "SELECT id, codec, data FROM compression_dicts ORDER BY id").fetchall():
+                codec.add(dict_id, name, data)
+            self.codec = codec
+        return self.codec
+    
+    def unpack_abstract(self, dict_id, data):
+        """Texte d'un abstract compressé (dictionnaires relus si un autre processus en a ajouté)"""
+        codec = self.load_codec()
+        if dict_id not in (None, NO_DICTIONARY) and dict_id not in codec.dictionaries:
+            codec = self.load_codec(reload=True)
+        return codec.decompress(dict_id, data)
+    
+    def train_abstract_dictionary(self, cursor, samples=None):
+        """Entraîne un dictionnaire de compression, renvoie False si trop peu d'abstracts
+        
+        Sans `samples`, l'échantillon est tiré des abstracts en base. Les
+        abstracts compressés sans dictionnaire sont recompressés avec lui.
+        """
+        if samples is None:
+            samples = [self.unpack_abstract(dict_id, data) for dict_id, data in cursor.execute(
+                "SELECT dict_id, data FROM article_abstracts ORDER BY random() LIMIT ?", (TRAINING_SAMPLES,)
+            ).fetchall()]
+        samples = [sample for sample in samples if sample]
+        if len(samples) < TRAINING_MIN:
+            return False
+        
+        name = default_codec()
+        data = train_dictionary(samples, name)
+        cursor.execute("INSERT INTO compression_dicts (codec, data, created_at) VALUES (?, ?, ?)",
+                       (name, data, datetime.now()))
+        codec = self.load_codec()
+        codec.add(cursor.lastrowid, name, data)
+        
+        rows = cursor.execute("SELECT arxiv_id, data FROM article_abstracts WHERE dict_id = ?",
+                              (NO_DICTIONARY,)).fetchall()
+        cursor.executemany("UPDATE article_abstracts SET dict_id = ?, data = ? WHERE arxiv_id = ?",
+                           [codec.compress(codec.decompress(NO_DICTIONARY, blob)) + (arxiv_id,)
+                            for arxiv_id, blob in rows])
+        return True
+    
+    def save_articles(self, articles, checkpoint=None, percolate=False):
+        """Sauvegarde les articles dans la base de données, renvoie un SaveResult
+        
+        Un seul `executemany` d'upsert dans une transaction, une ligne par
+        identifiant de base: un article déjà en base n'est réécrit que si son
+        numéro de version est plus grand, ou, à numéro égal, si son `updated`
+        est plus récent ou ses catégories ont changé; une version plus
+        ancienne ne remplace jamais la ligne (ni ses catégories). Sinon la
+        ligne (et `last_fetched`) reste intacte. La
+        version remplacée est gardée dans article_revisions (ce qui a changé
+        seulement) si `keep_revisions`. Abstracts compressés, liens
+        catégories/auteurs et index plein texte des articles écrits sont mis
+        à jour dans la même transaction. `articles` peut être un générateur.
+        Si `checkpoint` (Checkpoint) est fourni, le point de reprise est écrit
+        dans la même transaction que la page. Avec `percolate`, les
+        abonnements sont évalués sur les articles écrits et leurs alertes
+        enregistrées dans cette transaction aussi: une page validée a ses
+        alertes, même si le processus s'arrête juste après. En chargement
+        massif (bulk_load), la transaction regroupe plusieurs pages.
+        """
+        now = datetime.now()
+        batch = {}
+        sources = {}
+        for article in articles:
+            if percolate:
+                sources[article['arxiv_id']] = article
+            names = split_author_names(article['authors'])
+            batch[article['arxiv_id']] = ((
+                article['arxiv_id'],
+                article['title'],
+                article['authors'],
+                article['category'],
+                " ".join(article['categories']),
+                str(article['published']),
+                str(article['updated']),
+                article['link'],
+                article['pdf_link'],
+                now,
+                names[0] if names else None,
+                len(names),
+                article['version']
+            ), article['abstract'], names, article['categories'])
+        
+        try:
+            if self.bulk:
+                # Plusieurs pages par transaction, validée tous les BULK_COMMIT_ROWS
+                if not self.conn.in_transaction:
+                    self.conn.execute("BEGIN IMMEDIATE")
+                result = self.write_batch(self.conn.cursor(), batch, checkpoint)
+                if percolate:
+                    result = result._replace(alerts=self.match_subscriptions(
+                        sources[arxiv_id] for arxiv_id in result.written))
+                self.bulk_rows += len(batch)
+                if self.bulk_rows >= BULK_COMMIT_ROWS:
+                    self.conn.commit()
+                    self.bulk_rows = 0
+            else:
+                with self.transaction() as cursor:
+                    result = self.write_batch(cursor, batch, checkpoint)
+                    if percolate:
+                        result = result._replace(alerts=self.match_subscriptions(
+                            sources[arxiv_id] for arxiv_id in result.written))
+            
+            # Premier dictionnaire dès que la collection a assez d'abstracts
+            if result.inserted and self.load_codec().current is None:
+                with self.transaction() as cursor:
+                    cursor.execute("SELECT COUNT(*) FROM article_abstracts")
+                    if cursor.fetchone()[0] >= TRAINING_MIN:
+                        self.train_abstract_dictionary(cursor)
+        except Exception:
+            # Un dictionnaire annulé avec la transaction ne doit pas servir
+            self.codec = None
+            raise
+        return result
+    
+    def write_batch(self, cursor, batch, checkpoint=None):
+        """Écrit un lot préparé par save_articles: {arxiv_id: (ligne, abstract, auteurs, catégories)}"""
+        # Version en base des articles du lot (ids passés en un seul
+        # paramètre JSON: une seule requête préparée quelle que soit la
+        # taille du lot); seuls les nouveaux et les modifiés sont écrits
+        cursor.execute("SELECT arxiv_id, updated, categories, published, version FROM articles "
+                       "WHERE arxiv_id IN (SELECT value FROM json_each(?))", (json.dumps(list(batch)),))
+        stored = {arxiv_id: (updated, categories, published, version)
+                  for arxiv_id, updated, categories, published, version in cursor}
+        
+        # Variations des compteurs de statistiques: +1 pour la version
+        # écrite, -1 pour celle qu'elle remplace
+        category_deltas = {}
+        month_deltas = {}
+        changed = []
+        revised = []
+        inserted = 0
+        for arxiv_id, entry in batch.items():
+            row = entry[0]
+            known = stored.get(arxiv_id)
+            newer = known is not None and (row[12] or 0) > (known[3] or 0)
+            if known is None:
+                inserted += 1
+            elif not (newer or (row[12] or 0) == (known[3] or 0)
+                      and (row[6] > (known[0] or '') or row[4] != known[1])):
+                # Version plus ancienne (même avec d'autres catégories), ou identique
+                continue
+            else:
+                if newer and known[3]:
+                    revised.append((arxiv_id, known[3], known[0]))
+                for category in (known[1] or "").split():
+                    category_deltas[category] = category_deltas.get(category, 0) - 1
+                month = (known[2] or "")[:7]
+                month_deltas[month] = month_deltas.get(month, 0) - 1
+            for category in dict.fromkeys(entry[3]):
+                category_deltas[category] = category_deltas.get(category, 0) + 1
+            month = row[5][:7]
+            month_deltas[month] = month_deltas.get(month, 0) + 1
+            changed.append(entry)
+        
+        # Textes en base des articles réécrits: version remplacée à
+        # archiver, index plein texte à corriger s'ils ont changé
+        old_texts = self.read_texts(cursor, [row[0] for row, _, _, _ in changed if row[0] in stored])
+        if self.keep_revisions and revised:
+            self.write_revisions(cursor, revised, batch, old_texts)
+        
+        if changed:
+            cursor.execute("UPDATE write_sequence SET value = value + 1")
+        cursor.executemany('''
+            INSERT INTO articles
+            (arxiv_id, title, authors, category, categories, published, updated, link, pdf_link,
+             last_fetched, first_author, author_count, version, write_seq)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, (SELECT value FROM write_sequence))
+            ON CONFLICT(arxiv_id) DO UPDATE SET
+                title = excluded.title,
+                authors = excluded.authors,
+                category = excluded.category,
+                categories = excluded.categories,
+                published = excluded.published,
+                updated = excluded.updated,
+                link = excluded.link,
+                pdf_link = excluded.pdf_link,
+                last_fetched = excluded.last_fetched,
+                first_author = excluded.first_author,
+                author_count = excluded.author_count,
+                version = excluded.version,
+                write_seq = excluded.write_seq
+            WHERE COALESCE(excluded.version, 0) > COALESCE(articles.version, 0)
+               OR (COALESCE(excluded.version, 0) = COALESCE(articles.version, 0)
+                   AND (excluded.updated > articles.updated
+                        OR excluded.categories IS NOT articles.categories))
+        ''', [row for row, _, _, _ in changed])
+        # Termes du titre et de l'abstract des articles dont ce texte a
+        # changé, découpés une fois pour les compteurs et les signatures
+        terms = {row[0]: index_terms(f"{row[1] or ''} {abstract or ''}") for row, abstract, _, _ in changed
+                 if row[0] not in old_texts or old_texts[row[0]][1:3] != (row[1], abstract)}
+        self.write_texts(cursor, changed, old_texts, terms)
+        self.write_signatures(cursor, terms)
+        self.write_links(cursor, [(row[0], names, categories, row[5]) for row, _, names, categories in changed])
+        self.apply_stats_deltas(cursor, category_deltas, month_deltas)
+        
+        if checkpoint is not None:
+            cursor.execute('''
+                INSERT OR REPLACE INTO load_checkpoints
+                (task, window_start, window_end, next_start, total, done, updated_at, resumption_token)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+            ''', (checkpoint.task, checkpoint.window_start, checkpoint.window_end, checkpoint.next_start,
+                  checkpoint.total, int(checkpoint.done), datetime.now(), checkpoint.resumption_token))
+        
+        return SaveResult(inserted, len(changed) - inserted, len(batch) - len(changed),
+                          frozenset(row[0] for row, _, _, _ in changed))
+    
+    def read_texts(self, cursor, ids):
+        """{arxiv_id: (rowid, titre, abstract décompressé, auteurs)} des articles `ids` en base"""
+        if not ids:
+            return {}
+        rows = cursor.execute('''
+            SELECT a.arxiv_id, a.rowid, a.title, x.dict_id, x.data, a.authors
+            FROM articles a LEFT JOIN article_abstracts x ON x.arxiv_id = a.arxiv_id
+            WHERE a.arxiv_id IN (SELECT value FROM json_each(?))
+        ''', (json.dumps(ids),)).fetchall()
+        return {arxiv_id: (rowid, title, self.unpack_abstract(dict_id, data), authors)
+                for arxiv_id, rowid, title, dict_id, data, authors in rows}
+    
+    def write_texts(self, cursor, changed, old_texts, terms):
+        """Abstracts compressés et index plein texte des articles écrits
+        
+        Un article réécrit n'est réindexé que si son titre, son abstract ou
+        ses auteurs ont changé; l'index ne stockant pas le texte, l'ancienne
+        entrée est retirée avec ses valeurs exactes (`old_texts`). `terms`:
+        termes du titre et de l'abstract découpés par write_batch.
+        """
+        codec = self.load_codec()
+        abstracts = []
+        removed = []
+        indexed = []
+        new_ids = []
+        for row, abstract, _, _ in changed:
+            old = old_texts.get(row[0])
+            if old is None:
+                new_ids.append(row[0])
+                abstracts.append((row[0],) + codec.compress(abstract))
+            elif old[1:] != (row[1], abstract, row[2]):
+                if old[2] != abstract:
+                    abstracts.append((row[0],) + codec.compress(abstract))
+                removed.append(old)
+                indexed.append((old[0], row[1], abstract, row[2]))
+        
+        if new_ids:
+            rowids = dict(cursor.execute("SELECT arxiv_id, rowid FROM articles "
+                                         "WHERE arxiv_id IN (SELECT value FROM json_each(?))",
+                                         (json.dumps(new_ids),)).fetchall())
+            indexed.extend((rowids[row[0]], row[1], abstract, row[2])
+                           for row, abstract, _, _ in changed if row[0] not in old_texts)
+        
+        cursor.executemany("INSERT OR REPLACE INTO article_abstracts (arxiv_id, dict_id, data) VALUES (?, ?, ?)",
+                           abstracts)
+        cursor.executemany("INSERT INTO articles_fts (articles_fts, rowid, title, abstract, authors) "
+                           "VALUES ('delete', ?, ?, ?, ?)", removed)
+        cursor.executemany("INSERT INTO articles_fts (rowid, title, abstract, authors) VALUES (?, ?, ?, ?)",
+                           indexed)
+        
+        # Compteurs des termes: -1 pour l'entrée retirée, +1 pour la nouvelle
+        term_deltas = Counter()
+        for _, title, abstract, authors in removed:
+            term_deltas.subtract(document_terms(title, abstract, authors))
+        for row, abstract, _, _ in changed:
+            old = old_texts.get(row[0])
+            if old is not None and old[1:] == (row[1], abstract, row[2]):
+                continue
+            if row[0] in terms:
+                term_deltas.update(set(terms[row[0]]).union(index_terms(row[2])))
+            else:
+                term_deltas.update(document_terms(row[1], abstract, row[2]))
+        cursor.executemany('''
+            INSERT INTO stats_terms (term, articles) VALUES (?, ?)
+            ON CONFLICT(term) DO UPDATE SET articles = articles + excluded.articles
+        ''', [(term, delta) for term, delta in term_deltas.items() if delta])
+    
+    def write_revisions(self, cursor, revised, batch, old_texts):
+        """Archive les versions remplacées [(arxiv_id, version, updated)] avant réécriture
+        
+        Titre, abstract et auteurs (`old_texts`, voir read_texts) ne sont
+        gardés que s'ils diffèrent de la nouvelle version.
+        """
+        rows = []
+        for arxiv_id, version, updated in revised:
+            row, abstract, _, _ = batch[arxiv_id]
+            rows.append((arxiv_id, version, updated)
+                        + diff_texts(old_texts[arxiv_id][1:], (row[1], abstract, row[2])))
+        cursor.executemany("INSERT OR REPLACE INTO article_revisions "
+                           "(arxiv_id, version, updated, title, abstract, authors) VALUES (?, ?, ?, ?, ?, ?)",
+                           rows)
+    
+    def apply_stats_deltas(self, cursor, category_deltas, month_deltas):
+        """Ajoute les variations {catégorie: n} et {mois: n} aux compteurs"""
+        cursor.executemany('''
+            INSERT INTO stats_categories (category, articles) VALUES (?, ?)
+            ON CONFLICT(category) DO UPDATE SET articles = articles + excluded.articles
+        ''', [(category, delta) for category, delta in category_deltas.items() if delta])
+        cursor.executemany('''
+            INSERT INTO stats_months (month, articles) VALUES (?, ?)
+            ON CONFLICT(month) DO UPDATE SET articles = articles + excluded.articles
+        ''', [(month, delta) for month, delta in month_deltas.items() if delta])
+    
+    def rebuild_stats(self, cursor=None):
+        """Recalcule les compteurs de statistiques depuis les tables d'articles"""
+        if cursor is None:
+            with self.transaction() as cursor:
+                return self.rebuild_stats(cursor)
+        cursor.execute("DELETE FROM stats_categories")
+        cursor.execute('''
+            INSERT INTO stats_categories (category, articles)
+            SELECT category, COUNT(*) FROM article_categories GROUP BY category
+        ''')
+        cursor.execute("DELETE FROM stats_months")
+        cursor.execute('''
+            INSERT INTO stats_months (month, articles)
+            SELECT substr(published, 1, 7), COUNT(*) FROM articles GROUP BY substr(published, 1, 7)
+        ''')
+    
+    def write_signatures(self, cursor, terms):
+        """Signatures MinHash et quasi-doublons des articles écrits
+        
+        `terms`: {arxiv_id: termes du titre et de l'abstract}. Les anciens seaux et paires d'un article réécrit sont d'abord
+        retirés. Seuls les articles qui partagent un seau avec un article
+        du lot (lot compris) sont comparés: le coût suit la taille du lot,
+        pas celle de la collection.
+        """
+        if not terms:
+            return
+        ids = json.dumps(list(terms))
+        old = cursor.execute("SELECT arxiv_id, signature FROM article_signatures "
+                             "WHERE arxiv_id IN (SELECT value FROM json_each(?))", (ids,)).fetchall()
+        cursor.executemany("DELETE FROM signature_bands WHERE bucket = ? AND arxiv_id = ?",
+                           [(bucket, arxiv_id) for arxiv_id, old_signature in old
+                            for bucket in band_keys(old_signature)])
+        pairs = cursor.execute("SELECT arxiv_id, duplicate_id FROM article_duplicates "
+                               "WHERE arxiv_id IN (SELECT value FROM json_each(?))", (ids,)).fetchall()
+        cursor.executemany("DELETE FROM article_duplicates WHERE arxiv_id = ? AND duplicate_id = ?",
+                           pairs + [(duplicate_id, arxiv_id) for arxiv_id, duplicate_id in pairs])
+        cursor.execute("DELETE FROM article_signatures WHERE arxiv_id IN (SELECT value FROM json_each(?))", (ids,))
+        
+        signatures = {}
+        buckets = {}
+        for arxiv_id, words in terms.items():
+            article_signature = signature(words)
+            if article_signature is None:
+                continue
+            signatures[arxiv_id] = article_signature
+            for bucket in band_keys(article_signature):
+                buckets.setdefault(bucket, []).append(arxiv_id)
+        cursor.executemany("INSERT INTO article_signatures (arxiv_id, signature) VALUES (?, ?)", signatures.items())
+        cursor.executemany("INSERT OR IGNORE INTO signature_bands (bucket, arxiv_id) VALUES (?, ?)",
+                           [(bucket, arxiv_id) for bucket, members in buckets.items() for arxiv_id in members])
+        
+        # Candidats: même seau qu'un article du lot
+        candidates = set()
+        for bucket, other in cursor.execute("SELECT bucket, arxiv_id FROM signature_bands "
+                                            "WHERE bucket IN (SELECT value FROM json_each(?))",
+                                            (json.dumps(list(buckets)),)):
+            candidates.update((arxiv_id, other) for arxiv_id in buckets[bucket] if arxiv_id != other)
+        if not candidates:
+            return
+        others = {other for _, other in candidates if other not in signatures}
+        stored = dict(cursor.execute("SELECT arxiv_id, signature FROM article_signatures "
+                                     "WHERE arxiv_id IN (SELECT value FROM json_each(?))",
+                                     (json.dumps(list(others)),)))
+        stored.update(signatures)
+        duplicates = []
+        for arxiv_id, other in candidates:
+            score = similarity(signatures[arxiv_id], stored[other])
+            if score >= DUPLICATE_SIMILARITY:
+                duplicates.extend([(arxiv_id, other, score), (other, arxiv_id, score)])
+        cursor.executemany("INSERT OR REPLACE INTO article_duplicates (arxiv_id, duplicate_id, similarity) "
+                           "VALUES (?, ?, ?)", duplicates)
+    
+    def rebuild_term_stats(self, cursor=None):
+        """Recalcule stats_terms depuis le vocabulaire de l'index plein texte"""
+        if cursor is None:
+            with self.transaction() as cursor:
+                return self.rebuild_term_stats(cursor)
+        cursor.execute("CREATE VIRTUAL TABLE IF NOT EXISTS temp.articles_fts_terms "
+                       "USING fts5vocab(main, articles_fts, 'row')")
+        cursor.execute("DELETE FROM stats_terms")
+        cursor.execute("INSERT INTO stats_terms (term, articles) SELECT term, doc FROM temp.articles_fts_terms")
+    
+    def write_links(self, cursor, links):
+        """(Ré)écrit les lignes article_categories et article_authors
+        
+        `links`: liste de (arxiv_id, auteurs dans l'ordre, catégories, date de publication).
+        """
+        ids = [(arxiv_id,) for arxiv_id, _, _, _ in links]
+        cursor.executemany("DELETE FROM article_categories WHERE arxiv_id = ?", ids)
+        cursor.executemany("DELETE FROM article_authors WHERE arxiv_id = ?", ids)
+        cursor.executemany(
+            "INSERT OR IGNORE INTO article_categories (arxiv_id, category, published) VALUES (?, ?, ?)",
+            [(arxiv_id, category, published) for arxiv_id, _, categories, published in links
+             for category in categories]
+        )
+        keys = {name: author_key(name) for _, names, _, _ in links for name in names}
+        cursor.executemany(
+            "INSERT OR IGNORE INTO authors (name, key, surname) VALUES (?, ?, ?)",
+            [(name, key, surname_key(key)) for name, key in keys.items()]
+        )
+        cursor.executemany(
+            "INSERT OR IGNORE INTO article_authors (arxiv_id, position, author_id) "
+            "SELECT ?, ?, id FROM authors WHERE name = ?",
+            [(arxiv_id, position, name) for arxiv_id, names, _, _ in links for position, name in enumerate(names)]
+        )
+    
+    def get_watermarks(self, categories):
+        """Watermark (dernier `updated` vu) de chaque catégorie, ou None"""
+        cursor = self.conn.cursor()
+        watermarks = {}
+        for category in categories:
+            cursor.execute("SELECT last_updated FROM sync_state WHERE category = ?", (category,))
+            row = cursor.fetchone()
+            if row is None:
+                # Base existante sans watermark: repartir du dernier article connu
+                cursor.execute(
+                    "SELECT MAX(updated) FROM articles WHERE arxiv_id IN "
+                    "(SELECT arxiv_id FROM article_categories WHERE category = ?)",
+                    (category,)
+                )
+                row = cursor.fetchone()
+            watermarks[category] = datetime.fromisoformat(row[0]) if row and row[0] else None
+        return watermarks
+    
+    def save_watermarks(self, latest):
+        """Avance les watermarks {catégorie: (published, updated)} sans jamais reculer"""
+        with self.transaction() as cursor:
+            for category, (published, updated) in latest.items():
+                cursor.execute('''
+                    INSERT INTO sync_state (category, last_published, last_updated)
+                    VALUES (?, ?, ?)
+                    ON CONFLICT(category) DO UPDATE SET
+                        last_published = MAX(last_published, excluded.last_published),
+                        last_updated = MAX(last_updated, excluded.last_updated)
+                ''', (category, published, updated))
+    
+    def log_fetch(self, counts):
+        """Journalise une mise à jour: {catégorie: articles reçus}"""
+        with self.transaction() as cursor:
+            for category, count in counts.items():
+                cursor.execute('''
+                    INSERT INTO fetch_log (category, fetch_date, articles_count)
+                    VALUES (?, ?, ?)
+                ''', (category, datetime.now(), count))
+    
+    def subscribe(self, name, keywords=None, category=None, author=None):
+        """Enregistre un abonnement (remplace les critères d'un abonnement du même nom)
+        
+        ValueError si les mots-clés ne contiennent aucun terme cherchable.
+        """
+        if keywords and not fts_query(keywords):
+            raise ValueError(f"mots-clés sans terme cherchable: {keywords!r}")
+        with self.transaction() as cursor:
+            cursor.execute('''
+                INSERT INTO subscriptions (name, keywords, category, author, created_at)
+                VALUES (?, ?, ?, ?, ?)
+                ON CONFLICT(name) DO UPDATE SET
+                    keywords = excluded.keywords,
+                    category = excluded.category,
+                    author = excluded.author
+            ''', (name, keywords, category, author, datetime.now()))
+    
+    def unsubscribe(self, name):
+        """Supprime un abonnement et ses alertes; False s'il n'existe pas"""
+        with self.transaction() as cursor:
+            row = cursor.execute("SELECT id FROM subscriptions WHERE name = ?", (name,)).fetchone()
+            if row is None:
+                return False
+            cursor.execute("DELETE FROM alerts WHERE subscription_id = ?", row)
+            cursor.execute("DELETE FROM subscriptions WHERE id = ?", row)
+        return True
+    
+    def get_subscriptions(self):
+        """Abonnements (Subscription), par nom"""
+        cursor = self.conn.execute(
+            "SELECT id, name, keywords, category, author, created_at FROM subscriptions ORDER BY name")
+        return [Subscription(*row) for row in cursor]
+    
+    def match_subscriptions(self, articles):
+        """Percolation: alertes des abonnements satisfaits par un lot d'articles
+        
+        Seul le lot est évalué, pas la collection: ses articles sont indexés
+        dans une table plein texte temporaire (même tokenizer qu'articles_fts)
+        et la requête de chaque abonnement n'y lit que le lot. Un abonnement
+        dont la catégorie ou l'auteur (nom complet normalisé) manque au lot
+        est écarté sans requête. Un article n'alerte qu'une fois par
+        abonnement. Renvoie {nom d'abonnement: [(arxiv_id, titre)]} des
+        nouvelles alertes. Appelé dans une transaction (save_articles avec
+        `percolate`), il en fait partie.
+        """
+        articles = list(articles)
+        subscriptions = self.get_subscriptions()
+        if not articles or not subscriptions:
+            return {}
+        categories = [set(article['categories']) for article in articles]
+        authors = [{author_key(name) for name in split_author_names(article['authors'])} for article in articles]
+        batch_categories = set().union(*categories)
+        batch_authors = set().union(*authors)
+        
+        alerts = {}
+        now = datetime.now()
+        with self.transaction() as cursor:
+            cursor.execute("CREATE VIRTUAL TABLE IF NOT EXISTS temp.batch_fts USING fts5("
+                           "title, abstract, authors, tokenize='unicode61 remove_diacritics 2')")
+            cursor.execute("DELETE FROM temp.batch_fts")
+            cursor.executemany("INSERT INTO temp.batch_fts (rowid, title, abstract, authors) VALUES (?, ?, ?, ?)",
+                               [(index, article['title'], article['abstract'], article['authors'])
+                                for index, article in enumerate(articles)])
+            for subscription in subscriptions:
+                author = author_key(subscription.author) if subscription.author else None
+                if subscription.category and subscription.category not in batch_categories:
+                    continue
+                if author and author not in batch_authors:
+                    continue
+                match = fts_query(subscription.keywords) if subscription.keywords else ''
+                if match:
+                    indexes = [index for index, in cursor.execute(
+                        "SELECT rowid FROM temp.batch_fts WHERE batch_fts MATCH ?", (match,))]
+                elif subscription.keywords:
+                    continue
+                else:
+                    indexes = range(len(articles))
+                for index in indexes:
+                    if subscription.category and subscription.category not in categories[index]:
+                        continue
+                    if author and author not in authors[index]:
+                        continue
+                    article = articles[index]
+                    cursor.execute("INSERT OR IGNORE INTO alerts (subscription_id, arxiv_id, created_at) "
+                                   "VALUES (?, ?, ?)", (subscription.id, article['arxiv_id'], now))
+                    if cursor.rowcount:
+                        alerts.setdefault(subscription.name, []).append((article['arxiv_id'], article['title']))
+        return alerts
+    
+    def get_alerts(self, since=None, name=None):
+        """Alertes (Alert) depuis `since` (datetime), d'un abonnement ou de tous, les plus récentes d'abord"""
+        query = '''
+            SELECT s.name, al.arxiv_id, al.created_at, a.published, a.title
+            FROM alerts al
+            JOIN subscriptions s ON s.id = al.subscription_id
+            JOIN articles a ON a.arxiv_id = al.arxiv_id
+            WHERE 1=1
+        '''
+        params = []
+        if since is not None:
+            query += " AND al.created_at >= ?"
+            params.append(since)
+        if name:
+            query += " AND s.name = ?"
+            params.append(name)
+        query += " ORDER BY al.created_at DESC, a.published DESC"
+        return [Alert(*row) for row in self.conn.execute(query, params)]
+    
+    def get_checkpoints(self):
+        """Points de reprise: {(tâche, début de fenêtre): (page suivante, terminé, fin de fenêtre, jeton OAI)}"""
+        cursor = self.conn.execute(
+            "SELECT task, window_start, next_start, done, window_end, resumption_token FROM load_checkpoints"
+        )
+        return {(task, start): (next_start, done, end, token)
+                for task, start, next_start, done, end, token in cursor}
+    
+    def search(self, columns, keyword=None, category=None, year=None, author=None, limit=100,
+               prefix_last=False):
+        """Premiers résultats d'une recherche (voir search_page), sans jeton"""
+        return self.search_page(columns, keyword=keyword, category=category, year=year, author=author,
+                                page_size=limit, prefix_last=prefix_last).rows
+    
+    def search_page(self, columns, keyword=None, category=None, year=None, author=None, page_size=50,
+                    token=None, prefix_last=False):
+        """Une page d'articles filtrés et le jeton de la suivante (ResultPage)
+        
+        `columns` est la liste SELECT, sur l'alias `a` d'articles. Mots-clés:
+        index plein texte, résultats classés par pertinence (bm25), le dernier
+        mot valant préfixe avec `prefix_last`. Sinon, avec une catégorie, on
+        parcourt article_categories par date (index catégorie, date); sinon
+        articles par date ou par année. `author` filtre sur un nom d'auteur
+        complet, comparé par sa clé normalisée (casse, accents et
+        ponctuation ignorés: voir find_authors pour le résoudre).
+        
+        Pagination par clé: `token` (renvoyé par la page précédente) porte
+        la clé de tri du dernier article affiché, (published, arxiv_id) ou
+        (score, arxiv_id); la page suivante repart de l'index juste après
+        cette clé, sans OFFSET, pour un coût constant à toute profondeur.
+        Des mots-clés sans terme cherchable ("-", "*") ne trouvent rien.
+        """
+        keyword = keyword.strip() if keyword else None
+        match = fts_query(keyword, prefix_last=prefix_last) if keyword else ''
+        if keyword and not match:
+            return ResultPage([], None)
+        if match:
+            key = (FTS_RANK, "a.arxiv_id")
+            query = (f"SELECT {columns}, {key[0]}, {key[1]} FROM articles_fts"
+                     " JOIN articles a ON a.rowid = articles_fts.rowid WHERE articles_fts MATCH ?")
+            params = [match]
+            if category:
+                query += " AND a.arxiv_id IN (SELECT arxiv_id FROM article_categories WHERE category = ?)"
+                params.append(category)
+        elif category:
+            key = ("ac.published", "ac.arxiv_id")
+            query = (f"SELECT {columns}, {key[0]}, {key[1]} FROM article_categories ac"
+                     " JOIN articles a ON a.arxiv_id = ac.arxiv_id WHERE ac.category = ?")
+            params = [category]
+        else:
+            key = ("a.published", "a.arxiv_id")
+            query = f"SELECT {columns}, {key[0]}, {key[1]} FROM articles a WHERE 1=1"
+            params = []
+        
+        if author:
+            query += (" AND a.arxiv_id IN (SELECT aa.arxiv_id FROM authors au"
+                      " JOIN article_authors aa ON aa.author_id = au.id WHERE au.key = ?)")
+            params.append(author_key(author))
+        
+        if year:
+            if category and not match:
+                query += " AND ac.published >= ? AND ac.published < ?"
+                params.extend([f"{year}-01-01", f"{int(year) + 1}-01-01"])
+            else:
+                query += " AND a.year = ?"
+                params.append(int(year))
+        
+        # Pertinence: score croissant; dates: plus récent d'abord
+        direction = "" if match else " DESC"
+        if token:
+            query += f" AND ({key[0]}, {key[1]}) {'>' if match else '<'} (?, ?)"
+            params.extend(decode_token(token))
+        query += f" ORDER BY {key[0]}{direction}, {key[1]}{direction} LIMIT ?"
+        params.append(page_size + 1)
+        
+        rows = self.conn.execute(query, params).fetchall()
+        next_token = encode_token(rows[page_size - 1][-2:]) if len(rows) > page_size else None
+        return ResultPage([row[:-2] for row in rows[:page_size]], next_token)
+    
+    def iter_search_pages(self, columns, page_size=50, **filters):
+        """Générateur de pages (listes de lignes), chacune lue seulement quand elle est demandée"""
+        token = None
+        while True:
+            page = self.search_page(columns, page_size=page_size, token=token, **filters)
+            if page.rows:
+                yield page.rows
+            token = page.token
+            if token is None:
+                return
+    
+    def similar(self, columns, arxiv_id, limit=10):
+        """Articles les plus proches d'un article (lignes `columns`), ou None s'il est inconnu
+        
+        Ses termes les plus caractéristiques (voir similar_query) sont
+        cherchés dans l'index plein texte, classement bm25: seuls les
+        articles qui partagent un de ces termes sont évalués.
+        """
+        article = self.get_article(arxiv_id)
+        if article is None:
+            return None
+        frequencies = term_frequencies(article[1], article[3])
+        document_frequencies = dict(self.conn.execute(
+            "SELECT term, articles FROM stats_terms WHERE term IN (SELECT value FROM json_each(?))",
+            (json.dumps(list(frequencies)),)))
+        total = self.conn.execute("SELECT COALESCE(SUM(articles), 0) FROM stats_months").fetchone()[0]
+        match = similar_query(frequencies, document_frequencies, total)
+        if not match:
+            return []
+        return self.conn.execute(
+            f"SELECT {columns} FROM articles_fts JOIN articles a ON a.rowid = articles_fts.rowid"
+            f" WHERE articles_fts MATCH ? AND a.arxiv_id != ? ORDER BY {FTS_RANK} LIMIT ?",
+            (match, article[0], limit)).fetchall()
+    
+    def iter_export_rows(self, since=None, chunk_size=MIGRATION_CHUNK_SIZE):
+        """Lots d'articles écrits après le numéro d'écriture `since`, dans l'ordre d'écriture
+        
+        Une ligne par article: (arxiv_id, titre, abstract décompressé,
+        catégorie, liste des catégories, published, updated, version,
+        nombre d'auteurs, numéro d'écriture, ids des auteurs dans l'ordre).
+        """
+        query = '''
+            SELECT a.arxiv_id, a.title, x.dict_id, x.data, a.category, a.categories, a.published, a.updated,
+                   a.version, a.author_count, a.write_seq
+            FROM articles a LEFT JOIN article_abstracts x ON x.arxiv_id = a.arxiv_id
+        '''
+        params = []
+        if since is not None:
+            query += " WHERE a.write_seq > ?"
+            params.append(since)
+        query += " ORDER BY a.write_seq"
+        
+        cursor = self.conn.execute(query, params)
+        while True:
+            rows = cursor.fetchmany(chunk_size)
+            if not rows:
+                return
+            authors = {}
+            for arxiv_id, author_id in self.conn.execute(
+                    "SELECT arxiv_id, author_id FROM article_authors "
+                    "WHERE arxiv_id IN (SELECT value FROM json_each(?)) ORDER BY arxiv_id, position",
+                    (json.dumps([row[0] for row in rows]),)):
+                authors.setdefault(arxiv_id, []).append(author_id)
+            yield [(arxiv_id, title, self.unpack_abstract(dict_id, data) or "", category,
+                    (categories or category or "").split(), published, updated, version, author_count,
+                    write_seq, authors.get(arxiv_id, []))
+                   for arxiv_id, title, dict_id, data, category, categories, published, updated, version,
+                   author_count, write_seq in rows]
+    
+    def iter_authors(self, after_id=0):
+        """(id, nom) des auteurs d'id supérieur à `after_id`, par id croissant"""
+        return self.conn.execute("SELECT id, name FROM authors WHERE id > ? ORDER BY id", (after_id,))
+    
+    def iter_author_aliases(self):
+        """(id, id de référence) des variantes d'un même nom normalisé (référence: plus petit id)"""
+        return self.conn.execute('''
+            SELECT id, MIN(id) OVER (PARTITION BY key) FROM authors
+            WHERE key IN (SELECT key FROM authors GROUP BY key HAVING COUNT(*) > 1)
+        ''')
+    
+    def iter_author_links(self):
+        """(id d'auteur, position) de tous les liens, article par article"""
+        return self.conn.execute("SELECT author_id, position FROM article_authors ORDER BY arxiv_id, position")
+    
+    def author_names(self, author_ids):
+        """{id: nom} des auteurs demandés"""
+        return dict(self.conn.execute("SELECT id, name FROM authors WHERE id IN (SELECT value FROM json_each(?))",
+                                      (json.dumps(list(author_ids)),)))
+    
+    def find_authors(self, name, limit=AUTHOR_CANDIDATES):
+        """Auteurs désignés par `name` (AuthorMatch), les plus publiés d'abord
+        
+        Par ordre de préférence: le nom complet (clé normalisée), sinon les
+        auteurs dont c'est le nom de famille, sinon ceux dont le nom commence
+        par ces mots entiers ("maxim" → "Maxim Kontsevich", pas "Maximilian").
+        Chaque niveau est une lecture d'index sur `authors`. Les variantes
+        d'un nom normalisé sont regroupées sous la plus ancienne (plus petit
+        id, dont SQLite renvoie le nom avec MIN).
+        """
+        key = author_key(name)
+        if not key:
+            return []
+        levels = (
+            ("au.key = ?", (key,)),
+            ("au.surname = ?", (key,)),
+            ("au.key > ? AND au.key < ?", (key + " ", key + "!")),
+        )
+        for condition, params in levels:
+            rows = self.conn.execute(f'''
+                SELECT MIN(au.id), au.key, au.name, COUNT(DISTINCT aa.arxiv_id) AS papers
+                FROM authors au JOIN article_authors aa ON aa.author_id = au.id
+                WHERE {condition}
+                GROUP BY au.key ORDER BY papers DESC, au.key LIMIT ?
+            ''', (*params, limit)).fetchall()
+            if rows:
+                return [AuthorMatch(*row) for row in rows]
+        return []
+    
+    def duplicate_clusters(self, min_similarity=DUPLICATE_SIMILARITY):
+        """Groupes de quasi-doublons (listes d'arxiv_id triées), les plus grands d'abord
+        
+        Deux articles sont dans le même groupe s'ils sont reliés par une
+        chaîne de paires de similarité au moins `min_similarity`. Seules les
+        paires d'au moins DUPLICATE_SIMILARITY sont enregistrées: ValueError
+        pour un seuil inférieur, qui ne trouverait pas les autres.
+        """
+        if min_similarity < DUPLICATE_SIMILARITY:
+            raise ValueError(f"seuil {min_similarity} inférieur aux paires enregistrées ({DUPLICATE_SIMILARITY})")
+        parents = {}
+        
+        def root(arxiv_id):
+            while parents.setdefault(arxiv_id, arxiv_id) != arxiv_id:
+                parents[arxiv_id] = parents[parents[arxiv_id]]
+                arxiv_id = parents[arxiv_id]
+            return arxiv_id
+        
+        for arxiv_id, duplicate_id in self.conn.execute(
+                "SELECT arxiv_id, duplicate_id FROM article_duplicates "
+                "WHERE arxiv_id < duplicate_id AND similarity >= ?",
+                (min_similarity,)):
+            parents[root(arxiv_id)] = root(duplicate_id)
+        
+        clusters = {}
+        for arxiv_id in parents:
+            clusters.setdefault(root(arxiv_id), []).append(arxiv_id)
+        return sorted((sorted(members) for members in clusters.values()), key=lambda members: (-len(members), members))
+    
+    def get_articles(self, columns, ids):
+        """Lignes `columns` (alias `a` = articles) des articles `ids`, dans cet ordre (inconnus omis)"""
+        rows = {row[0]: row[1:] for row in self.conn.execute(
+            f"SELECT a.arxiv_id, {columns} FROM articles a WHERE a.arxiv_id IN (SELECT value FROM json_each(?))",
+            (json.dumps(list(ids)),))}
+        return [rows[arxiv_id] for arxiv_id in ids if arxiv_id in rows]
+    
+    def get_article(self, arxiv_id):
+        """Ligne complète d'un article (ARTICLE_COLUMNS, abstract décompressé), ou None
+        
+        Une version demandée ('idvN') est ignorée: la ligne est celle de la
+        version courante.
+        """
+        base_id = split_arxiv_id(arxiv_id)[0]
+        row = self.conn.execute(f"SELECT {ARTICLE_COLUMNS} FROM articles a WHERE a.arxiv_id = ?",
+                                (base_id,)).fetchone()
+        if row is None:
+            return None
+        return row[:3] + (self.get_abstract(base_id) or "",) + row[4:]
+    
+    def get_abstract(self, arxiv_id):
+        """Abstract décompressé d'un article, ou None"""
+        row = self.conn.execute("SELECT dict_id, data FROM article_abstracts WHERE arxiv_id = ?",
+                                (split_arxiv_id(arxiv_id)[0],)).fetchone()
+        return self.unpack_abstract(*row) if row else None
+    
+    def get_revisions(self, arxiv_id):
+        """Versions remplacées d'un article (Revision), de la plus récente à la plus ancienne"""
+        cursor = self.conn.execute(
+            "SELECT version, updated, title, abstract, authors FROM article_revisions "
+            "WHERE arxiv_id = ? ORDER BY version DESC", (split_arxiv_id(arxiv_id)[0],))
+        return [Revision(*row) for row in cursor]
+    
+    def stats(self, years=10, months=12):
+        """Statistiques lues dans les compteurs (Stats), sans parcourir les articles
+        
+        Total, comptes par catégorie, par année (`years` dernières), par mois
+        (`months` derniers) et article le plus récent (lu sur l'index des dates).
+        """
+        cursor = self.conn.cursor()
+        
+        # Par mois, et total
+        cursor.execute("SELECT month, articles FROM stats_months WHERE articles > 0 ORDER BY month DESC")
+        all_months = cursor.fetchall()
+        total = sum(count for _, count in all_months)
+        
+        # Par année, cumul des mois
+        by_year = {}
+        for month, count in all_months:
+            by_year[month[:4]] = by_year.get(month[:4], 0) + count
+        
+        # Par catégorie (cross-lists comprises)
+        cursor.execute("SELECT category, articles FROM stats_categories WHERE articles > 0 ORDER BY articles DESC")
+        by_category = cursor.fetchall()
+        
+        # Article le plus récent
+        cursor.execute("SELECT title, published FROM articles ORDER BY published DESC LIMIT 1")
+        latest = cursor.fetchone()
+        
+        return Stats(total, by_category, list(by_year.items())[:years], all_months[:months], latest)
@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+"""Quasi-doublons: signatures MinHash et index LSH par bandes
+
+Chaque article (titre + abstract) est réduit à l'ensemble de ses suites de
+trois mots (termes de l'index plein texte), puis à une signature MinHash
+de SIGNATURE_BINS valeurs: la part de valeurs égales entre deux signatures
+estime la similarité de Jaccard des deux ensembles. Une seule fonction de
+hachage répartit les suites entre les cases (one permutation hashing), ce
+qui coûte un hachage par suite au lieu d'un par suite et par permutation.
+
+La signature est découpée en BANDS bandes de ROWS valeurs; deux articles
+qui ont une bande identique (même seau) sont candidats et seulement eux
+sont comparés, sans parcourir la collection.
+"""
+
+import struct
+import zlib
+
+# Valeurs de la signature (16 bits chacune), en BANDS bandes de ROWS
+SIGNATURE_BINS = 32
+BANDS = 8
+ROWS = SIGNATURE_BINS // BANDS
+SIGNATURE_FORMAT = f"<{SIGNATURE_BINS}H"
+
+# Part de valeurs égales à partir de laquelle deux candidats sont des
+# quasi-doublons (Jaccard estimé)
+DUPLICATE_SIMILARITY = 0.7
+
+# Mélange des hachages crc32 (constante de Fibonacci sur 32 bits)
+HASH_MULTIPLIER = 0x9E3779B1
+BIN_SHIFT = 32 - (SIGNATURE_BINS - 1).bit_length()
+EMPTY_BIN = 0x10000
+
+
+def signature(terms):
+    """Signature MinHash (bytes) d'un texte découpé en termes (index_terms), ou None s'il est vide"""
+    if not terms:
+        return None
+
+    # Un crc32 par terme distinct, combinés par suite de trois termes puis
+    # mélangés: case = bits de poids fort, valeur = les 16 bits suivants
+    codes = {term: zlib.crc32(term.encode('utf-8')) for term in set(terms)}
+    hashes = [codes[term] for term in terms]
+    hashes += [0] * (3 - len(hashes))  # moins de trois termes: une seule suite
+    bins = [EMPTY_BIN] * SIGNATURE_BINS
+    for first, second, third in zip(hashes, hashes[1:], hashes[2:]):
+        value = ((((first * HASH_MULTIPLIER) ^ second) * HASH_MULTIPLIER ^ third) * HASH_MULTIPLIER) & 0xFFFFFFFF
+        index = value >> BIN_SHIFT
+        value = (value >> (BIN_SHIFT - 16)) & 0xFFFF
+        if value < bins[index]:
+            bins[index] = value
+
+    # Case vide (texte court): valeur de la case pleine suivante, décalée
+    # de sa distance, pour que deux textes identiques gardent la même signature
+    filled = list(bins)
+    for index in range(SIGNATURE_BINS):
+        if filled[index] == EMPTY_BIN:
+            for distance in range(1, SIGNATURE_BINS):
+                borrowed = filled[(index + distance) % SIGNATURE_BINS]
+                if borrowed != EMPTY_BIN:
+                    break
+            bins[index] = (borrowed + distance * HASH_MULTIPLIER) & 0xFFFF
+    return struct.pack(SIGNATURE_FORMAT, *bins)
+
+
+def band_keys(signature):
+    """Seaux (entiers 32 bits) des bandes d'une signature, le numéro de bande compris"""
+    size = ROWS * 2
+    return [zlib.crc32(signature[band * size:(band + 1) * size], band) for band in range(BANDS)]
+
+
+def similarity(first, second):
+    """Part de valeurs égales entre deux signatures (Jaccard estimé)"""
+    first = struct.unpack(SIGNATURE_FORMAT, first)
+    second = struct.unpack(SIGNATURE_FORMAT, second)
+    return sum(a == b for a, b in zip(first, second)) / SIGNATURE_BINS
@@ -2,15 +2,28 @@
 
 import tkinter as tk
 from tkinter import ttk, messagebox
-import sqlite3
 from datetime import datetime
 import webbrowser
 import subprocess
 import os
 
+from arxiv_db import ArxivDatabase
+
+# Articles chargés à la fois dans la liste
+GUI_PAGE_SIZE = 200
+
+# Articles proposés par "Articles similaires"
+GUI_SIMILAR_COUNT = 50
+
+# Colonnes de la liste (alias `a` = articles)
+GUI_COLUMNS = ("a.arxiv_id, a.title, a.first_author, a.author_count, a.category, a.published,"
+               " a.link, a.pdf_link, a.authors")
+
 class ArxivGUI:
     def __init__(self):
         self.db_path = "arxiv_collection.db"
+        self.db = ArxivDatabase(self.db_path)
+        self.db.ensure_schema()
         self.root = tk.Tk()
         self.root.title("📚 AVCP")
         self.root.geometry("1400x900")
@@ -48,6 +61,11 @@ class ArxivGUI:
         self.current_filter = "all"
         self.search_term = ""
         
+        # Articles chargés et jeton de la page suivante
+        self.articles = []
+        self.next_token = None
+        self.loading_more = False
+        
         self.create_widgets()
         self.refresh_articles()
     
@@ -242,9 +260,10 @@ class ArxivGUI:
         for col in columns:
             self.tree.heading(col, text=col, anchor=tk.W if col in ["Titre", "Auteur"] else tk.CENTER)
         
-        # Scrollbar
+        # Scrollbar (arrivé en bas de liste, la page suivante est chargée)
         scrollbar = ttk.Scrollbar(self.tree_container, orient=tk.VERTICAL, command=self.tree.yview)
-        self.tree.configure(yscrollcommand=scrollbar.set)
+        self.tree_scrollbar = scrollbar
+        self.tree.configure(yscrollcommand=self.on_tree_scroll)
         
         self.tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
         scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
@@ -262,6 +281,7 @@ class ArxivGUI:
         self.context_menu.add_command(label="📋 Copier citation", command=self.copy_citation)
         self.context_menu.add_separator()
         self.context_menu.add_command(label="ℹ️ Détails complets", command=self.show_details)
+        self.context_menu.add_command(label="🔎 Articles similaires", command=self.show_similar)
         
         self.tree.bind('<Button-2>', self.show_context_menu)  # Clic droit Mac
         self.tree.bind('<Button-3>', self.show_context_menu)  # Clic droit PC
@@ -374,46 +394,52 @@ class ArxivGUI:
                 font=("SF Pro Display", 12, "bold" if is_active else "normal")
             )
     
-    def get_articles(self):
-        """Récupérer les articles de la base de données"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
-        query = "SELECT arxiv_id, title, authors, category, published, link, pdf_link FROM articles WHERE 1=1"
-        params = []
-        
-        if self.search_term:
-            query += " AND (title LIKE ? OR authors LIKE ? OR abstract LIKE ?)"
-            search = f"%{self.search_term}%"
-            params.extend([search, search, search])
-        
-        if self.current_filter != "all":
-            query += " AND category = ?"
-            params.append(self.current_filter)
-        
-        query += " ORDER BY published DESC LIMIT 200"
-        
-        cursor.execute(query, params)
-        results = cursor.fetchall()
-        conn.close()
-        
-        return results
+    def get_articles(self, token=None):
+        """Récupérer une page d'articles de la base de données (ResultPage)"""
+        # Recherche plein texte classée par pertinence, le dernier mot tapé
+        # valant préfixe; sinon les plus récents de la catégorie choisie.
+        # `token` (page précédente) donne la suite, sans OFFSET
+        category = self.current_filter if self.current_filter != "all" else None
+        return self.db.search_page(GUI_COLUMNS, keyword=self.search_term, category=category,
+                                   page_size=GUI_PAGE_SIZE, token=token, prefix_last=True)
     
     def refresh_articles(self):
         """Rafraîchir la liste des articles"""
         # Vider le TreeView
         for item in self.tree.get_children():
             self.tree.delete(item)
+        self.articles = []
         
-        # Charger les articles
-        articles = self.get_articles()
-        
+        # Charger la première page
+        page = self.get_articles()
+        self.next_token = page.token
+        self.insert_articles(page.rows)
+    
+    def load_more_articles(self):
+        """Ajouter la page suivante à la liste"""
+        self.loading_more = False
+        if self.next_token is None:
+            return
+        page = self.get_articles(self.next_token)
+        self.next_token = page.token
+        self.insert_articles(page.rows)
+    
+    def on_tree_scroll(self, first, last):
+        """Suivi du défilement: charge la suite quand le bas de la liste est visible"""
+        self.tree_scrollbar.set(first, last)
+        if float(last) >= 1.0 and self.next_token is not None and not self.loading_more:
+            self.loading_more = True
+            self.root.after_idle(self.load_more_articles)
+    
+    def insert_articles(self, articles):
+        """Ajouter des articles à la fin du TreeView"""
+        self.articles.extend(articles)
         for article in articles:
-            arxiv_id, titre, auteurs, categorie, published, link, pdf_link = article
+            arxiv_id, titre, first_author, author_count, categorie, published, link, pdf_link, _ = article
             
-            # Premier auteur
-            first_author = auteurs.split(";")[0].strip() if auteurs else "Unknown"
-            if ";" in auteurs:
+            # Premier auteur (précalculé en base)
+            first_author = first_author or "Unknown"
+            if author_count and author_count > 1:
                 first_author += " et al."
             
             # Année
@@ -548,16 +574,12 @@ class ArxivGUI:
         arxiv_id = item["tags"][0]
         
         # Récupérer les détails complets
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        cursor.execute("SELECT * FROM articles WHERE arxiv_id = ?", (arxiv_id,))
-        article = cursor.fetchone()
-        conn.close()
+        article = self.db.get_article(arxiv_id)
         
         if article:
             details = f"""📄 DÉTAILS DE L'ARTICLE
 
-📌 arXiv ID: {article[0]}
+📌 arXiv ID: {article[0]}v{article[14] or 1}
 
 📄 Titre:
 {article[1]}
@@ -565,7 +587,7 @@ class ArxivGUI:
 ✍️ Auteurs:
 {article[2]}
 
-🏷️ Catégorie: {article[4]}
+🏷️ Catégories: {article[10] or article[4]}
 
 📅 Publié: {article[5][:10]}
 📅 Mis à jour: {article[6][:10]}
@@ -592,40 +614,49 @@ class ArxivGUI:
             text_widget.insert("1.0", details)
             text_widget.configure(state="disabled")
     
+    def show_similar(self):
+        """Remplacer la liste par les articles proches de l'article sélectionné"""
+        selection = self.tree.selection()
+        if not selection:
+            messagebox.showwarning("Attention", "Sélectionnez un article")
+            return
+        
+        item = self.tree.item(selection[0])
+        arxiv_id = item["tags"][0]
+        
+        articles = self.db.similar(GUI_COLUMNS, arxiv_id, limit=GUI_SIMILAR_COUNT)
+        if not articles:
+            messagebox.showinfo("Articles similaires", "Aucun article proche trouvé")
+            return
+        
+        # Liste complète (pas de page suivante); une recherche ou un
+        # filtre ramène la liste habituelle
+        for item in self.tree.get_children():
+            self.tree.delete(item)
+        self.articles = []
+        self.next_token = None
+        self.insert_articles(articles)
+    
     def update_collection(self):
         """Lancer la mise à jour de la collection"""
         response = messagebox.askyesno(
             "Mise à jour",
             "Lancer la mise à jour de la collection?\n\n"
-            "Cela va collecter les articles des 2 derniers jours."
+            "Cela va collecter les articles parus depuis la dernière mise à jour."
         )
         
         if response:
             # Lancer arxiv_collector.py en arrière-plan
             try:
-                subprocess.Popen(["python3", "arxiv_collector.py", "update", "2"])
+                subprocess.Popen(["python3", "arxiv_collector.py", "update"])
                 messagebox.showinfo("Info", "Mise à jour lancée en arrière-plan!\n\nActualisez dans quelques minutes.")
             except Exception as e:
                 messagebox.showerror("Erreur", f"Impossible de lancer la mise à jour:\n{e}")
     
     def show_stats(self):
         """Afficher les statistiques"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
-        # Total
-        cursor.execute("SELECT COUNT(*) FROM articles")
-        total = cursor.fetchone()[0]
-        
-        # Par catégorie
-        cursor.execute("SELECT category, COUNT(*) FROM articles GROUP BY category ORDER BY COUNT(*) DESC")
-        by_cat = cursor.fetchall()
-        
-        # Par année
-        cursor.execute("SELECT strftime('%Y', published) as year, COUNT(*) FROM articles GROUP BY year ORDER BY year DESC LIMIT 5")
-        by_year = cursor.fetchall()
-        
-        conn.close()
+        stats = self.db.stats(years=5)
+        total, by_cat, by_year = stats.total, stats.by_category, stats.by_year
         
         stats_text = f"""📊 STATISTIQUES DE LA COLLECTION
 
@@ -643,8 +674,8 @@ class ArxivGUI:
         messagebox.showinfo("Statistiques", stats_text)
     
     def export_list(self):
-        """Exporter la liste actuelle"""
-        articles = self.get_articles()
+        """Exporter la liste actuelle (articles chargés)"""
+        articles = self.articles
         
         if not articles:
             messagebox.showwarning("Attention", "Aucun article à exporter")
@@ -654,7 +685,7 @@ class ArxivGUI:
         export_text = "# arXiv Collection Export\n\n"
         
         for article in articles:
-            arxiv_id, titre, auteurs, categorie, published, link, pdf_link = article
+            arxiv_id, titre, _, _, categorie, published, link, pdf_link, auteurs = article
             export_text += f"## {titre}\n"
             export_text += f"- **Auteurs**: {auteurs}\n"
             export_text += f"- **Catégorie**: {categorie}\n"
@@ -0,0 +1,180 @@
+#!/usr/bin/env python3
+"""Backend de moissonnage OAI-PMH pour les grosses collectes initiales
+
+`ListRecords` (format arXivRaw) renvoie les métadonnées par lots avec un
+jeton de reprise: une catégorie complète se récupère en un seul flux, sans
+la pagination plafonnée de l'API de recherche.
+"""
+
+import re
+import xml.etree.ElementTree as ET
+from email.utils import parsedate_to_datetime
+
+OAI_URL = "http://export.arxiv.org/oai2"
+
+# Balises OAI-PMH et arXivRaw, qualifiées une fois pour toutes
+OAI_NS = '{http://www.openarchives.org/OAI/2.0/}'
+RAW_NS = '{http://arxiv.org/OAI/arXivRaw/}'
+RECORD_TAG = OAI_NS + 'record'
+HEADER_TAG = OAI_NS + 'header'
+METADATA_TAG = OAI_NS + 'metadata'
+TOKEN_TAG = OAI_NS + 'resumptionToken'
+ERROR_TAG = OAI_NS + 'error'
+RAW_TAG = RAW_NS + 'arXivRaw'
+RAW_ID_TAG = RAW_NS + 'id'
+RAW_VERSION_TAG = RAW_NS + 'version'
+RAW_DATE_TAG = RAW_NS + 'date'
+RAW_TITLE_TAG = RAW_NS + 'title'
+RAW_AUTHORS_TAG = RAW_NS + 'authors'
+RAW_CATEGORIES_TAG = RAW_NS + 'categories'
+RAW_ABSTRACT_TAG = RAW_NS + 'abstract'
+
+# Archives arXiv qui forment un set OAI de premier niveau; les autres
+# (math-ph, hep-th, ...) sont rangées sous `physics:`
+TOP_LEVEL_SETS = {'cs', 'econ', 'eess', 'math', 'q-bio', 'q-fin', 'stat'}
+
+AUTHOR_SEPARATOR_RE = re.compile(r',\s*|\s+and\s+')
+
+
+class OaiError(Exception):
+    """Erreur renvoyée par le serveur OAI-PMH (hors noRecordsMatch)"""
+
+
+def oai_set(category):
+    """Set OAI qui contient une catégorie arXiv (math.DG → math, math-ph → physics:math-ph)"""
+    archive = category.split('.')[0]
+    return archive if archive in TOP_LEVEL_SETS else f"physics:{archive}"
+
+
+def split_authors(authors):
+    """Découpe la liste d'auteurs arXivRaw ('A, B and C'), affiliations retirées"""
+    # Les affiliations entre parenthèses peuvent contenir des virgules
+    depth = 0
+    flat = []
+    for char in authors:
+        if char == '(':
+            depth += 1
+        elif char == ')':
+            depth = max(0, depth - 1)
+        elif depth == 0:
+            flat.append(char)
+    names = AUTHOR_SEPARATOR_RE.split(" ".join("".join(flat).split()))
+    return [name.strip() for name in names if name.strip()]
+
+
+class OaiHarvester:
+    """Moissonne `ListRecords` et produit des articles au format de save_articles"""
+    
+    def __init__(self, client, base_url=OAI_URL, metadata_prefix='arXivRaw'):
+        # Le client apporte le limiteur de débit et les nouveaux essais
+        # (le contrôle de flux OAI d'arXiv répond 503 + Retry-After)
+        self.client = client
+        self.base_url = base_url
+        self.metadata_prefix = metadata_prefix
+    
+    def iter_batches(self, set_spec, categories, from_date=None, until_date=None, resumption_token=None):
+        """Générateur: (articles, jeton suivant, taille annoncée) pour chaque réponse
+        
+        Les articles sont filtrés sur `categories` (catégories suivies de
+        chaque enregistrement). Le jeton suivant vaut None sur la dernière
+        réponse; reprendre avec lui continue le moissonnage au même point.
+        """
+        requested = set(categories)
+        while True:
+            if resumption_token:
+                params = {'verb': 'ListRecords', 'resumptionToken': resumption_token}
+            else:
+                params = {'verb': 'ListRecords', 'metadataPrefix': self.metadata_prefix, 'set': set_spec}
+                if from_date is not None:
+                    params['from'] = from_date.strftime('%Y-%m-%d')
+                if until_date is not None:
+                    params['until'] = until_date.strftime('%Y-%m-%d')
+            
+            # Les erreurs OAI (badResumptionToken...) arrivent en 200 ou 400
+            # avec un corps <error code=...> qu'iter_records convertit en OaiError
+            response = self.client.get(self.base_url, params, stream=True, accept=(200, 400))
+            state = {}
+            try:
+                response.raw.decode_content = True
+                articles = list(self.iter_records(response.raw, requested, state))
+            finally:
+                response.close()
+            
+            resumption_token = state.get('token')
+            yield articles, resumption_token, state.get('size')
+            if not resumption_token:
+                break
+    
+    def iter_records(self, source, requested, state):
+        """Parse en flux une réponse ListRecords; `state` reçoit le jeton de reprise"""
+        for _, elem in ET.iterparse(source):
+            tag = elem.tag
+            if tag == RECORD_TAG:
+                article = self.parse_record(elem, requested)
+                elem.clear()
+                if article is not None:
+                    yield article
+            elif tag == TOKEN_TAG:
+                state['token'] = (elem.text or '').strip() or None
+                size = elem.get('completeListSize')
+                state['size'] = int(size) if size and size.isdigit() else None
+            elif tag == ERROR_TAG:
+                code = elem.get('code')
+                if code != 'noRecordsMatch':
+                    raise OaiError(f"{code}: {(elem.text or '').strip()}")
+    
+    def parse_record(self, record, requested):
+        """Convertit un enregistrement arXivRaw en article (None si supprimé ou hors catégories)"""
+        header = record.find(HEADER_TAG)
+        if header is not None and header.get('status') == 'deleted':
+            return None
+        raw = record.find(f'{METADATA_TAG}/{RAW_TAG}')
+        if raw is None:
+            return None
+        
+        base_id = None
+        title = "No title"
+        abstract = ""
+        authors = ""
+        terms = []
+        versions = []
+        for child in raw:
+            tag = child.tag
+            if tag == RAW_VERSION_TAG:
+                versions.append((child.get('version'), child.findtext(RAW_DATE_TAG)))
+            elif tag == RAW_ID_TAG:
+                base_id = child.text.strip()
+            elif tag == RAW_TITLE_TAG:
+                title = child.text.strip().replace('\n', ' ')
+            elif tag == RAW_ABSTRACT_TAG:
+                abstract = child.text.strip().replace('\n', ' ')
+            elif tag == RAW_AUTHORS_TAG:
+                authors = child.text or ""
+            elif tag == RAW_CATEGORIES_TAG:
+                terms = (child.text or "").split()
+        
+        matching = [term for term in dict.fromkeys(terms) if term in requested]
+        if base_id is None or not versions or not matching:
+            return None
+        
+        # Même identifiant de base, même version et mêmes dates que l'API de
+        # recherche: publié = date de la v1, mis à jour = date de la dernière version
+        version, updated_text = versions[-1]
+        published = parsedate_to_datetime(versions[0][1])
+        updated = parsedate_to_datetime(updated_text)
+        primary = terms[0]
+        
+        return {
+            'arxiv_id': base_id,
+            'version': int(version.lstrip('v')) if version else len(versions),
+            'title': title,
+            'authors': "; ".join(split_authors(authors)),
+            'abstract': abstract,
+            'category': primary if primary in matching else matching[0],
+            'categories': matching,
+            'primary_category': primary,
+            'published': published,
+            'updated': updated,
+            'link': f"https://arxiv.org/abs/{base_id}",
+            'pdf_link': f"https://arxiv.org/pdf/{base_id}.pdf"
+        }
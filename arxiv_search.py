@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+"""Recherche plein texte: traduction des mots-clés en requêtes FTS5
+
+L'index `articles_fts` (titre, abstract, auteurs) est tenu à jour à chaque
+sauvegarde d'articles; les trois interfaces l'interrogent avec un
+classement bm25 au lieu de balayer la table avec `LIKE '%mot%'`.
+
+Le même index sert à trouver les articles proches d'un article: ses termes
+les plus caractéristiques (tf × idf, nombre d'articles contenant chaque
+terme tenu à jour à chaque sauvegarde) forment une requête OR classée par bm25.
+"""
+
+import math
+import re
+import unicodedata
+from collections import Counter
+
+# Poids bm25 des colonnes de articles_fts: titre, abstract, auteurs
+FTS_RANK = "bm25(articles_fts, 10.0, 1.0, 5.0)"
+
+# Phrase entre guillemets (éventuellement non fermée) ou mot isolé
+QUERY_TOKEN_RE = re.compile(r'"([^"]*)"?(\*?)|(\S+)')
+WORD_RE = re.compile(r'\w+')
+
+# Terme de l'index: lettres et chiffres (tokenizer unicode61)
+TERM_RE = re.compile(r'[^\W_]+')
+# Accents détachés par la décomposition NFKD (diacritiques combinants)
+DIACRITIC_RE = re.compile('[\u0300-\u036f]')
+
+# Articles proches: termes retenus, part maximale des articles où un terme
+# peut apparaître (au-delà il ne distingue rien), poids du titre, et
+# nombre maximal d'entrées de l'index lues (borne le coût de la requête)
+SIMILAR_TERMS = 25
+SIMILAR_MAX_DF = 0.1
+SIMILAR_TITLE_WEIGHT = 3
+SIMILAR_MAX_POSTINGS = 100000
+
+
+def fts_query(text, prefix_last=False):
+    """Traduit une saisie utilisateur en requête FTS5 sûre ('' si rien à chercher)
+
+    - `"mots entre guillemets"`: phrase exacte
+    - `mot*`: préfixe
+    - `OR` (en majuscules) entre deux termes: l'un ou l'autre
+    - les autres termes sont combinés en ET
+
+    Un mot composé (`Calabi-Yau`) devient une phrase. Avec `prefix_last`,
+    le dernier mot est cherché comme préfixe (recherche pendant la frappe).
+    """
+    terms = []
+    phrase_last = False
+    for phrase, star, word in QUERY_TOKEN_RE.findall(text):
+        if word == 'OR':
+            if terms and terms[-1] != 'OR':
+                terms.append('OR')
+            continue
+        words = WORD_RE.findall(phrase if not word else word)
+        if not words:
+            continue
+        prefix = star if not word else ('*' if word.endswith('*') else '')
+        terms.append('"' + ' '.join(words) + '"' + prefix)
+        phrase_last = not word
+
+    if terms and terms[-1] == 'OR':
+        terms.pop()
+    if prefix_last and terms and not phrase_last and not terms[-1].endswith('*'):
+        terms[-1] += '*'
+    return ' '.join(terms)
+
+
+def index_terms(text):
+    """Termes de `text` tels que articles_fts les indexe (minuscules, sans accents)"""
+    text = (text or '').lower()
+    if not text.isascii():
+        text = DIACRITIC_RE.sub('', unicodedata.normalize('NFKD', text))
+    return TERM_RE.findall(text)
+
+
+def document_terms(*texts):
+    """Termes distincts d'une entrée de l'index (titre, abstract, auteurs)"""
+    return set(index_terms(' '.join(text or '' for text in texts)))
+
+
+def term_frequencies(title, abstract):
+    """Occurrences des termes d'un article, celles du titre comptant SIMILAR_TITLE_WEIGHT fois"""
+    frequencies = Counter(index_terms(abstract))
+    for term in index_terms(title):
+        frequencies[term] += SIMILAR_TITLE_WEIGHT
+    return frequencies
+
+
+def similar_query(frequencies, document_frequencies, total):
+    """Requête FTS5 des articles proches ('' si aucun terme ne distingue l'article)
+
+    `frequencies`: occurrences des termes de l'article (term_frequencies),
+    `document_frequencies`: {terme: nombre d'articles qui le contiennent},
+    `total`: nombre d'articles. Les SIMILAR_TERMS termes de plus fort
+    tf × idf, présents ailleurs que dans l'article et dans au plus
+    SIMILAR_MAX_DF des articles, sont cherchés en OR dans le titre et
+    l'abstract; un terme qui porterait au-delà de SIMILAR_MAX_POSTINGS le
+    nombre d'articles à évaluer est passé.
+    """
+    limit = max(total * SIMILAR_MAX_DF, 2)
+    weights = sorted(((count * math.log(total / document_frequencies[term]), term)
+                      for term, count in frequencies.items()
+                      if 1 < document_frequencies.get(term, 0) <= limit), reverse=True)
+    terms = []
+    postings = 0
+    for _, term in weights:
+        if postings + document_frequencies[term] > SIMILAR_MAX_POSTINGS:
+            continue
+        terms.append(term)
+        postings += document_frequencies[term]
+        if len(terms) == SIMILAR_TERMS:
+            break
+    if not terms:
+        return ''
+    return '{title abstract} : (' + ' OR '.join(f'"{term}"' for term in terms) + ')'
@@ -1,43 +1,48 @@
 #!/usr/bin/env python3
 
 
-import sqlite3
 from datetime import datetime
 import sys
 
+from arxiv_authors import build_coauthor_graph, find_author
+from arxiv_db import ArxivDatabase
+
+# Colonnes du tableau (alias `a` = articles)
+TABLE_COLUMNS = "a.arxiv_id, a.title, a.first_author, a.category, a.published, a.link, a.author_count"
+
 class ArxivTableViewer:
     def __init__(self, db_path="arxiv_collection.db"):
         self.db_path = db_path
+        self.db = ArxivDatabase(db_path)
+        self.db.ensure_schema()
     
-    def get_articles(self, search_query=None, category=None, year=None, limit=100):
-        """Récupère les articles avec filtres"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
-        query = "SELECT arxiv_id, title, authors, category, published, link FROM articles WHERE 1=1"
-        params = []
-        
-        if search_query:
-            query += " AND (title LIKE ? OR abstract LIKE ? OR authors LIKE ?)"
-            search_term = f"%{search_query}%"
-            params.extend([search_term, search_term, search_term])
-        
-        if category:
-            query += " AND category = ?"
-            params.append(category)
-        
-        if year:
-            query += " AND strftime('%Y', published) = ?"
-            params.append(str(year))
-        
-        query += " ORDER BY published DESC LIMIT ?"
-        params.append(limit)
-        
-        cursor.execute(query, params)
-        results = cursor.fetchall()
-        conn.close()
-        
-        return results
+    def get_articles(self, search_query=None, category=None, year=None, limit=100, author=None):
+        """Récupère les articles avec filtres (mots-clés classés par pertinence)"""
+        return self.db.search(TABLE_COLUMNS, keyword=search_query, category=category, year=year,
+                              author=author, limit=limit)
+    
+    def get_page(self, search_query=None, category=None, year=None, author=None, page_size=50, token=None):
+        """Une page d'articles filtrés et le jeton de la suivante (pagination par clé)"""
+        return self.db.search_page(TABLE_COLUMNS, keyword=search_query, category=category, year=year,
+                                   author=author, page_size=page_size, token=token)
+    
+    def browse_table(self, search_query=None, category=None, year=None, author=None, page_size=50):
+        """Affiche les résultats page par page; la suite est demandée au clavier"""
+        token = None
+        start = 1
+        while True:
+            page = self.get_page(search_query, category, year, author, page_size, token)
+            self.display_table(page.rows, start=start, more=page.token is not None)
+            start += len(page.rows)
+            token = page.token
+            if token is None or not sys.stdin.isatty():
+                break
+            try:
+                if input("[Entrée]=page suivante | [q]=quitter: ").strip().lower() == 'q':
+                    break
+            except (KeyboardInterrupt, EOFError):
+                print()
+                break
     
     def truncate_text(self, text, max_length):
         """Tronque le texte à une longueur maximale"""
@@ -45,18 +50,16 @@ class ArxivTableViewer:
             return text
         return text[:max_length-3] + "..."
     
-    def get_first_author(self, authors_str):
-        """Récupère le premier auteur"""
-        if not authors_str:
+    def get_first_author(self, first_author, author_count):
+        """Premier auteur (précalculé en base), suivi de "et al." s'il y en a d'autres"""
+        if not first_author:
             return "Unknown"
-        authors = authors_str.split(";")
-        first = authors[0].strip()
-        if len(authors) > 1:
-            return first + " et al."
-        return first
+        if author_count and author_count > 1:
+            return first_author + " et al."
+        return first_author
     
-    def display_table(self, articles):
-        """Affiche les articles dans un tableau"""
+    def display_table(self, articles, start=1, more=False):
+        """Affiche les articles dans un tableau, numérotés à partir de `start`"""
         if not articles:
             print("\n❌ Aucun article trouvé.\n")
             return
@@ -78,10 +81,10 @@ class ArxivTableViewer:
         print(separator)
         
         # Articles
-        for idx, article in enumerate(articles, 1):
+        for idx, article in enumerate(articles, start):
             arxiv_id = article[0]
             titre = self.truncate_text(article[1], col_titre - 2)
-            auteurs = self.truncate_text(self.get_first_author(article[2]), col_auteur - 2)
+            auteurs = self.truncate_text(self.get_first_author(article[2], article[6]), col_auteur - 2)
             annee = article[4][:4] if article[4] else "????"
             categorie = article[3][:col_cat-2] if article[3] else "???"
             link = self.truncate_text(article[5], col_link - 2)
@@ -89,7 +92,10 @@ class ArxivTableViewer:
             print(f"| {idx:<{col_num-2}} | {titre:<{col_titre-2}} | {auteurs:<{col_auteur-2}} | {annee:<{col_annee-2}} | {categorie:<{col_cat-2}} | {link:<{col_link-2}} |")
         
         print(separator)
-        print(f"\n📊 Total: {len(articles)} articles\n")
+        if start == 1 and not more:
+            print(f"\n📊 Total: {len(articles)} articles\n")
+        else:
+            print(f"\n📊 Articles {start}-{start + len(articles) - 1}{' (suite disponible)' if more else ''}\n")
     
     def interactive_menu(self):
         """Menu interactif"""
@@ -108,29 +114,25 @@ class ArxivTableViewer:
             choice = input("\nChoix: ").strip()
             
             if choice == '1':
-                limit = input("Nombre d'articles à afficher (défaut: 50): ").strip()
+                limit = input("Articles par page (défaut: 50): ").strip()
                 limit = int(limit) if limit.isdigit() else 50
-                articles = self.get_articles(limit=limit)
-                self.display_table(articles)
+                self.browse_table(page_size=limit)
                 
             elif choice == '2':
                 keyword = input("Mot-clé: ").strip()
                 if keyword:
-                    articles = self.get_articles(search_query=keyword)
-                    self.display_table(articles)
+                    self.browse_table(search_query=keyword)
                     
             elif choice == '3':
                 print("\nCatégories disponibles: math.DG, math.SG, math-ph, math.AG, math.QA, math.RT")
                 cat = input("Catégorie: ").strip()
                 if cat:
-                    articles = self.get_articles(category=cat)
-                    self.display_table(articles)
+                    self.browse_table(category=cat)
                     
             elif choice == '4':
                 year = input("Année (ex: 2024): ").strip()
                 if year.isdigit():
-                    articles = self.get_articles(year=int(year))
-                    self.display_table(articles)
+                    self.browse_table(year=int(year))
                     
             elif choice == '5':
                 arxiv_id = input("arXiv ID (ex: 2511.16644v1): ").strip()
@@ -144,14 +146,48 @@ class ArxivTableViewer:
             else:
                 print("❌ Choix invalide")
     
+    def show_similar(self, arxiv_id, limit=20):
+        """Affiche les articles les plus proches d'un article"""
+        articles = self.db.similar(TABLE_COLUMNS, arxiv_id, limit=limit)
+        if articles is None:
+            print(f"\n❌ Article {arxiv_id} non trouvé.\n")
+            return
+        print(f"\n🔎 Articles proches de {arxiv_id}")
+        self.display_table(articles)
+    
+    def show_author(self, name, page_size=50):
+        """Affiche les articles d'un auteur (lecture de l'index des auteurs)"""
+        author = find_author(self.db, name)
+        if author:
+            print(f"\n✍️  {author.name}: {author.articles} articles")
+            self.browse_table(author=author.key, page_size=page_size)
+    
+    def show_coauthors(self, name, limit=20):
+        """Affiche les co-auteurs d'un auteur et ses collaborateurs à deux pas"""
+        author = find_author(self.db, name)
+        if not author:
+            return
+        graph = build_coauthor_graph(self.db)
+        direct = graph.neighbours(author.id).most_common(limit)
+        second = graph.two_hop(author.id).most_common(limit)
+        names = self.db.author_names([node for node, _ in direct + second])
+        
+        col_nom = 40
+        col_lien = 12
+        separator = "+" + "-" * col_nom + "+" + "-" * col_lien + "+"
+        print(f"\n👥 Co-auteurs de {author.name} ({author.articles} articles)")
+        for title, rows, label in (("CO-AUTEUR", direct, "ARTICLES"), ("À DEUX PAS", second, "VIA")):
+            print("\n" + separator)
+            print(f"| {title:<{col_nom-2}} | {label:<{col_lien-2}} |")
+            print(separator)
+            for node, count in rows:
+                print(f"| {self.truncate_text(names[node], col_nom - 2):<{col_nom-2}} | {count:<{col_lien-2}} |")
+            print(separator)
+        print("\n📊 ARTICLES: articles en commun | VIA: co-auteurs en commun\n")
+    
     def show_article_details(self, arxiv_id):
         """Affiche les détails d'un article"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
-        cursor.execute("SELECT * FROM articles WHERE arxiv_id = ?", (arxiv_id,))
-        article = cursor.fetchone()
-        conn.close()
+        article = self.db.get_article(arxiv_id)
         
         if not article:
             print(f"\n❌ Article {arxiv_id} non trouvé.\n")
@@ -160,14 +196,24 @@ class ArxivTableViewer:
         print("\n" + "="*80)
         print("📄 DÉTAILS DE L'ARTICLE")
         print("="*80)
-        print(f"\n📌 arXiv ID: {article[0]}")
+        print(f"\n📌 arXiv ID: {article[0]}v{article[14] or 1}")
         print(f"\n📄 Titre:\n   {article[1]}")
         print(f"\n✍️  Auteurs:\n   {article[2]}")
-        print(f"\n🏷️  Catégorie: {article[4]}")
+        print(f"\n🏷️  Catégories: {article[10] or article[4]}")
         print(f"\n📅 Publié: {article[5][:10]}")
         print(f"\n🔗 Lien: {article[7]}")
         print(f"\n📥 PDF: {article[8]}")
         print(f"\n📝 Abstract:\n{article[3]}")
+        
+        # Versions précédentes: seuls les champs modifiés ensuite sont archivés
+        revisions = self.db.get_revisions(arxiv_id)
+        if revisions:
+            print("\n🕘 Versions précédentes:")
+            for revision in revisions:
+                changes = [label for label, value in (("titre", revision.title), ("abstract", revision.abstract),
+                                                      ("auteurs", revision.authors)) if value is not None]
+                print(f"   v{revision.version} ({(revision.updated or '')[:10]}): "
+                      f"{', '.join(changes) + ' modifié(s) ensuite' if changes else 'contenu identique'}")
         print("\n" + "="*80 + "\n")
 
 
@@ -180,9 +226,8 @@ def main():
         
         if cmd == 'all':
             # Afficher tous les articles
-            limit = int(sys.argv[2]) if len(sys.argv) > 2 else 50
-            articles = viewer.get_articles(limit=limit)
-            viewer.display_table(articles)
+            page_size = int(sys.argv[2]) if len(sys.argv) > 2 else 50
+            viewer.browse_table(page_size=page_size)
         
         elif cmd == 'search':
             # Rechercher
@@ -190,8 +235,7 @@ def main():
                 print("Usage: python3 arxiv_table.py search <mot-clé>")
                 return
             keyword = sys.argv[2]
-            articles = viewer.get_articles(search_query=keyword)
-            viewer.display_table(articles)
+            viewer.browse_table(search_query=keyword)
         
         elif cmd == 'cat':
             # Par catégorie
@@ -199,8 +243,21 @@ def main():
                 print("Usage: python3 arxiv_table.py cat <catégorie>")
                 return
             category = sys.argv[2]
-            articles = viewer.get_articles(category=category)
-            viewer.display_table(articles)
+            viewer.browse_table(category=category)
+        
+        elif cmd == 'author':
+            # Par auteur
+            if len(sys.argv) < 3:
+                print("Usage: python3 arxiv_table.py author <nom>")
+                return
+            viewer.show_author(sys.argv[2])
+        
+        elif cmd == 'coauthors':
+            # Co-auteurs (graphe des co-auteurs)
+            if len(sys.argv) < 3:
+                print("Usage: python3 arxiv_table.py coauthors <nom>")
+                return
+            viewer.show_coauthors(sys.argv[2])
         
         elif cmd == 'year':
             # Par année
@@ -208,8 +265,7 @@ def main():
                 print("Usage: python3 arxiv_table.py year <année>")
                 return
             year = int(sys.argv[2])
-            articles = viewer.get_articles(year=year)
-            viewer.display_table(articles)
+            viewer.browse_table(year=year)
         
         elif cmd == 'details':
             # Détails d'un article
@@ -219,6 +275,13 @@ def main():
             arxiv_id = sys.argv[2]
             viewer.show_article_details(arxiv_id)
         
+        elif cmd == 'similar':
+            # Articles proches d'un article
+            if len(sys.argv) < 3:
+                print("Usage: python3 arxiv_table.py similar <arxiv_id>")
+                return
+            viewer.show_similar(sys.argv[2])
+        
         elif cmd == 'menu':
             # Menu interactif
             viewer.interactive_menu()
@@ -245,11 +308,15 @@ UTILISATION:
 COMMANDES:
 
     menu                    Menu interactif (défaut)
-    all [limite]            Afficher tous les articles (défaut: 50)
+    all [page]              Afficher tous les articles, par pages (défaut: 50)
     search <mot-clé>        Rechercher par mot-clé
     cat <catégorie>         Filtrer par catégorie
+    author <nom>            Articles d'un auteur (nom complet, nom de famille
+                            ou début du nom; casse et accents ignorés)
+    coauthors <nom>         Co-auteurs et collaborateurs à deux pas d'un auteur
     year <année>            Filtrer par année
     details <arxiv_id>      Afficher les détails d'un article
+    similar <arxiv_id>      Articles proches d'un article
 
 EXEMPLES:
 
@@ -257,7 +324,7 @@ EXEMPLES:
     python3 arxiv_table.py
     python3 arxiv_table.py menu
     
-    # Afficher les 100 derniers articles
+    # Afficher les articles par pages de 100
     python3 arxiv_table.py all 100
     
     # Rechercher "Poisson"
@@ -266,13 +333,23 @@ EXEMPLES:
     # Articles de math.SG
     python3 arxiv_table.py cat math.SG
     
+    # Articles d'un auteur
+    python3 arxiv_table.py author "Maxim Kontsevich"
+    
+    # Co-auteurs d'un auteur
+    python3 arxiv_table.py coauthors Kontsevich
+    
     # Articles de 2024
     python3 arxiv_table.py year 2024
     
     # Détails d'un article
     python3 arxiv_table.py details 2511.16644v1
+    
+    # Articles proches
+    python3 arxiv_table.py similar 2511.16644
 
-📝 Note: La base de données doit être créée avec arxiv_collector.py
+📝 Note: La base de données doit être créée avec arxiv_collector.py.
+    Les résultats s'affichent par pages: [Entrée] pour la suivante.
     """)
 
 
@@ -12,6 +12,6 @@ echo "Mise à jour: $(date)" >> "$LOG_FILE"
 echo "==================================================" >> "$LOG_FILE"
 
 # Exécution
-python3 "$PYTHON_SCRIPT" update 2 >> "$LOG_FILE" 2>&1
+python3 "$PYTHON_SCRIPT" update >> "$LOG_FILE" 2>&1
 
 echo "" >> "$LOG_FILE"
@@ -0,0 +1,263 @@
+#!/usr/bin/env python3
+"""Corpus de pages Atom arXiv pour les benchmarks
+
+Les pages de `fixtures/` reproduisent le format exact des réponses de
+l'API de recherche arXiv (en-tête OpenSearch, liens, DOI, commentaires,
+affiliations, cross-lists). Elles sont générées de façon déterministe;
+`--record` enregistre à la place de vraies pages depuis l'API. Les mêmes
+articles peuvent être rendus en enregistrements OAI-PMH (arXivRaw).
+
+    python3 benchmarks/atom_corpus.py             # régénère le corpus synthétique
+    python3 benchmarks/atom_corpus.py --record    # enregistre des pages réelles
+"""
+
+import glob
+import gzip
+import os
+import random
+import sys
+from datetime import datetime, timedelta
+from xml.sax.saxutils import escape
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+FIXTURES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures")
+
+CATEGORIES = ['math.DG', 'math.SG', 'math-ph', 'math.AG', 'math.QA', 'math.RT']
+OTHER_CATEGORIES = ['math.DS', 'math.GT', 'hep-th', 'math.AT', 'math.CT', 'math.NT']
+
+WORDS = (
+    "symplectic manifold Poisson structure Lie algebroid moduli space of stable "
+    "sheaves deformation quantization Hamiltonian action Kähler metric Calabi-Yau "
+    "Floer homology Fukaya category mirror symmetry quantum group Hopf algebra "
+    "representation theory of reductive groups Hitchin fibration Higgs bundles "
+    "gauge theory Yang-Mills connection curvature flow Ricci soliton holonomy "
+    "Lagrangian submanifold contact geometry Legendrian knot derived category "
+    "stack cohomology vertex operator algebra conformal field theory integrable "
+    "system Yang-Baxter equation cluster algebra crystal basis Weyl group we prove "
+    "that show construct study the a an of in for with on is are this paper new "
+    "result main theorem conjecture generalization classification invariant"
+).split()
+
+SURNAMES = ("Martin Bernard Dubois Thomas Robert Richard Petit Durand Leroy Moreau "
+            "Smith Johnson Li Wang Zhang Chen Müller Schmidt Rossi Kowalski Tanaka "
+            "Suzuki Ivanov Petrov Nguyen García Silva Cohen Ait-Mohamed O'Brien").split()
+GIVEN = ("Jean Marie Pierre Anne Louis Claire John Mary Wei Yuki Hans Sofia Ivan "
+         "Amina Carlos Lucia Yassine Noor Olga Kenji").split()
+
+
+def sentence(rng, low, high):
+    """Phrase pseudo-mathématique de longueur aléatoire"""
+    return " ".join(rng.choice(WORDS) for _ in range(rng.randint(low, high)))
+
+
+def wrap(text, width=70, indent="  "):
+    """Coupe le texte sur plusieurs lignes comme le fait l'API arXiv"""
+    lines, line = [], []
+    for word in text.split():
+        if line and len(" ".join(line + [word])) > width:
+            lines.append(" ".join(line))
+            line = []
+        line.append(word)
+    lines.append(" ".join(line))
+    return ("\n" + indent).join(lines)
+
+
+def make_paper(rng, number, primary, published):
+    """Métadonnées pseudo-aléatoires d'un article (rendues en Atom ou en arXivRaw)"""
+    version = rng.choice([1, 1, 1, 2, 3])
+    updated = published + timedelta(days=rng.choice([0, 0, 0, 3, 40]) if version > 1 else 0)
+    categories = [primary] + rng.sample([c for c in CATEGORIES + OTHER_CATEGORIES if c != primary],
+                                        rng.choice([0, 0, 1, 1, 2, 3]))
+    title = wrap(sentence(rng, 5, 18).capitalize())
+    abstract = wrap(sentence(rng, 80, 260).capitalize() + '.')
+    authors = []
+    for _ in range(rng.choice([1, 1, 2, 2, 2, 3, 4, 6])):
+        name = f"{rng.choice(GIVEN)} {rng.choice(SURNAMES)}"
+        authors.append((name, 'Université de Sherbrooke' if rng.random() < 0.2 else None))
+    doi = None
+    if rng.random() < 0.3:
+        doi = f"10.{rng.randint(1000, 9999)}/{rng.randint(100000, 999999)}"
+    comment = None
+    if rng.random() < 0.6:
+        comment = f"{rng.randint(8, 90)} pages, {rng.randint(0, 12)} figures"
+    return {
+        'id': f"{published:%y%m}.{number:05d}",
+        'version': version,
+        'published': published,
+        'updated': updated,
+        'title': title,
+        'abstract': abstract,
+        'authors': authors,
+        'categories': categories,
+        'doi': doi,
+        'comment': comment,
+    }
+
+
+def make_entry(paper):
+    """Une entrée Atom au format de l'API arXiv"""
+    arxiv_id = f"{paper['id']}v{paper['version']}"
+    parts = [
+        "  <entry>",
+        f"    <id>http://arxiv.org/abs/{arxiv_id}</id>",
+        f"    <updated>{paper['updated']:%Y-%m-%dT%H:%M:%SZ}</updated>",
+        f"    <published>{paper['published']:%Y-%m-%dT%H:%M:%SZ}</published>",
+        f"    <title>{escape(paper['title'])}</title>",
+        f"    <summary>  {escape(paper['abstract'])}\n</summary>",
+    ]
+    for name, affiliation in paper['authors']:
+        parts.append("    <author>")
+        parts.append(f"      <name>{escape(name)}</name>")
+        if affiliation:
+            parts.append('      <arxiv:affiliation xmlns:arxiv="http://arxiv.org/schemas/atom">'
+                         f'{escape(affiliation)}</arxiv:affiliation>')
+        parts.append("    </author>")
+    if paper['doi']:
+        parts.append(f'    <arxiv:doi xmlns:arxiv="http://arxiv.org/schemas/atom">{paper["doi"]}</arxiv:doi>')
+        parts.append(f'    <link title="doi" href="http://dx.doi.org/{paper["doi"]}" rel="related"/>')
+    if paper['comment']:
+        parts.append(f'    <arxiv:comment xmlns:arxiv="http://arxiv.org/schemas/atom">'
+                     f'{escape(paper["comment"])}</arxiv:comment>')
+    parts.append(f'    <link href="http://arxiv.org/abs/{arxiv_id}" rel="alternate" type="text/html"/>')
+    parts.append(f'    <link title="pdf" href="http://arxiv.org/pdf/{arxiv_id}" rel="related" type="application/pdf"/>')
+    parts.append(f'    <arxiv:primary_category xmlns:arxiv="http://arxiv.org/schemas/atom" '
+                 f'term="{paper["categories"][0]}" scheme="http://arxiv.org/schemas/atom"/>')
+    for category in paper['categories']:
+        parts.append(f'    <category term="{category}" scheme="http://arxiv.org/schemas/atom"/>')
+    parts.append("  </entry>")
+    return "\n".join(parts)
+
+
+def make_oai_record(paper):
+    """Un enregistrement OAI-PMH au format arXivRaw"""
+    authors = ", ".join(f"{name} ({affiliation})" if affiliation else name
+                        for name, affiliation in paper['authors'])
+    parts = [
+        "<record>",
+        f"<header><identifier>oai:arXiv.org:{paper['id']}</identifier>"
+        f"<datestamp>{paper['updated']:%Y-%m-%d}</datestamp><setSpec>math</setSpec></header>",
+        "<metadata>",
+        '<arXivRaw xmlns="http://arxiv.org/OAI/arXivRaw/" '
+        'xmlns:xsi="http://www.w3.org/2001/XMLSchema-instance">',
+        f"<id>{paper['id']}</id>",
+        "<submitter>Yassine Ait-Mohamed</submitter>",
+    ]
+    for version in range(1, paper['version'] + 1):
+        date = paper['published'] if version == 1 else paper['updated']
+        parts.append(f'<version version="v{version}"><date>{date:%a, %d %b %Y %H:%M:%S} GMT</date>'
+                     f'<size>{100 + version}kb</size><source_type>D</source_type></version>')
+    parts += [
+        f"<title>{escape(paper['title'])}</title>",
+        f"<authors>{escape(authors)}</authors>",
+        f"<categories>{' '.join(paper['categories'])}</categories>",
+    ]
+    if paper['comment']:
+        parts.append(f"<comments>{escape(paper['comment'])}</comments>")
+    if paper['doi']:
+        parts.append(f"<doi>{paper['doi']}</doi>")
+    parts += [
+        "<license>http://arxiv.org/licenses/nonexclusive-distrib/1.0/</license>",
+        f"<abstract>  {escape(paper['abstract'])}\n</abstract>",
+        "</arXivRaw>",
+        "</metadata>",
+        "</record>",
+    ]
+    return "\n".join(parts)
+
+
+def make_oai_response(records, token=None, cursor=0, size=None, verb="ListRecords"):
+    """Enveloppe OAI-PMH d'une réponse ListRecords (jeton vide sur la dernière)"""
+    parts = [
+        '<?xml version="1.0" encoding="UTF-8"?>',
+        '<OAI-PMH xmlns="http://www.openarchives.org/OAI/2.0/" '
+        'xmlns:xsi="http://www.w3.org/2001/XMLSchema-instance">',
+        '<responseDate>2024-06-01T00:00:00Z</responseDate>',
+        f'<request verb="{verb}">http://export.arxiv.org/oai2</request>',
+    ]
+    if not records and not cursor:
+        parts.append('<error code="noRecordsMatch">No records match the request</error>')
+    else:
+        parts.append(f"<{verb}>")
+        parts += list(records)
+        if token is not None or cursor:
+            parts.append(f'<resumptionToken cursor="{cursor}" completeListSize="{size}">'
+                         f'{escape(token or "")}</resumptionToken>')
+        parts.append(f"</{verb}>")
+    parts += ['</OAI-PMH>', '']
+    return "\n".join(parts)
+
+
+def make_feed(entries, total, start=0, query="cat:math.SG"):
+    """Enveloppe Atom/OpenSearch d'une page de résultats"""
+    return "\n".join([
+        '<?xml version="1.0" encoding="UTF-8"?>',
+        '<feed xmlns="http://www.w3.org/2005/Atom">',
+        f'  <link href="http://arxiv.org/api/query?search_query={escape(query)}" rel="self" type="application/atom+xml"/>',
+        f'  <title type="html">ArXiv Query: search_query={escape(query)}</title>',
+        '  <id>http://arxiv.org/api/corpus</id>',
+        '  <updated>2024-06-01T00:00:00-04:00</updated>',
+        f'  <opensearch:totalResults xmlns:opensearch="http://a9.com/-/spec/opensearch/1.1/">{total}</opensearch:totalResults>',
+        f'  <opensearch:startIndex xmlns:opensearch="http://a9.com/-/spec/opensearch/1.1/">{start}</opensearch:startIndex>',
+        f'  <opensearch:itemsPerPage xmlns:opensearch="http://a9.com/-/spec/opensearch/1.1/">{len(entries)}</opensearch:itemsPerPage>',
+    ] + list(entries) + ['</feed>', ''])
+
+
+def synthetic_papers(count, seed=0, start_date=datetime(2024, 1, 1)):
+    """Génère `count` articles déterministes, par date de soumission croissante"""
+    rng = random.Random(seed)
+    published = start_date
+    for number in range(1, count + 1):
+        published += timedelta(seconds=rng.randint(60, 3600))
+        yield make_paper(rng, number, rng.choice(CATEGORIES), published)
+
+
+def write_synthetic(pages=4, page_size=250):
+    """Régénère le corpus synthétique de `fixtures/`"""
+    entries = [make_entry(paper) for paper in synthetic_papers(pages * page_size)]
+    total = len(entries)
+    for page in range(pages):
+        start = page * page_size
+        xml = make_feed(entries[start:start + page_size], total, start)
+        write_page(page, xml.encode("utf-8"))
+
+
+def record(pages=4, page_size=250, query="cat:math.SG"):
+    """Enregistre de vraies pages depuis l'API arXiv"""
+    sys.path.insert(0, ROOT)
+    from arxiv_client import ArxivClient
+    
+    client = ArxivClient()
+    for page in range(pages):
+        response = client.query({
+            'search_query': query,
+            'start': page * page_size,
+            'max_results': page_size,
+            'sortBy': 'submittedDate',
+            'sortOrder': 'ascending'
+        })
+        write_page(page, response.content)
+
+
+def write_page(page, content):
+    """Écrit une page compressée dans `fixtures/`"""
+    os.makedirs(FIXTURES_DIR, exist_ok=True)
+    path = os.path.join(FIXTURES_DIR, f"atom_page_{page:02d}.xml.gz")
+    with gzip.GzipFile(path, "wb", mtime=0) as f:
+        f.write(content)
+    print(f"💾 {path} ({len(content) // 1024} Ko)")
+
+
+def load_corpus():
+    """Pages du corpus, décompressées, sous forme de bytes"""
+    pages = []
+    for path in sorted(glob.glob(os.path.join(FIXTURES_DIR, "atom_page_*.xml.gz"))):
+        with gzip.open(path, "rb") as f:
+            pages.append(f.read())
+    return pages
+
+
+if __name__ == "__main__":
+    if "--record" in sys.argv:
+        record()
+    else:
+        write_synthetic()
@@ -0,0 +1,165 @@
+#!/usr/bin/env python3
+"""Benchmark de bout en bout: fetch → parse → save contre le serveur local
+
+Lance benchmarks/mock_server.py dans un processus séparé, puis exécute
+`init` puis `update` (après publication des articles retenus) avec un
+limiteur de débit réduit. Pour chaque phase: requêtes HTTP, entrées
+sauvegardées (écrites ou inchangées) et entrées/s, nouveaux articles en
+base, temps passé dans save_articles et RSS maximal du processus
+collecteur.
+
+    python3 benchmarks/bench_ingest.py --papers 5000 --interval 0.01 --latency 0.02
+    python3 benchmarks/bench_ingest.py --backend oai --json
+    python3 benchmarks/bench_ingest.py --backend oai --bulk   # init en chargement massif
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import multiprocessing
+import os
+import resource
+import sqlite3
+import sys
+import tempfile
+import time
+import urllib.request
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from arxiv_collector import DEFAULT_CATEGORIES, ArxivCollector
+from mock_server import MockArxiv, start_server
+
+
+class TimedCollector(ArxivCollector):
+    """ArxivCollector qui mesure le temps passé à écrire en base et compte
+    les entrées sauvegardées (insérées, mises à jour ou inchangées)"""
+    
+    write_time = 0.0
+    entries = 0
+    
+    def save_articles(self, articles, checkpoint=None, percolate=False):
+        start = time.perf_counter()
+        try:
+            result = super().save_articles(articles, checkpoint, percolate)
+        finally:
+            self.write_time += time.perf_counter() - start
+        self.entries += result.inserted + result.updated + result.unchanged
+        return result
+
+
+def serve(options, urls):
+    """Processus serveur: publie son URL puis sert jusqu'à sa terminaison"""
+    mock = MockArxiv(options['papers'], latency=options['latency'],
+                     error_rate=options['error_rate'], holdback=options['holdback'])
+    _, base_url = start_server(mock)
+    urls.put(base_url)
+    while True:
+        time.sleep(3600)
+
+
+def server_requests(base_url):
+    """Nombre de requêtes (et d'erreurs simulées) vues par le serveur"""
+    with urllib.request.urlopen(f"{base_url}/admin/stats") as response:
+        requests, errors = response.read().split()
+    return int(requests), int(errors)
+
+
+def peak_rss_mb():
+    """RSS maximal du processus courant, en Mo (ru_maxrss est en Ko sous Linux)"""
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / (1024 * 1024) if sys.platform == 'darwin' else peak / 1024
+
+
+def count_articles(db_path):
+    conn = sqlite3.connect(db_path)
+    count = conn.execute("SELECT COUNT(*) FROM articles").fetchone()[0]
+    conn.close()
+    return count
+
+
+def run_phase(name, collector, base_url, action, verbose):
+    """Exécute une phase et renvoie ses mesures"""
+    requests_before, errors_before = server_requests(base_url)
+    articles_before = count_articles(collector.db_path)
+    collector.write_time = 0.0
+    collector.entries = 0
+    
+    output = contextlib.nullcontext() if verbose else contextlib.redirect_stdout(io.StringIO())
+    start = time.perf_counter()
+    with output:
+        action()
+    elapsed = time.perf_counter() - start
+    
+    requests_after, errors_after = server_requests(base_url)
+    # Débit sur les entrées lues et sauvegardées: en `update`, la plupart
+    # sont déjà en base et ne changent pas le nombre de lignes
+    return {
+        'phase': name,
+        'requests': requests_after - requests_before,
+        'errors': errors_after - errors_before,
+        'entries': collector.entries,
+        'new_articles': count_articles(collector.db_path) - articles_before,
+        'seconds': round(elapsed, 3),
+        'entries_per_second': round(collector.entries / elapsed, 1) if elapsed else None,
+        'db_write_seconds': round(collector.write_time, 3),
+        'peak_rss_mb': round(peak_rss_mb(), 1),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--papers", type=int, default=5000, help="taille de la collection (défaut: 5000)")
+    parser.add_argument("--holdback", type=int, default=200, help="nouveautés publiées avant `update`")
+    parser.add_argument("--interval", type=float, default=0.01, help="espacement des requêtes en s (arXiv: 3)")
+    parser.add_argument("--latency", type=float, default=0.0, help="latence serveur par requête en s")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="part des requêtes en 503")
+    parser.add_argument("--backend", choices=['api', 'oai'], default='api', help="backend de `init`")
+    parser.add_argument("--bulk", action="store_true", help="`init` en mode chargement massif")
+    parser.add_argument("--json", action="store_true", help="sortie JSON (pour la CI)")
+    parser.add_argument("--verbose", action="store_true", help="afficher la sortie du collecteur")
+    args = parser.parse_args()
+    
+    urls = multiprocessing.Queue()
+    server = multiprocessing.Process(target=serve, args=(vars(args), urls), daemon=True)
+    server.start()
+    base_url = urls.get(timeout=60)
+    
+    results = []
+    try:
+        with tempfile.TemporaryDirectory() as tmp:
+            collector = TimedCollector(db_path=os.path.join(tmp, "bench.db"),
+                                       request_interval=args.interval,
+                                       base_url=f"{base_url}/api/query",
+                                       oai_url=f"{base_url}/oai2")
+            # Les nouveaux essais suivent l'échelle du limiteur
+            collector.client.backoff = max(args.interval, 0.01)
+            categories = list(DEFAULT_CATEGORIES)
+            
+            results.append(run_phase(
+                'init', collector, base_url,
+                lambda: collector.initial_collection(categories, start_year=2024, backend=args.backend,
+                                                     bulk=args.bulk),
+                args.verbose))
+            urllib.request.urlopen(f"{base_url}/admin/release").read()
+            results.append(run_phase(
+                'update', collector, base_url,
+                lambda: collector.update_collection(categories),
+                args.verbose))
+    finally:
+        server.terminate()
+    
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return
+    
+    for result in results:
+        print(f"📊 {result['phase']:<6} {result['requests']:>5} requêtes ({result['errors']} en erreur) | "
+              f"{result['entries']:>6} entrées en {result['seconds']:.2f} s "
+              f"({result['entries_per_second'] or 0:,.0f} entrées/s, {result['new_articles']} nouveaux articles) | "
+              f"écriture DB {result['db_write_seconds']:.2f} s | RSS max {result['peak_rss_mb']:.0f} Mo")
+
+
+if __name__ == "__main__":
+    main()
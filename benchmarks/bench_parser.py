@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+"""Benchmark du parseur Atom (ArxivCollector.iter_arxiv_entries)
+
+Parse les pages de `fixtures/` en boucle et affiche le débit en entrées
+par seconde (meilleur essai). Avec `--min-rate N`, le script échoue si le
+débit passe sous N entrées/s, pour repérer les régressions en CI.
+
+    python3 benchmarks/bench_parser.py [--repeat 5] [--min-rate 20000]
+"""
+
+import argparse
+import io
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from arxiv_collector import DEFAULT_CATEGORIES, ArxivCollector
+from atom_corpus import load_corpus
+
+
+def run(collector, pages):
+    """Parse toutes les pages une fois, renvoie le nombre d'articles"""
+    count = 0
+    for content in pages:
+        for _ in collector.iter_arxiv_entries(io.BytesIO(content), DEFAULT_CATEGORIES):
+            count += 1
+    return count
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=5, help="nombre d'essais (défaut: 5)")
+    parser.add_argument("--min-rate", type=float, default=None, help="débit minimal attendu (entrées/s)")
+    args = parser.parse_args()
+    
+    pages = load_corpus()
+    if not pages:
+        sys.exit("❌ Corpus vide: lancez benchmarks/atom_corpus.py")
+    size = sum(len(content) for content in pages)
+    
+    with tempfile.TemporaryDirectory() as tmp:
+        collector = ArxivCollector(db_path=os.path.join(tmp, "bench.db"))
+        best = None
+        for _ in range(args.repeat):
+            start = time.perf_counter()
+            count = run(collector, pages)
+            elapsed = time.perf_counter() - start
+            best = elapsed if best is None else min(best, elapsed)
+    
+    rate = count / best
+    print(f"📄 {len(pages)} pages, {count} entrées, {size / 1e6:.1f} Mo")
+    print(f"⚡ {rate:,.0f} entrées/s ({size / best / 1e6:.1f} Mo/s, meilleur de {args.repeat})")
+    
+    if args.min_rate is not None and rate < args.min_rate:
+        sys.exit(f"❌ Débit sous le seuil: {rate:,.0f} < {args.min_rate:,.0f} entrées/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,249 @@
+#!/usr/bin/env python3
+"""Serveur arXiv local pour les benchmarks et les essais hors ligne
+
+Sert une collection d'articles synthétiques (voir atom_corpus.py) via
+l'API de recherche (`/api/query`: requêtes cat:/submittedDate, tri,
+pagination start/max_results) et via OAI-PMH (`/oai2`, ListRecords au
+format arXivRaw avec jetons de reprise). Latence et taux d'erreurs 503
+sont configurables, ainsi que des pages de l'API renvoyées vides ou
+tronquées (comme arXiv le fait parfois avant la fin du résultat) ou
+coupées en cours de corps, et des jetons OAI en
+échec (503) ou expirés (badResumptionToken); `--holdback N` cache les N articles les plus récents
+jusqu'à un appel à `/admin/release`, pour simuler l'arrivée de nouveautés.
+
+    python3 benchmarks/mock_server.py --port 8080 --papers 5000 --latency 0.05
+    # ArxivCollector(base_url="http://127.0.0.1:8080/api/query",
+    #                oai_url="http://127.0.0.1:8080/oai2")
+"""
+
+import argparse
+import gzip
+import os
+import random
+import re
+import sys
+import threading
+import time
+import urllib.parse
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from arxiv_oai import oai_set
+from atom_corpus import make_entry, make_feed, make_oai_record, make_oai_response, synthetic_papers
+
+CATEGORY_RE = re.compile(r'cat:([\w.\-]+)')
+DATE_RANGE_RE = re.compile(r'submittedDate:\[(\d{12}) TO (\d{12})\]')
+
+# Plafond de max_results appliqué par l'API arXiv
+MAX_RESULTS = 2000
+
+
+class MockArxiv:
+    """Collection synthétique et réponses API/OAI-PMH correspondantes"""
+    
+    def __init__(self, papers=2000, seed=0, oai_batch_size=500, latency=0.0,
+                 error_rate=0.0, holdback=0, empty_pages=None, short_pages=None, broken_pages=None):
+        self.all_papers = list(synthetic_papers(papers, seed))
+        # Retenir les `holdback` derniers articles revient à arrêter l'horloge
+        # juste avant leur soumission: les révisions postérieures sont cachées aussi
+        self.cutoff = self.all_papers[-holdback]['published'] if holdback else None
+        self.oai_batch_size = oai_batch_size
+        self.latency = latency
+        self.error_rate = error_rate
+        # {start: nombre de réponses vides à renvoyer pour cette page}
+        self.empty_pages = dict(empty_pages or {})
+        # {start: nombre d'entrées de la prochaine réponse pour cette page (une
+        # fois, sur la première requête dont le résultat va au-delà)}
+        self.short_pages = dict(short_pages or {})
+        # {start: nombre de réponses coupées en cours de corps pour cette page}
+        self.broken_pages = dict(broken_pages or {})
+        # Requêtes OAI avec jeton de reprise à faire échouer (503), jetons expirés
+        self.token_failures = 0
+        self.tokens_expired = False
+        self.random = random.Random(seed)
+        self.requests = 0
+        self.errors = 0
+        self.lock = threading.Lock()
+    
+    @property
+    def papers(self):
+        """Articles actuellement publiés (hors articles retenus par --holdback)"""
+        if self.cutoff is None:
+            return self.all_papers
+        return [paper for paper in self.all_papers if paper['updated'] < self.cutoff]
+    
+    def release(self):
+        """Publie les articles retenus"""
+        self.cutoff = None
+    
+    def count_request(self):
+        """Compte la requête; renvoie True si elle doit échouer (503 simulé)"""
+        with self.lock:
+            self.requests += 1
+            failed = self.random.random() < self.error_rate
+            if failed:
+                self.errors += 1
+            return failed
+    
+    def api_query(self, params):
+        """Réponse Atom de l'API de recherche pour `search_query`"""
+        query = params.get('search_query', '')
+        categories = set(CATEGORY_RE.findall(query))
+        window = DATE_RANGE_RE.search(query)
+        
+        matching = []
+        for paper in self.papers:
+            if categories and not categories.intersection(paper['categories']):
+                continue
+            if window and not (window.group(1) <= f"{paper['published']:%Y%m%d%H%M}" <= window.group(2)):
+                continue
+            matching.append(paper)
+        
+        key = 'updated' if params.get('sortBy') == 'lastUpdatedDate' else 'published'
+        matching.sort(key=lambda paper: paper[key], reverse=params.get('sortOrder') == 'descending')
+        
+        start = int(params.get('start', 0))
+        with self.lock:
+            if self.empty_pages.get(start):
+                self.empty_pages[start] -= 1
+                return 200, make_feed([], len(matching), start, query)
+            short = self.short_pages.get(start)
+            if short is not None and len(matching) > start + short:
+                del self.short_pages[start]
+            else:
+                short = None
+        max_results = min(int(params.get('max_results', 10)), MAX_RESULTS, short or MAX_RESULTS)
+        entries = [make_entry(paper) for paper in matching[start:start + max_results]]
+        return 200, make_feed(entries, len(matching), start, query)
+    
+    def break_response(self, params):
+        """True si la réponse API à `params` doit être coupée en cours de corps"""
+        start = int(params.get('start', 0))
+        with self.lock:
+            if self.broken_pages.get(start):
+                self.broken_pages[start] -= 1
+                return True
+        return False
+    
+    def oai_list_records(self, params):
+        """Réponse ListRecords: le jeton encode le set, la borne `from` et la position"""
+        if 'resumptionToken' in params:
+            with self.lock:
+                if self.token_failures:
+                    self.token_failures -= 1
+                    return 503, 'Service temporarily unavailable'
+            try:
+                if self.tokens_expired:
+                    raise ValueError(params['resumptionToken'])
+                set_spec, from_date, cursor = params['resumptionToken'].rsplit('|', 2)
+                cursor = int(cursor)
+            except ValueError:
+                return 400, ('<?xml version="1.0" encoding="UTF-8"?>'
+                             '<OAI-PMH xmlns="http://www.openarchives.org/OAI/2.0/">'
+                             '<error code="badResumptionToken">Invalid token</error></OAI-PMH>')
+        else:
+            set_spec, from_date, cursor = params.get('set', ''), params.get('from', ''), 0
+        
+        matching = [paper for paper in self.papers
+                    if (not set_spec or any(oai_set(cat) == set_spec for cat in paper['categories']))
+                    and (not from_date or f"{paper['updated']:%Y-%m-%d}" >= from_date)]
+        batch = matching[cursor:cursor + self.oai_batch_size]
+        next_cursor = cursor + len(batch)
+        token = f"{set_spec}|{from_date}|{next_cursor}" if next_cursor < len(matching) else None
+        if not cursor and token is None:
+            token_args = {}
+        else:
+            token_args = {'token': token, 'cursor': cursor, 'size': len(matching)}
+        return 200, make_oai_response([make_oai_record(paper) for paper in batch], **token_args)
+
+
+def make_handler(mock):
+    """Classe de requêtes HTTP liée à une collection MockArxiv"""
+    
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = 'HTTP/1.1'
+        
+        def log_message(self, format, *args):
+            pass
+        
+        def do_GET(self):
+            url = urllib.parse.urlparse(self.path)
+            params = {key: values[0] for key, values in urllib.parse.parse_qs(url.query).items()}
+            
+            if url.path == '/admin/release':
+                mock.release()
+                self.send_body(200, b'released')
+                return
+            if url.path == '/admin/stats':
+                self.send_body(200, f"{mock.requests} {mock.errors}".encode())
+                return
+            
+            if mock.latency:
+                time.sleep(mock.latency)
+            if mock.count_request():
+                self.send_body(503, b'Service temporarily unavailable', {'Retry-After': '0'})
+                return
+            
+            broken = False
+            if url.path.endswith('/api/query'):
+                status, body = mock.api_query(params)
+                broken = mock.break_response(params)
+            elif url.path.endswith('/oai2') and params.get('verb') == 'ListRecords':
+                status, body = mock.oai_list_records(params)
+            else:
+                status, body = 404, 'Not found'
+            self.send_body(status, body.encode('utf-8'), broken=broken)
+        
+        def send_body(self, status, body, headers=None, broken=False):
+            headers = dict(headers or {})
+            if 'gzip' in self.headers.get('Accept-Encoding', ''):
+                body = gzip.compress(body, compresslevel=1)
+                headers['Content-Encoding'] = 'gzip'
+            self.send_response(status)
+            self.send_header('Content-Type', 'text/xml; charset=utf-8')
+            self.send_header('Content-Length', str(len(body)))
+            for name, value in headers.items():
+                self.send_header(name, value)
+            self.end_headers()
+            if broken:
+                # Connexion fermée à mi-corps: le client reçoit moins que Content-Length
+                self.wfile.write(body[:len(body) // 2])
+                self.close_connection = True
+                return
+            self.wfile.write(body)
+    
+    return Handler
+
+
+def start_server(mock, host='127.0.0.1', port=0):
+    """Démarre le serveur dans un thread; renvoie (serveur, URL de base)"""
+    server = ThreadingHTTPServer((host, port), make_handler(mock))
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, f"http://{host}:{server.server_port}"
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--papers", type=int, default=2000, help="taille de la collection (défaut: 2000)")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--latency", type=float, default=0.0, help="latence par requête en secondes")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="part des requêtes en 503 (0-1)")
+    parser.add_argument("--holdback", type=int, default=0, help="articles retenus jusqu'à /admin/release")
+    args = parser.parse_args()
+    
+    mock = MockArxiv(args.papers, args.seed, latency=args.latency,
+                     error_rate=args.error_rate, holdback=args.holdback)
+    server, base_url = start_server(mock, args.host, args.port)
+    print(f"🛰️  Serveur arXiv local: {base_url}/api/query et {base_url}/oai2 ({len(mock.papers)} articles)")
+    try:
+        threading.Event().wait()
+    except KeyboardInterrupt:
+        server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
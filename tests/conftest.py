@@ -0,0 +1,32 @@
+"""Fixtures des tests: serveur arXiv local (benchmarks/mock_server.py) et collecteur branché dessus"""
+
+import os
+import sys
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.join(ROOT, "benchmarks"))
+
+from arxiv_collector import ArxivCollector
+from mock_server import start_server
+
+
+@pytest.fixture
+def make_collector(tmp_path):
+    """Fabrique de collecteurs (base dans tmp_path) interrogeant un MockArxiv servi en local"""
+    servers = []
+    
+    def make(mock, db_name="arxiv_test.db"):
+        server, base_url = start_server(mock)
+        servers.append(server)
+        collector = ArxivCollector(db_path=str(tmp_path / db_name), request_interval=0.0,
+                                   base_url=f"{base_url}/api/query", oai_url=f"{base_url}/oai2")
+        collector.client.backoff = 0.01
+        return collector
+    
+    yield make
+    for server in servers:
+        server.shutdown()
+        server.server_close()
@@ -0,0 +1,38 @@
+"""Abonnements: alertes enregistrées avec la page qui les déclenche"""
+
+import json
+
+import pytest
+
+from arxiv_collector import DEFAULT_CATEGORIES
+from mock_server import MockArxiv
+
+CATEGORIES = list(DEFAULT_CATEGORIES)
+
+
+def test_alerts_committed_with_their_page(make_collector):
+    mock = MockArxiv(600, holdback=300)
+    collector = make_collector(mock)
+    collector.initial_collection(CATEGORIES, start_year=2024)
+    collector.subscribe("sg", category="math.SG")
+    
+    # Arrêt juste après la validation de la première page de la mise à jour
+    save_articles = collector.save_articles
+    saved = []
+    
+    def save_then_fail(articles, checkpoint=None, percolate=False):
+        result = save_articles(articles, checkpoint, percolate)
+        saved.append(result)
+        raise RuntimeError("arrêt après le commit")
+    
+    collector.save_articles = save_then_fail
+    mock.release()
+    with pytest.raises(RuntimeError):
+        collector.update_collection(CATEGORIES)
+    
+    # Les alertes de la page validée sont en base
+    expected = {arxiv_id for arxiv_id, in collector.db.conn.execute(
+        "SELECT arxiv_id FROM article_categories WHERE category = 'math.SG' "
+        "AND arxiv_id IN (SELECT value FROM json_each(?))", (json.dumps(sorted(saved[0].written)),))}
+    assert expected
+    assert {alert.arxiv_id for alert in collector.db.get_alerts(name="sg")} == expected
@@ -0,0 +1,194 @@
+"""Base partagée (arxiv_db): migration à l'ouverture, transactions, requêtes"""
+
+import sqlite3
+import threading
+import time
+
+import pytest
+
+from arxiv_authors import build_coauthor_graph, find_author
+from arxiv_columnar import export_columnar
+from arxiv_db import SCHEMA_VERSION, ArxivDatabase
+from arxiv_table import TABLE_COLUMNS, ArxivTableViewer
+
+
+def make_article(arxiv_id, title, abstract="", authors="Ana Lima", categories=("math.SG",),
+                 version=1, updated="2024-01-02 00:00:00+00:00"):
+    """Article au format de save_articles"""
+    return {'arxiv_id': arxiv_id, 'title': title, 'abstract': abstract, 'authors': authors,
+            'category': categories[0], 'categories': list(categories),
+            'published': "2024-01-02 00:00:00+00:00", 'updated': updated,
+            'link': f"http://arxiv.org/abs/{arxiv_id}v{version}",
+            'pdf_link': f"http://arxiv.org/pdf/{arxiv_id}v{version}", 'version': version}
+
+
+@pytest.fixture
+def db(tmp_path):
+    database = ArxivDatabase(str(tmp_path / "arxiv_test.db"))
+    database.init_schema()
+    yield database
+    database.close()
+
+
+def create_legacy_database(path):
+    """Base telle que l'écrivait la première version du collecteur"""
+    conn = sqlite3.connect(path)
+    conn.execute('''
+        CREATE TABLE articles (
+            arxiv_id TEXT PRIMARY KEY, title TEXT, authors TEXT, abstract TEXT,
+            category TEXT, published DATE, updated DATE, link TEXT, pdf_link TEXT,
+            last_fetched TIMESTAMP
+        )
+    ''')
+    conn.execute("CREATE TABLE fetch_log (id INTEGER PRIMARY KEY AUTOINCREMENT, category TEXT,"
+                 " fetch_date TIMESTAMP, articles_count INTEGER)")
+    conn.execute("INSERT INTO articles VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                 ('2401.00001v1', 'Symplectic capacities', 'Ana Lima; Bo Chen', 'On capacities.',
+                  'math.SG', '2024-01-02T00:00:00', '2024-01-02T00:00:00',
+                  'http://arxiv.org/abs/2401.00001v1', 'http://arxiv.org/pdf/2401.00001v1', None))
+    conn.commit()
+    conn.close()
+
+
+def test_viewer_migrates_legacy_database(tmp_path):
+    path = str(tmp_path / "legacy.db")
+    create_legacy_database(path)
+    
+    viewer = ArxivTableViewer(path)
+    rows = viewer.get_page(search_query="symplectic").rows
+    assert [row[:3] for row in rows] == [('2401.00001', 'Symplectic capacities', 'Ana Lima')]
+    assert viewer.db.conn.execute("PRAGMA user_version").fetchone()[0] == SCHEMA_VERSION
+    
+    # Base à jour: ouverte telle quelle
+    reopened = ArxivDatabase(path)
+    reopened.ensure_schema()
+    assert len(reopened.search_page(TABLE_COLUMNS, author="ana lima").rows) == 1
+
+
+def test_unsearchable_keyword_finds_nothing(db):
+    db.save_articles([make_article('2401.00001', "Symplectic capacities")])
+    
+    # Aucun terme cherchable: page vide, et non la collection entière
+    assert db.search_page("a.arxiv_id", keyword="-").rows == []
+    assert db.search_page("a.arxiv_id", keyword="*").rows == []
+    assert db.search_page("a.arxiv_id", keyword="   ").rows == [('2401.00001',)]
+    
+    with pytest.raises(ValueError):
+        db.subscribe("vide", keywords="- *")
+    assert db.get_subscriptions() == []
+
+
+def test_concurrent_writers_do_not_apply_stale_reads(db):
+    db.save_articles([make_article('2401.00001', "Alpha paper", version=1)])
+    other = ArxivDatabase(db.db_path)
+    other_results = []
+    
+    def save_v2():
+        other_results.append(other.save_articles([make_article(
+            '2401.00001', "Bravo paper", version=2, updated="2024-02-01 00:00:00+00:00")]))
+        other.close()
+    
+    # Pendant l'écriture de v3, après sa lecture de l'article en base, un
+    # autre processus tente d'écrire v2: il doit attendre la fin de v3
+    read_texts = db.read_texts
+    
+    def read_then_race(cursor, ids):
+        texts = read_texts(cursor, ids)
+        if not other_results:
+            writer = threading.Thread(target=save_v2)
+            writer.start()
+            writer.join(timeout=1.0)
+        return texts
+    
+    db.read_texts = read_then_race
+    db.save_articles([make_article('2401.00001', "Charlie paper", version=3,
+                                   updated="2024-03-01 00:00:00+00:00")])
+    del db.read_texts
+    while not other_results:
+        time.sleep(0.01)
+    
+    assert db.get_article('2401.00001')[1] == "Charlie paper"
+    for word, found in (("alpha", 0), ("bravo", 0), ("charlie", 1)):
+        assert len(db.search_page("a.arxiv_id", keyword=word).rows) == found
+        count = db.conn.execute("SELECT articles FROM stats_terms WHERE term = ?", (word,)).fetchone()
+        assert (count[0] if count else 0) == found
+    
+    # Toute version écrite puis remplacée est archivée
+    versions = [revision.version for revision in db.get_revisions('2401.00001')]
+    assert versions == ([2, 1] if other_results[0].written else [1])
+
+
+def test_incremental_export_sees_late_commits(db, tmp_path):
+    path = str(tmp_path / "columnar")
+    other = ArxivDatabase(db.db_path)
+    
+    # Lot préparé (et horodaté) avant un lot d'un autre processus, mais
+    # validé après lui et après l'export suivant
+    prepared = threading.Event()
+    release = threading.Event()
+    transaction = db.transaction
+    
+    def delayed_transaction():
+        prepared.set()
+        release.wait(5.0)
+        return transaction()
+    
+    db.transaction = delayed_transaction
+    writer = threading.Thread(target=db.save_articles, args=([make_article('2401.00001', "Late paper")],))
+    writer.start()
+    prepared.wait(5.0)
+    other.save_articles([make_article('2401.00002', "Early paper")])
+    assert export_columnar(other, path).appended == 1
+    
+    release.set()
+    writer.join()
+    del db.transaction
+    result = export_columnar(other, path)
+    assert (result.appended, result.rows) == (1, 2)
+    other.close()
+
+
+def test_duplicate_threshold_below_stored_pairs_is_rejected(db):
+    abstract = "We compute symplectic capacities of convex domains in four dimensions " * 3
+    db.save_articles([make_article('2401.00001', "Capacities of convex domains", abstract),
+                      make_article('2401.00002', "Capacities of convex domains", abstract + "Revised.")])
+    assert db.duplicate_clusters() == [['2401.00001', '2401.00002']]
+    with pytest.raises(ValueError):
+        db.duplicate_clusters(0.5)
+
+
+def test_coauthor_graph_and_author_lookup(db, capsys):
+    db.save_articles([make_article('2401.00001', "First", authors="Ana Lima; Bo Chen"),
+                      make_article('2401.00002', "Second", authors="Bo Chen; Chloé Roy"),
+                      make_article('2401.00003', "Third", authors="ana lima; Bo Li")])
+    lima = find_author(db, "Lima")
+    chen = find_author(db, "Bo Chen")
+    assert lima.articles == 2
+    
+    graph = build_coauthor_graph(db)
+    names = db.author_names(graph.neighbours(lima.id))
+    assert sorted(names.values()) == ["Bo Chen", "Bo Li"]
+    assert graph.neighbours(lima.id)[chen.id] == 1
+    assert list(db.author_names(graph.two_hop(lima.id)).values()) == ["Chloé Roy"]
+    
+    # Nom ambigu: candidats listés, aucun auteur choisi
+    assert find_author(db, "Bo") is None
+    assert "Plusieurs auteurs" in capsys.readouterr().out
+
+
+def test_older_version_never_overwrites(db):
+    db.save_articles([make_article('2401.00001', "Revised title", version=2, categories=("math.SG", "math.DG"),
+                                   updated="2024-02-01 00:00:00+00:00")])
+    
+    # Version plus ancienne, catégories différentes (passe par catégorie): ignorée
+    result = db.save_articles([make_article('2401.00001', "Original title", version=1)])
+    assert (result.updated, result.unchanged) == (0, 1)
+    article = db.get_article('2401.00001')
+    assert (article[1], article[10], article[14]) == ("Revised title", "math.SG math.DG", 2)
+    
+    # Même version, nouvelle catégorie: réécrite
+    result = db.save_articles([make_article('2401.00001', "Revised title", version=2,
+                                            categories=("math.SG", "math.DG", "math-ph"),
+                                            updated="2024-02-01 00:00:00+00:00")])
+    assert result.updated == 1
+    assert db.get_article('2401.00001')[10] == "math.SG math.DG math-ph"
@@ -0,0 +1,116 @@
+"""Collecte par l'API de recherche: pages vides, courtes ou coupées avant la fin du résultat"""
+
+from arxiv_collector import DEFAULT_CATEGORIES, EMPTY_PAGE_RETRIES, PAGE_READ_RETRIES
+from mock_server import MockArxiv
+
+CATEGORIES = list(DEFAULT_CATEGORIES)
+
+
+def count_articles(collector):
+    return collector.db.conn.execute("SELECT COUNT(*) FROM articles").fetchone()[0]
+
+
+def window_checkpoint(collector, year):
+    """Point de reprise de la fenêtre annuelle `year` (page suivante, terminé, fin, jeton)"""
+    return next(checkpoint for (_, window_start), checkpoint in collector.get_checkpoints().items()
+                if window_start.startswith(str(year)))
+
+
+def test_update_retries_empty_page(make_collector):
+    mock = MockArxiv(1000, holdback=700)
+    collector = make_collector(mock)
+    collector.initial_collection(CATEGORIES, start_year=2024)
+    assert count_articles(collector) < 500
+    
+    # Deuxième page (start=500) vide une fois: redemandée, rien n'est perdu
+    mock.release()
+    mock.empty_pages = {500: 1}
+    collector.update_collection(CATEGORIES)
+    assert count_articles(collector) == 1000
+
+
+def test_update_follows_short_page(make_collector):
+    mock = MockArxiv(1500, holdback=1200)
+    collector = make_collector(mock)
+    collector.initial_collection(CATEGORIES, start_year=2024)
+    
+    # Première page tronquée à 300 entrées: la suivante part de 300, rien
+    # n'est sauté et le watermark ne dépasse pas d'article manquant
+    mock.release()
+    mock.short_pages = {0: 300}
+    collector.update_collection(CATEGORIES)
+    assert count_articles(collector) == 1500
+
+
+def test_init_checkpoint_follows_short_page(make_collector):
+    mock = MockArxiv(1000, short_pages={0: 300})
+    collector = make_collector(mock)
+    collector.initial_collection(CATEGORIES, start_year=2024)
+    next_start, done, _, _ = window_checkpoint(collector, 2024)
+    assert done == 1
+    assert count_articles(collector) == next_start
+    # Les fenêtres sans résultat (2025...) sont terminées aussi
+    assert all(done for _, done, _, _ in collector.get_checkpoints().values())
+
+
+def test_update_failed_on_empty_page_keeps_watermark(make_collector):
+    mock = MockArxiv(1000, holdback=700)
+    collector = make_collector(mock)
+    collector.initial_collection(CATEGORIES, start_year=2024)
+    before = collector.get_watermarks(CATEGORIES)
+    
+    # Deuxième page toujours vide: la tâche échoue après la première page,
+    # les watermarks restent avant les articles non reçus
+    mock.release()
+    mock.empty_pages = {500: EMPTY_PAGE_RETRIES + 1}
+    collector.update_collection(CATEGORIES)
+    assert count_articles(collector) < 1000
+    assert collector.get_watermarks(CATEGORIES) == before
+    
+    # La mise à jour suivante reprend au même point et récupère le reste
+    collector.update_collection(CATEGORIES)
+    assert count_articles(collector) == 1000
+
+
+def test_init_failed_on_empty_page_keeps_checkpoint(make_collector):
+    mock = MockArxiv(1000, empty_pages={500: EMPTY_PAGE_RETRIES + 1})
+    collector = make_collector(mock)
+    
+    # Dernière page de la fenêtre toujours vide: le point de reprise reste
+    # au début de cette page et la fenêtre n'est pas marquée terminée
+    collector.initial_collection(CATEGORIES, start_year=2024)
+    next_start, done, _, _ = window_checkpoint(collector, 2024)
+    assert (next_start, done) == (500, 0)
+    
+    # Un nouvel `init` reprend cette page
+    collector.initial_collection(CATEGORIES, start_year=2024)
+    next_start, done, _, _ = window_checkpoint(collector, 2024)
+    assert done == 1
+    assert count_articles(collector) == next_start
+
+
+def test_update_retries_broken_page(make_collector):
+    mock = MockArxiv(1000, holdback=700)
+    collector = make_collector(mock)
+    collector.initial_collection(CATEGORIES, start_year=2024)
+    before = count_articles(collector)
+    
+    # Deuxième page coupée en cours de corps: redemandée depuis son début
+    mock.release()
+    mock.broken_pages = {500: PAGE_READ_RETRIES}
+    collector.update_collection(CATEGORIES)
+    assert before < 500 and count_articles(collector) == 1000
+
+
+def test_update_failed_on_broken_page_keeps_watermark(make_collector):
+    mock = MockArxiv(1000, holdback=700)
+    collector = make_collector(mock)
+    collector.initial_collection(CATEGORIES, start_year=2024)
+    before = collector.get_watermarks(CATEGORIES)
+    
+    mock.release()
+    mock.broken_pages = {500: PAGE_READ_RETRIES + 1}
+    collector.update_collection(CATEGORIES)
+    assert collector.get_watermarks(CATEGORIES) == before
+    collector.update_collection(CATEGORIES)
+    assert count_articles(collector) == 1000
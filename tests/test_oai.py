@@ -0,0 +1,91 @@
+"""Moissonnage OAI-PMH (harvest_collection) contre le serveur local"""
+
+from datetime import datetime
+
+from arxiv_collector import DEFAULT_CATEGORIES
+from mock_server import MockArxiv
+
+CATEGORIES = list(DEFAULT_CATEGORIES)
+START = datetime(2024, 1, 1)
+END = datetime(2030, 1, 1)
+
+
+def stored_ids(collector):
+    return {arxiv_id for arxiv_id, in collector.db.conn.execute("SELECT arxiv_id FROM articles")}
+
+
+def expected_ids(mock, categories):
+    return {paper['id'] for paper in mock.papers if set(paper['categories']) & set(categories)}
+
+
+def checkpoints(collector):
+    """{tâche: (enregistrements lus, terminé, jeton)} des moissonnages OAI"""
+    return {task: (next_start, done, token)
+            for (task, _), (next_start, done, _, token) in collector.get_checkpoints().items()
+            if task.startswith('oai:')}
+
+
+def test_harvest_follows_resumption_tokens(make_collector):
+    mock = MockArxiv(1200, oai_batch_size=150)
+    collector = make_collector(mock)
+    
+    saved = collector.harvest_collection(CATEGORIES, START, END)
+    assert stored_ids(collector) == expected_ids(mock, CATEGORIES)
+    assert saved == len(expected_ids(mock, CATEGORIES))
+    # Plusieurs réponses par set: les jetons ont été suivis jusqu'au bout
+    assert mock.requests > 2 * 2
+    assert all(done and token is None for _, done, token in checkpoints(collector).values())
+
+
+def test_harvest_empty_set(make_collector):
+    mock = MockArxiv(200)
+    collector = make_collector(mock)
+    
+    # Aucun article dans le set q-bio: noRecordsMatch n'est pas une erreur
+    assert collector.harvest_collection(['q-bio.GN'], START, END) == 0
+    assert not stored_ids(collector)
+    assert [done for _, done, _ in checkpoints(collector).values()] == [1]
+
+
+def test_harvest_resumes_after_token_failure(make_collector):
+    mock = MockArxiv(1200, oai_batch_size=150)
+    collector = make_collector(mock)
+    collector.client.max_retries = 1
+    
+    # Requêtes avec jeton en échec: le moissonnage s'arrête après le premier
+    # lot de chaque set, le jeton suivant reste dans le point de reprise
+    mock.token_failures = 2 * 2
+    collector.harvest_collection(CATEGORIES, START, END)
+    interrupted = checkpoints(collector)
+    assert all(not done and token for _, done, token in interrupted.values())
+    partial = stored_ids(collector)
+    assert 0 < len(partial) < len(expected_ids(mock, CATEGORIES))
+    
+    # Reprise au jeton enregistré: seuls les lots suivants sont demandés
+    # (un moissonnage complet demande en plus le premier lot de chaque set)
+    full = MockArxiv(1200, oai_batch_size=150)
+    make_collector(full, "arxiv_full.db").harvest_collection(CATEGORIES, START, END)
+    requests = mock.requests
+    collector.harvest_collection(CATEGORIES, START, END)
+    assert stored_ids(collector) == expected_ids(mock, CATEGORIES)
+    assert mock.requests - requests == full.requests - len(interrupted)
+
+
+def test_harvest_restarts_set_after_expired_token(make_collector):
+    mock = MockArxiv(600, oai_batch_size=150)
+    collector = make_collector(mock)
+    collector.client.max_retries = 0
+    mock.token_failures = 1
+    collector.harvest_collection(CATEGORIES, START, END)
+    interrupted = [task for task, (_, done, token) in checkpoints(collector).items()
+                   if not done and token]
+    assert interrupted
+    
+    # Jeton expiré à la reprise: le set repart du début au `init` suivant
+    mock.tokens_expired = True
+    collector.harvest_collection(CATEGORIES, START, END)
+    restarted = checkpoints(collector)
+    assert all(restarted[task] == (0, 0, None) for task in interrupted)
+    mock.tokens_expired = False
+    collector.harvest_collection(CATEGORIES, START, END)
+    assert stored_ids(collector) == expected_ids(mock, CATEGORIES)